@@ -17,10 +17,14 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import template
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
+    DATA_SETUP_IGNORE_AFTER_DEPENDENCIES,
     DATA_SETUP_STARTED,
+    async_get_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -41,13 +45,15 @@ DATA_LOGGING = "logging"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 
-STAGE_1_TIMEOUT = 120
-STAGE_2_TIMEOUT = 300
+SETUP_TIMEOUT = 420
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+SETUP_TIMELINE_STORAGE_KEY = "core.setup_timeline"
+SETUP_TIMELINE_STORAGE_VERSION = 1
+
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
 LOGGING_INTEGRATIONS = {
@@ -59,6 +65,7 @@ LOGGING_INTEGRATIONS = {
     # To record data
     "recorder",
 }
+# Integrations set up without waiting on their after dependencies
 STAGE_1_INTEGRATIONS = {
     # To make sure we forward data to other instances
     "mqtt_eventstream",
@@ -106,6 +113,7 @@ async def async_setup_hass(
 
     if not safe_mode:
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+        await conf_util.async_load_yaml_parse_cache(hass)
 
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
@@ -115,6 +123,7 @@ async def async_setup_hass(
                 err,
             )
         else:
+            await conf_util.async_save_yaml_parse_cache(hass)
             if not is_virtual_env():
                 await async_mount_local_lib_path(runtime_config.config_dir)
 
@@ -197,10 +206,15 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    # Start the setup timeline before anything gets set up
+    async_get_setup_timeline(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await hass.config_entries.async_initialize()
 
+    # Load compiled templates before integrations validate their config
+    await template.async_load_bytecode_cache(hass)
+
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
@@ -423,13 +437,136 @@ async def async_setup_multi_components(
         )
 
 
+def _get_setup_graph(
+    domains: Set[str],
+    integration_cache: Dict[str, loader.Integration],
+    ignore_after_dependencies: Set[str],
+) -> Dict[str, Set[str]]:
+    """Return the domains each domain has to wait on before it is set up."""
+    graph: Dict[str, Set[str]] = {}
+
+    for domain in domains:
+        integration = integration_cache.get(domain)
+
+        if integration is None:
+            graph[domain] = set()
+            continue
+
+        wait_on = set(integration.all_dependencies)
+        if domain not in ignore_after_dependencies:
+            wait_on.update(integration.after_dependencies)
+
+        wait_on.discard(domain)
+        graph[domain] = wait_on & domains
+
+    return graph
+
+
+async def async_setup_graph(
+    hass: core.HomeAssistant,
+    graph: Dict[str, Set[str]],
+    config: Dict[str, Any],
+    setup_started: Dict[str, datetime],
+    priority: Set[str],
+) -> None:
+    """Set up domains as soon as the domains they wait on are set up.
+
+    Domains that become ready at the same time are started with the priority
+    domains first, then in alphabetical order. Domains that have not been
+    started when this is cancelled are left in the graph.
+    """
+    timeline = async_get_setup_timeline(hass)
+    for domain, wait_on in graph.items():
+        timeline.add_waited_on(domain, wait_on)
+
+    running: Dict["asyncio.Future[bool]", str] = {}
+    started: Dict[str, float] = {}
+    busy = 0.0
+    max_running = 0
+    start = monotonic()
+
+    log_task = asyncio.create_task(
+        _async_log_pending_setups(hass, set(graph), setup_started)
+    )
+
+    try:
+        while graph or running:
+            ready = sorted(
+                (domain for domain, wait_on in graph.items() if not wait_on),
+                key=lambda domain: (domain not in priority, domain),
+            )
+
+            if not ready and not running:
+                # The remaining domains wait on each other. Set them up
+                # without waiting on their after dependencies to break the
+                # cycle.
+                ready = sorted(graph)
+                hass.data.setdefault(
+                    DATA_SETUP_IGNORE_AFTER_DEPENDENCIES, set()
+                ).update(ready)
+                _LOGGER.warning(
+                    "Circular after dependencies between %s", ", ".join(ready)
+                )
+
+            for domain in ready:
+                del graph[domain]
+                started[domain] = monotonic()
+                task = hass.async_create_task(
+                    async_setup_component(hass, domain, config)
+                )
+                running[task] = domain
+
+            max_running = max(max_running, len(running))
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                domain = running.pop(future)
+                busy += monotonic() - started[domain]
+
+                exception = future.exception()
+                if exception is not None:
+                    _LOGGER.error(
+                        "Error setting up integration %s - received exception",
+                        domain,
+                        exc_info=(type(exception), exception, exception.__traceback__),
+                    )
+
+                for wait_on in graph.values():
+                    wait_on.discard(domain)
+    finally:
+        log_task.cancel()
+
+    elapsed = monotonic() - start
+    parallelism = {
+        "integrations": len(started),
+        "duration": round(elapsed, 4),
+        "max_concurrent": max_running,
+        "average_concurrent": round(busy / elapsed, 2) if elapsed else 0,
+    }
+    timeline.parallelism = parallelism
+    _LOGGER.info(
+        "Set up %s integrations in %.2fs, at most %s and on average %s at once",
+        parallelism["integrations"],
+        elapsed,
+        max_running,
+        parallelism["average_concurrent"],
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: Dict[str, Any]
 ) -> None:
     """Set up all the integrations."""
     setup_started = hass.data[DATA_SETUP_STARTED] = {}
+    timeline = async_get_setup_timeline(hass)
     domains_to_setup = _get_domains(hass, config)
 
+    async def async_get_integration(domain: str) -> loader.Integration:
+        """Resolve an integration and record how long it took."""
+        with timeline.track(domain, "resolve"):
+            return await loader.async_get_integration(hass, domain)
+
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start rightaway
     integration_cache: Dict[str, loader.Integration] = {}
@@ -442,10 +579,7 @@ async def _async_set_up_integrations(
             int_or_exc
             for int_or_exc in await gather_with_concurrency(
                 loader.MAX_LOAD_CONCURRENTLY,
-                *(
-                    loader.async_get_integration(hass, domain)
-                    for domain in old_to_resolve
-                ),
+                *(async_get_integration(domain) for domain in old_to_resolve),
                 return_exceptions=True,
             )
             if isinstance(int_or_exc, loader.Integration)
@@ -485,7 +619,7 @@ async def _async_set_up_integrations(
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
         await async_setup_multi_components(hass, debuggers, config, setup_started)
 
-    # calculate what components to setup in what stage
+    # Calculate what components to set up without waiting on after dependencies
     stage_1_domains = set()
 
     # Find all dependencies of any dependency of any stage 1 integration that
@@ -508,40 +642,33 @@ async def _async_set_up_integrations(
 
             deps_promotion.update(dep_itg.all_dependencies)
 
-    stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
-
     # Kick off loading the registries. They don't need to be awaited.
     asyncio.create_task(hass.helpers.device_registry.async_get_registry())
     asyncio.create_task(hass.helpers.entity_registry.async_get_registry())
     asyncio.create_task(hass.helpers.area_registry.async_get_registry())
 
-    # Start setup
-    if stage_1_domains:
-        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(
-                    hass, stage_1_domains, config, setup_started
-                )
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
+    remaining_domains = domains_to_setup - logging_domains - debuggers
 
-    # Enables after dependencies
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
+    # Stage 1 integrations start as soon as their dependencies are set up,
+    # after dependencies are only honored for the other integrations.
+    hass.data[DATA_SETUP_IGNORE_AFTER_DEPENDENCIES] = set(stage_1_domains)
+    async_set_domains_to_be_loaded(hass, remaining_domains - stage_1_domains)
 
-    if stage_2_domains:
-        _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+    graph = _get_setup_graph(remaining_domains, integration_cache, stage_1_domains)
+
+    if graph:
+        _LOGGER.info("Setting up: %s", remaining_domains)
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                SETUP_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(
-                    hass, stage_2_domains, config, setup_started
+                await async_setup_graph(
+                    hass, graph, config, setup_started, stage_1_domains
                 )
         except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+            _LOGGER.warning("Setup timed out - moving forward")
+            for domain in sorted(graph):
+                hass.async_create_task(async_setup_component(hass, domain, config))
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -550,3 +677,7 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    _LOGGER.debug("Setup critical path: %s", timeline.critical_path())
+    store = Store(hass, SETUP_TIMELINE_STORAGE_VERSION, SETUP_TIMELINE_STORAGE_KEY)
+    await store.async_save(timeline.as_dict())
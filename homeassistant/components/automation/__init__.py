@@ -1,11 +1,13 @@
 """Allow to set up simple automation rules via the config file."""
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union, cast
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
-from homeassistant.components import blueprint
+from homeassistant.components import blueprint, websocket_api
+from homeassistant.components.homeassistant.triggers import state as state_trigger
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -36,6 +38,7 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import async_get_reference_index
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -103,13 +106,7 @@ def automations_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return async_get_reference_index(hass, DOMAIN).with_entity(entity_id)
 
 
 @callback
@@ -134,13 +131,7 @@ def automations_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return async_get_reference_index(hass, DOMAIN).with_device(device_id)
 
 
 @callback
@@ -159,6 +150,24 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
     return list(automation_entity.referenced_devices)
 
 
+@callback
+def condition_stats_in_automation(
+    hass: HomeAssistant, entity_id: str
+) -> List[Dict[str, Any]]:
+    """Return how often the conditions of an automation are evaluated and pass."""
+    if DOMAIN not in hass.data:
+        return []
+
+    component = hass.data[DOMAIN]
+
+    automation_entity = component.get_entity(entity_id)
+
+    if automation_entity is None:
+        return []
+
+    return [stats.as_dict() for stats in automation_entity.condition_stats]
+
+
 async def async_setup(hass, config):
     """Set up the automation."""
     hass.data[DOMAIN] = component = EntityComponent(LOGGER, DOMAIN, hass)
@@ -193,9 +202,12 @@ async def async_setup(hass, config):
         "async_turn_off",
     )
 
+    websocket_api.async_register_command(hass, websocket_trace)
+    websocket_api.async_register_command(hass, websocket_stats)
+
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Replace the automations that changed with the ones from config."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
@@ -236,6 +248,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._referenced_devices: Optional[Set[str]] = None
         self._logger = LOGGER
         self._variables: ScriptVariables = variables
+        self.raw_config: Optional[Dict[str, Any]] = None
 
     @property
     def name(self):
@@ -269,6 +282,20 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Return True if entity is on."""
         return self._async_detach_triggers is not None or self._is_enabled
 
+    @property
+    def trigger_stats(self) -> List[Dict[str, Any]]:
+        """Return how often the state triggers are evaluated and match."""
+        if self.hass is None or self._async_detach_triggers is None:
+            return []
+        return state_trigger.async_get_dispatcher(self.hass).async_stats(self._name)
+
+    @property
+    def condition_stats(self) -> List[condition.ConditionStats]:
+        """Return the evaluation statistics of the conditions."""
+        if self._cond_func is None:
+            return []
+        return self._cond_func.stats
+
     @property
     def referenced_devices(self):
         """Return a set of referenced devices."""
@@ -317,6 +344,10 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         )
         self.action_script.update_logger(self._logger)
 
+        async_get_reference_index(cast(HomeAssistant, self.hass), DOMAIN).async_add(
+            self.entity_id, self.referenced_entities, self.referenced_devices
+        )
+
         state = await self.async_get_last_state()
         if state:
             enable_automation = state.state == STATE_ON
@@ -375,12 +406,12 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         else:
             variables = run_variables
 
-        if (
-            not skip_condition
-            and self._cond_func is not None
-            and not self._cond_func(variables)
-        ):
-            return
+        condition = None
+        if not skip_condition and self._cond_func is not None:
+            condition = bool(self._cond_func(variables))
+            if not condition:
+                self.action_script.async_add_trace(variables, context).condition = False
+                return
 
         # Create a new context referring to the old context.
         parent_id = None if context is None else context.id
@@ -402,7 +433,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
 
         try:
             await self.action_script.async_run(
-                variables, trigger_context, started_action
+                variables, trigger_context, started_action, condition
             )
         except Exception:  # pylint: disable=broad-except
             self._logger.exception("While executing automation %s", self.entity_id)
@@ -410,6 +441,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
@@ -491,11 +523,20 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations that are already running with the same name and config are
+    kept, the others are removed.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
 
+    existing: Dict[Optional[str], List[AutomationEntity]] = {}
+    for existing_entity in component.entities:
+        existing.setdefault(
+            cast(AutomationEntity, existing_entity).unique_id, []
+        ).append(cast(AutomationEntity, existing_entity))
+
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: List[Union[Dict[str, Any], blueprint.BlueprintInputs]] = config[  # type: ignore
             config_key
@@ -527,6 +568,22 @@ async def _async_process_config(
 
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
+            # Templates of running automations have hass attached, which is
+            # part of comparing them.
+            _attach_hass(hass, config_block)
+            unchanged = next(
+                (
+                    existing_entity
+                    for existing_entity in existing.get(automation_id, [])
+                    if existing_entity.name == name
+                    and existing_entity.raw_config == config_block
+                ),
+                None,
+            )
+            if unchanged is not None:
+                existing[automation_id].remove(unchanged)
+                continue
+
             action_script = Script(
                 hass,
                 config_block[CONF_ACTION],
@@ -559,36 +616,120 @@ async def _async_process_config(
                 initial_state,
                 config_block.get(CONF_VARIABLES),
             )
+            entity.raw_config = config_block
 
             entities.append(entity)
 
+    removed = [
+        existing_entity.entity_id
+        for existing_entities in existing.values()
+        for existing_entity in existing_entities
+    ]
+    if removed:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity_id) for entity_id in removed)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
     return blueprints_used
 
 
+def _attach_hass(hass: HomeAssistant, value: Any) -> None:
+    """Attach hass to all templates in a config, including script variables."""
+    if isinstance(value, ScriptVariables):
+        template.attach(hass, value.variables)
+    elif isinstance(value, list):
+        for item in value:
+            _attach_hass(hass, item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _attach_hass(hass, item)
+    else:
+        template.attach(hass, value)
+
+
 async def _async_process_if(hass, config, p_config):
     """Process if checks."""
     if_configs = p_config[CONF_CONDITION]
 
     checks = []
-    for if_config in if_configs:
+    stats = []
+    for index, if_config in sorted(
+        enumerate(if_configs), key=lambda item: condition.condition_cost(item[1])
+    ):
         try:
-            checks.append(await condition.async_from_config(hass, if_config, False))
+            check = await condition.async_from_config(hass, if_config, False)
         except HomeAssistantError as ex:
             LOGGER.warning("Invalid condition: %s", ex)
             return None
+        stats.append(
+            condition.ConditionStats(
+                if_config[CONF_CONDITION]
+                if isinstance(if_config, dict)
+                else "template",
+                index,
+            )
+        )
+        checks.append(condition.async_track_stats(check, stats[-1]))
+    # Checks run cheapest first, the statistics follow the config
+    stats.sort(key=lambda condition_stats: condition_stats.index)
 
     def if_action(variables=None):
         """AND all conditions."""
         return all(check(hass, variables) for check in checks)
 
     if_action.config = if_configs
+    if_action.stats = stats
 
     return if_action
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "automation/trace", vol.Required("entity_id"): cv.entity_id}
+)
+@callback
+def websocket_trace(hass, connection, msg):
+    """Return the traces of the recent runs of an automation."""
+    automation_entity = hass.data[DOMAIN].get_entity(msg["entity_id"])
+
+    if automation_entity is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Automation not found"
+        )
+        return
+
+    connection.send_result(
+        msg["id"], [trace.as_dict() for trace in automation_entity.action_script.traces]
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "automation/stats", vol.Required("entity_id"): cv.entity_id}
+)
+@callback
+def websocket_stats(hass, connection, msg):
+    """Return the evaluation statistics of an automation."""
+    automation_entity = hass.data[DOMAIN].get_entity(msg["entity_id"])
+
+    if automation_entity is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Automation not found"
+        )
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            "triggers": automation_entity.trigger_stats,
+            "conditions": condition_stats_in_automation(hass, msg["entity_id"]),
+        },
+    )
+
+
 @callback
 def _trigger_extract_device(trigger_conf: dict) -> Optional[str]:
     """Extract devices from a trigger config."""
@@ -1,11 +1,13 @@
 """Allows the creation of a sensor that filters state property."""
+from bisect import bisect_left, insort
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
 from functools import partial
+from itertools import islice
 import logging
+import math
 from numbers import Number
-import statistics
 from typing import Optional
 
 import voluptuous as vol
@@ -520,15 +522,27 @@ class OutlierFilter(Filter):
         self._radius = radius
         self._stats_internal = Counter()
         self._store_raw = True
+        # The raw window values in order, kept in step with self.states
+        self._sorted = []
+
+    def _median(self):
+        """Return the median of the window."""
+        middle = len(self._sorted) // 2
+        if len(self._sorted) % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
 
     def _filter_state(self, new_state):
         """Implement the outlier filter."""
 
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
-        if (
-            len(self.states) == self.states.maxlen
-            and abs(new_state.state - median) > self._radius
-        ):
+        median = self._median() if self._sorted else 0
+        window_full = len(self.states) == self.states.maxlen
+        if window_full and self.states:
+            del self._sorted[bisect_left(self._sorted, self.states[0].state)]
+        if self.states.maxlen:
+            insort(self._sorted, new_state.state)
+
+        if window_full and abs(new_state.state - median) > self._radius:
 
             self._stats_internal["erasures"] += 1
 
@@ -584,12 +598,32 @@ class TimeSMAFilter(Filter):
         self._time_window = window_size
         self.last_leak = None
         self.queue = deque()
+        # Time weighted sum of the values between the first and last state,
+        # recomputed once as many states have leaked as the queue holds so
+        # the subtractions do not accumulate rounding errors
+        self._queue_sum = 0.0
+        self._leaked_since_resum = 0
+
+    def _resum(self):
+        """Recompute the time weighted sum of the queue."""
+        self._leaked_since_resum = 0
+        self._queue_sum = math.fsum(
+            (later.timestamp - earlier.timestamp).total_seconds() * earlier.state
+            for earlier, later in zip(self.queue, islice(self.queue, 1, None))
+        )
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
         while self.queue:
             if self.queue[0].timestamp + self._time_window <= left_boundary:
                 self.last_leak = self.queue.popleft()
+                self._leaked_since_resum += 1
+                if self._leaked_since_resum >= len(self.queue):
+                    self._resum()
+                else:
+                    self._queue_sum -= (
+                        self.queue[0].timestamp - self.last_leak.timestamp
+                    ).total_seconds() * self.last_leak.state
             else:
                 return
 
@@ -597,15 +631,20 @@ class TimeSMAFilter(Filter):
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
+        if self.queue:
+            self._queue_sum += (
+                new_state.timestamp - self.queue[-1].timestamp
+            ).total_seconds() * self.queue[-1].state
+        else:
+            self._resum()
         self.queue.append(copy(new_state))
 
-        moving_sum = 0
         start = new_state.timestamp - self._time_window
         prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        moving_sum = (
+            self.queue[0].timestamp - start
+        ).total_seconds() * prev_state.state
+        moving_sum += self._queue_sum
 
         new_state.state = moving_sum / self._time_window.total_seconds()
 
@@ -1,5 +1,7 @@
 """Offer numeric state listening automation rules."""
+from functools import partial
 import logging
+from typing import Any, Dict, Optional, Tuple
 
 import voluptuous as vol
 
@@ -13,12 +15,11 @@ from homeassistant.const import (
     CONF_PLATFORM,
     CONF_VALUE_TEMPLATE,
 )
-from homeassistant.core import CALLBACK_TYPE, HassJob, callback
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, State, callback
 from homeassistant.helpers import condition, config_validation as cv, template
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_same_state
+
+from .state import TriggerMatcher, async_get_dispatcher
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -59,6 +60,77 @@ TRIGGER_SCHEMA = vol.All(
 _LOGGER = logging.getLogger(__name__)
 
 
+def _variables(entity_id, below, above, attribute):
+    """Return a dict with trigger variables."""
+    return {
+        "trigger": {
+            "platform": "numeric_state",
+            "entity_id": entity_id,
+            "below": below,
+            "above": above,
+            "attribute": attribute,
+        }
+    }
+
+
+class NumericStateMatcher(TriggerMatcher):
+    """Match the states of an entity against numeric thresholds.
+
+    Listeners are called for every state change with whether the new state
+    is in range, each trigger keeps track of when it last fired itself.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        below: Optional[float],
+        above: Optional[float],
+        value_template: Optional[template.Template],
+        attribute: Optional[str],
+    ):
+        """Initialize the matcher."""
+        super().__init__()
+        self.hass = hass
+        self.below = below
+        self.above = above
+        self.value_template = value_template
+        self.attribute = attribute
+        self._variables = _variables(entity_id, below, above, attribute)
+
+    @callback
+    def async_match(
+        self, from_s: Optional[State], to_s: Optional[State]
+    ) -> Tuple[bool]:
+        """Return if the new state is in range."""
+        self.evaluations += 1
+        matching = to_s is not None and condition.async_numeric_state(
+            self.hass,
+            to_s,
+            self.below,
+            self.above,
+            self.value_template,
+            self._variables,
+            self.attribute,
+        )
+        if matching:
+            self.matches += 1
+        return (matching,)
+
+    @callback
+    def async_criteria(self) -> Dict[str, Any]:
+        """Return the criteria of the matcher."""
+        return {
+            "platform": "numeric_state",
+            "attribute": self.attribute,
+            "below": self.below,
+            "above": self.above,
+            "value_template": self.value_template.template
+            if self.value_template is not None
+            else None,
+        }
+
+
 async def async_attach_trigger(
     hass, config, action, automation_info, *, platform_type="numeric_state"
 ) -> CALLBACK_TYPE:
@@ -80,15 +152,7 @@ async def async_attach_trigger(
 
     def variables(entity_id):
         """Return a dict with trigger variables."""
-        return {
-            "trigger": {
-                "platform": "numeric_state",
-                "entity_id": entity_id,
-                "below": below,
-                "above": above,
-                "attribute": attribute,
-            }
-        }
+        return _variables(entity_id, below, above, attribute)
 
     @callback
     def check_numeric_state(entity_id, from_s, to_s):
@@ -101,7 +165,7 @@ async def async_attach_trigger(
         )
 
     @callback
-    def state_automation_listener(event):
+    def state_automation_listener(event, matching):
         """Listen for state changes and calls action."""
         entity_id = event.data.get("entity_id")
         from_s = event.data.get("old_state")
@@ -127,8 +191,6 @@ async def async_attach_trigger(
                 to_s.context,
             )
 
-        matching = check_numeric_state(entity_id, from_s, to_s)
-
         if not matching:
             entities_triggered.discard(entity_id)
         elif entity_id not in entities_triggered:
@@ -142,7 +204,7 @@ async def async_attach_trigger(
                 except (exceptions.TemplateError, vol.Invalid) as ex:
                     _LOGGER.error(
                         "Error rendering '%s' for template: %s",
-                        automation_info["name"],
+                        automation_info.get("name"),
                         ex,
                     )
                     entities_triggered.discard(entity_id)
@@ -158,12 +220,41 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Triggers of wait_for_trigger are not validated by the platform schema
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    key = (
+        "numeric_state",
+        below,
+        above,
+        attribute,
+        value_template.template if value_template is not None else None,
+    )
+    dispatcher = async_get_dispatcher(hass)
+    unsubs = [
+        dispatcher.async_add(
+            entity_id.lower(),
+            key,
+            partial(
+                NumericStateMatcher,
+                hass,
+                entity_id.lower(),
+                below,
+                above,
+                value_template,
+                attribute,
+            ),
+            automation_info.get("name"),
+            state_automation_listener,
+        )
+        for entity_id in entity_ids
+    ]
 
     @callback
     def async_remove():
         """Remove state listeners async."""
-        unsub()
+        for unsub in unsubs:
+            unsub()
         for async_remove in unsub_track_same.values():
             async_remove()
         unsub_track_same.clear()
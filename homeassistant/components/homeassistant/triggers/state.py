@@ -1,7 +1,8 @@
 """Offer state listening automation rules."""
 from datetime import timedelta
+from functools import partial
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import voluptuous as vol
 
@@ -25,6 +26,8 @@ CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
 
+DATA_STATE_TRIGGER_DISPATCHER = "state_trigger_dispatcher"
+
 BASE_SCHEMA = {
     vol.Required(CONF_PLATFORM): "state",
     vol.Required(CONF_ENTITY_ID): cv.entity_ids,
@@ -63,6 +66,215 @@ def TRIGGER_SCHEMA(value: Any) -> dict:  # pylint: disable=invalid-name
     return TRIGGER_STATE_SCHEMA(value)
 
 
+class TriggerMatcher:
+    """Match the state changes of an entity against trigger criteria.
+
+    Triggers sharing the criteria share the matcher, so the criteria are
+    evaluated once per state change no matter how many triggers use them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the matcher."""
+        self.listeners: List[TriggerListener] = []
+        self.evaluations = 0
+        self.matches = 0
+
+    @callback
+    def async_match(
+        self, from_s: Optional[State], to_s: Optional[State]
+    ) -> Optional[Tuple[Any, ...]]:
+        """Return the arguments for the listeners, None to not call them."""
+        raise NotImplementedError
+
+    @callback
+    def async_criteria(self) -> Dict[str, Any]:
+        """Return the criteria of the matcher."""
+        raise NotImplementedError
+
+
+class TriggerListener:
+    """A trigger listening to the state changes a matcher lets through."""
+
+    def __init__(
+        self, matcher: TriggerMatcher, name: Optional[str], action: Callable
+    ) -> None:
+        """Initialize the listener."""
+        self.name = name
+        self.action = action
+        # The matcher may be older than the trigger
+        self._evaluations = matcher.evaluations
+        self._matches = matcher.matches
+
+    @callback
+    def async_stats(self, matcher: TriggerMatcher) -> Dict[str, Any]:
+        """Return the evaluation counts since the trigger was attached."""
+        return {
+            "evaluations": matcher.evaluations - self._evaluations,
+            "matches": matcher.matches - self._matches,
+        }
+
+
+class StateMatcher(TriggerMatcher):
+    """Match the state changes of an entity against from/to criteria."""
+
+    def __init__(self, attribute: Optional[str], from_state: Any, to_state: Any):
+        """Initialize the matcher."""
+        super().__init__()
+        self.attribute = attribute
+        self.from_state = from_state
+        self.to_state = to_state
+        self.match_all = from_state == MATCH_ALL and to_state == MATCH_ALL
+        self._match_from_state = process_state_match(from_state)
+        self._match_to_state = process_state_match(to_state)
+
+    def _value(self, state: Optional[State]) -> Any:
+        """Return the matched value of a state."""
+        if state is None:
+            return None
+        if self.attribute is None:
+            return state.state
+        return state.attributes.get(self.attribute)
+
+    @callback
+    def async_match(
+        self, from_s: Optional[State], to_s: Optional[State]
+    ) -> Optional[Tuple[Any, Any]]:
+        """Return the old and new value if the state change matches."""
+        self.evaluations += 1
+        old_value = self._value(from_s)
+        new_value = self._value(to_s)
+
+        # When we listen for state changes with `match_all`, we
+        # will trigger even if just an attribute changes. When
+        # we listen to just an attribute, we should ignore all
+        # other attribute changes.
+        if self.attribute is not None and old_value == new_value:
+            return None
+
+        if (
+            not self._match_from_state(old_value)
+            or not self._match_to_state(new_value)
+            or (not self.match_all and old_value == new_value)
+        ):
+            return None
+
+        self.matches += 1
+        return old_value, new_value
+
+    @callback
+    def async_criteria(self) -> Dict[str, Any]:
+        """Return the criteria of the matcher."""
+        return {
+            "platform": "state",
+            "attribute": self.attribute,
+            "from": self.from_state,
+            "to": self.to_state,
+        }
+
+
+class StateTriggerDispatcher:
+    """Evaluate state change triggers grouped by entity and match criteria.
+
+    Triggers watching the same entity with the same criteria share a
+    matcher, so each distinct criterion is evaluated once per state change.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._matchers: Dict[str, Dict[Tuple[Any, ...], TriggerMatcher]] = {}
+        self._unsubs: Dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_id: str,
+        key: Tuple[Any, ...],
+        create_matcher: Callable[[], TriggerMatcher],
+        name: Optional[str],
+        action: Callable[..., None],
+    ) -> CALLBACK_TYPE:
+        """Call action when the matcher of key lets a state change through.
+
+        The matcher is created by create_matcher if no trigger of the entity
+        uses key yet.
+        """
+        matchers = self._matchers.get(entity_id)
+        if matchers is None:
+            matchers = self._matchers[entity_id] = {}
+            self._unsubs[entity_id] = async_track_state_change_event(
+                self.hass, entity_id, self._async_state_changed
+            )
+        matcher = matchers.get(key)
+        if matcher is None:
+            matcher = matchers[key] = create_matcher()
+        listener = TriggerListener(matcher, name, action)
+        matcher.listeners.append(listener)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            matcher.listeners.remove(listener)
+            if matcher.listeners:
+                return
+            del matchers[key]
+            if matchers:
+                return
+            del self._matchers[entity_id]
+            self._unsubs.pop(entity_id)()
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Evaluate the matchers of the entity that changed."""
+        matchers = self._matchers.get(event.data["entity_id"])
+        if not matchers:
+            return
+        from_s = event.data.get("old_state")
+        to_s = event.data.get("new_state")
+        for matcher in list(matchers.values()):
+            values = matcher.async_match(from_s, to_s)
+            if values is None:
+                continue
+            for listener in matcher.listeners[:]:
+                try:
+                    listener.action(event, *values)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while evaluating state trigger of %s", listener.name
+                    )
+
+    @callback
+    def async_stats(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the evaluation counts of the triggers, optionally by name."""
+        return [
+            {
+                "name": listener.name,
+                "entity_id": entity_id,
+                **matcher.async_criteria(),
+                **listener.async_stats(matcher),
+            }
+            for entity_id, matchers in self._matchers.items()
+            for matcher in matchers.values()
+            for listener in matcher.listeners
+            if name is None or listener.name == name
+        ]
+
+
+@callback
+def async_get_dispatcher(hass: HomeAssistant) -> StateTriggerDispatcher:
+    """Return the state trigger dispatcher."""
+    dispatcher: Optional[StateTriggerDispatcher] = hass.data.get(
+        DATA_STATE_TRIGGER_DISPATCHER
+    )
+    if dispatcher is None:
+        dispatcher = hass.data[DATA_STATE_TRIGGER_DISPATCHER] = StateTriggerDispatcher(
+            hass
+        )
+    return dispatcher
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config,
@@ -77,49 +289,18 @@ async def async_attach_trigger(
     to_state = config.get(CONF_TO, MATCH_ALL)
     time_delta = config.get(CONF_FOR)
     template.attach(hass, time_delta)
-    match_all = from_state == MATCH_ALL and to_state == MATCH_ALL
     unsub_track_same = {}
     period: Dict[str, timedelta] = {}
-    match_from_state = process_state_match(from_state)
-    match_to_state = process_state_match(to_state)
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action)
 
     @callback
-    def state_automation_listener(event: Event):
-        """Listen for state changes and calls action."""
+    def state_automation_listener(event: Event, old_value: Any, new_value: Any):
+        """Call action for a state change that matched the trigger."""
         entity: str = event.data["entity_id"]
         from_s: Optional[State] = event.data.get("old_state")
         to_s: Optional[State] = event.data.get("new_state")
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action():
             """Call action with right context."""
@@ -158,7 +339,9 @@ async def async_attach_trigger(
             )
         except (exceptions.TemplateError, vol.Invalid) as ex:
             _LOGGER.error(
-                "Error rendering '%s' for template: %s", automation_info["name"], ex
+                "Error rendering '%s' for template: %s",
+                automation_info.get("name"),
+                ex,
             )
             return
 
@@ -184,12 +367,28 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_id, state_automation_listener)
+    # Triggers of wait_for_trigger are not validated by the platform schema
+    if isinstance(entity_id, str):
+        entity_id = [entity_id]
+    # The criteria are not always hashable, their repr is.
+    key = ("state", attribute, repr(from_state), repr(to_state))
+    dispatcher = async_get_dispatcher(hass)
+    unsubs = [
+        dispatcher.async_add(
+            entity.lower(),
+            key,
+            partial(StateMatcher, attribute, from_state, to_state),
+            automation_info.get("name"),
+            state_automation_listener,
+        )
+        for entity in entity_id
+    ]
 
     @callback
     def async_remove():
         """Remove state listeners async."""
-        unsub()
+        for unsub in unsubs:
+            unsub()
         for async_remove in unsub_track_same.values():
             async_remove()
         unsub_track_same.clear()
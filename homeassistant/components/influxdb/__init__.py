@@ -1,7 +1,10 @@
 """Support for sending data to an Influx database."""
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import json as json_util
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -34,6 +37,7 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.json import JSONEncoder
 
 from .const import (
     API_VERSION_2,
@@ -85,14 +89,19 @@ from .const import (
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_MAX_SIZE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
+    WRITE_WORKERS,
     WROTE_MESSAGE,
 )
 
@@ -335,6 +344,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[CONF_URL] = conf[CONF_URL]
         kwargs[CONF_TOKEN] = conf[CONF_TOKEN]
         kwargs[INFLUX_CONF_ORG] = conf[CONF_ORG]
+        kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
@@ -487,8 +497,89 @@ def setup(hass, config):
     return True
 
 
+class InfluxSpool:
+    """Batches kept on disk while InfluxDB cannot be reached.
+
+    Each batch is a line of JSON so a write cut short by a crash only loses
+    the batch being written. The spool is replayed after the next successful
+    write, which may be after a restart of Home Assistant.
+    """
+
+    def __init__(self, path):
+        """Initialize the spool."""
+        self.path = path
+        self.pending = os.path.exists(path)
+        self._lock = threading.Lock()
+
+    def add(self, batch):
+        """Append a batch to the spool, return False if the spool is full."""
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                size = 0
+            if size >= SPOOL_MAX_SIZE:
+                return False
+            try:
+                with open(self.path, "a") as spool:
+                    spool.write(json_util.dumps(batch, cls=JSONEncoder) + "\n")
+            except (OSError, TypeError, ValueError) as err:
+                _LOGGER.error("Unable to spool events: %s", err)
+                return False
+            self.pending = True
+            return True
+
+    def replay(self, write):
+        """Write the spooled batches, keeping those that can not be written."""
+        with self._lock:
+            if not self.pending:
+                return
+            try:
+                with open(self.path) as spool:
+                    lines = spool.readlines()
+            except OSError as err:
+                _LOGGER.error("Unable to read spooled events: %s", err)
+                return
+
+            replayed = 0
+            for index, line in enumerate(lines):
+                try:
+                    batch = json_util.loads(line)
+                except ValueError:
+                    # The last line of a spool cut short by a crash
+                    continue
+                try:
+                    write(batch)
+                except ValueError as err:
+                    _LOGGER.error(err)
+                except ConnectionError:
+                    try:
+                        with open(self.path, "w") as spool:
+                            spool.writelines(lines[index:])
+                    except OSError as err:
+                        _LOGGER.error("Unable to rewrite spooled events: %s", err)
+                    break
+                else:
+                    replayed += len(batch)
+            else:
+                try:
+                    os.remove(self.path)
+                except OSError as err:
+                    _LOGGER.error("Unable to remove replayed events: %s", err)
+                self.pending = False
+
+            if replayed:
+                _LOGGER.info(REPLAYED_MESSAGE, replayed)
+
+
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
+
+    The thread collects events into batches which are handed to a small pool
+    of writers. When all writers are busy, no further batches are taken from
+    the queue. Batches that can not be written and events that waited too long
+    in the queue are spooled to disk.
+    """
 
     def __init__(self, hass, influx, event_to_json, max_tries):
         """Initialize the listener."""
@@ -497,8 +588,11 @@ class InfluxThread(threading.Thread):
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool = InfluxSpool(hass.config.path(SPOOL_FILE))
         self.write_errors = 0
         self.shutdown = False
+        self._write_errors_lock = threading.Lock()
+        self._writers_available = threading.BoundedSemaphore(WRITE_WORKERS)
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -519,7 +613,7 @@ class InfluxThread(threading.Thread):
         count = 0
         json = []
 
-        dropped = 0
+        aged = []
 
         try:
             while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
@@ -533,18 +627,22 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
+                    event_json = self.event_to_json(event)
+                    if not event_json:
+                        continue
                     if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
+                        json.append(event_json)
                     else:
-                        dropped += 1
+                        aged.append(event_json)
 
         except queue.Empty:
             pass
 
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        if aged:
+            if self.spool.add(aged):
+                _LOGGER.warning(SPOOLED_MESSAGE, len(aged))
+            else:
+                _LOGGER.warning(CATCHING_UP_MESSAGE, len(aged))
 
         return count, json
 
@@ -554,11 +652,13 @@ class InfluxThread(threading.Thread):
             try:
                 self.influx.write(json)
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+                with self._write_errors_lock:
+                    if self.write_errors:
+                        _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                        self.write_errors = 0
 
                 _LOGGER.debug(WROTE_MESSAGE, len(json))
+                self.spool.replay(self.influx.write)
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -566,20 +666,38 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool.add(json):
+                    _LOGGER.warning(SPOOLED_MESSAGE, len(json))
                 else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    with self._write_errors_lock:
+                        if not self.write_errors:
+                            _LOGGER.error(err)
+                        self.write_errors += len(json)
 
-    def run(self):
-        """Process incoming events."""
-        while not self.shutdown:
-            count, json = self.get_events_json()
+    def _write_batch(self, count, json):
+        """Write a batch in a writer and mark its events as processed."""
+        try:
             if json:
                 self.write_to_influxdb(json)
+        finally:
+            self._writers_available.release()
             for _ in range(count):
                 self.queue.task_done()
 
+    def run(self):
+        """Process incoming events."""
+        with ThreadPoolExecutor(
+            max_workers=WRITE_WORKERS, thread_name_prefix=f"{DOMAIN}_writer"
+        ) as writers:
+            while not self.shutdown:
+                # Leave events in the queue while every writer is busy
+                self._writers_available.acquire()
+                count, json = self.get_events_json()
+                if json:
+                    writers.submit(self._write_batch, count, json)
+                else:
+                    self._write_batch(count, json)
+
     def block_till_done(self):
         """Block till all events processed."""
         self.queue.join()
@@ -77,6 +77,9 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+WRITE_WORKERS = 3
+SPOOL_FILE = "influxdb.spool"
+SPOOL_MAX_SIZE = 10 * 1024 * 1024  # bytes
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -118,6 +121,8 @@ QUERY_ERROR = (
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
+SPOOLED_MESSAGE = "Spooled %d events until InfluxDB can be reached."
+REPLAYED_MESSAGE = "Replayed %d spooled events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
@@ -4,6 +4,7 @@ import string
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.utils import floatToGoString
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -34,6 +35,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.util.temperature import fahrenheit_to_celsius
 
@@ -79,8 +81,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -103,12 +103,23 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
+
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+    hass.bus.listen(
+        EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_entity_registry_updated
+    )
     return True
 
 
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    The label sets and metric children of each entity are cached, as is the
+    exposition text of every series, so a scrape only renders the series that
+    changed since the previous one. State changes, registry updates and scrapes
+    are all handled on the event loop, so the caches need no locking.
+    """
 
     def __init__(
         self,
@@ -140,7 +151,18 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
-
+        self._registry = prometheus_cli.CollectorRegistry(auto_describe=True)
+        self._label_names = {}
+        self._handlers = {}
+        self._filtered = {}
+        self._entity_labels = {}
+        self._children = {}
+        self._entity_series = {}
+        self._changed = set()
+        self._series_text = {}
+        self._family_text = {}
+
+    @hacore.callback
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
@@ -149,35 +171,61 @@ class PrometheusMetrics:
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
-        if not self._filter(state.entity_id):
+        included = self._filtered.get(entity_id)
+        if included is None:
+            included = self._filtered[entity_id] = self._filter(entity_id)
+        if not included:
             return
 
-        handler = f"_handle_{domain}"
+        domain = state.domain
+        try:
+            handler = self._handlers[domain]
+        except KeyError:
+            handler = self._handlers[domain] = getattr(self, f"_handle_{domain}", None)
 
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+        if handler is not None and state.state != STATE_UNAVAILABLE:
+            handler(state)
 
         labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        self._inc(state_change, labels)
 
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable state)",
         )
-        entity_available.labels(**labels).set(float(state.state != STATE_UNAVAILABLE))
+        self._set(entity_available, labels, float(state.state != STATE_UNAVAILABLE))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
             self.prometheus_cli.Gauge,
             "The last_updated timestamp",
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        self._set(last_updated_time_seconds, labels, state.last_updated.timestamp())
+
+    @hacore.callback
+    def handle_entity_registry_updated(self, event):
+        """Forget the series of entities removed or renamed in the registry."""
+        if event.data["action"] == "remove":
+            self._evict_entity(event.data["entity_id"])
+        elif event.data["action"] == "update" and "old_entity_id" in event.data:
+            self._evict_entity(event.data["old_entity_id"])
+
+    def _evict_entity(self, entity_id):
+        """Remove the cached labels and the series of an entity."""
+        self._filtered.pop(entity_id, None)
+        self._entity_labels.pop(entity_id, None)
+        for key in self._entity_series.pop(entity_id, ()):
+            metric = key[0]
+            _, labels = self._children.pop(key)
+            metric.remove(*(labels[name] for name in self._label_names[metric]))
+            series = self._series_text.get(metric)
+            if series is not None and series.pop(key, None) is not None:
+                self._family_text.pop(metric, None)
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
@@ -189,23 +237,120 @@ class PrometheusMetrics:
 
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                self._set(metric, self._labels(state), value)
             except (ValueError, TypeError):
                 pass
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
         try:
             return self._metrics[metric]
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
-            return self._metrics[metric]
+            prom_metric = factory(
+                full_metric_name, documentation, labels, registry=self._registry
+            )
+            self._label_names[prom_metric] = labels
+            self._metrics[metric] = prom_metric
+            return prom_metric
+
+    def _child(self, metric, labels):
+        """Return the child of a metric for a label set."""
+        key = (metric, tuple(labels.values()))
+        try:
+            return key, self._children[key][0]
+        except KeyError:
+            child = metric.labels(**labels)
+            self._children[key] = (child, labels)
+            self._entity_series.setdefault(labels["entity"], set()).add(key)
+            return key, child
+
+    def _set(self, metric, labels, value):
+        """Set the value of a series and mark it as changed."""
+        key, child = self._child(metric, labels)
+        child.set(value)
+        self._changed.add(key)
+
+    def _inc(self, metric, labels):
+        """Increment the value of a series and mark it as changed."""
+        key, child = self._child(metric, labels)
+        child.inc()
+        self._changed.add(key)
+
+    @hacore.callback
+    def render(self):
+        """Return the exposition text of all series.
+
+        Only the series changed since the previous call are rendered again, the
+        text of the others is reused.
+        """
+        changed, self._changed = self._changed, set()
+
+        for key in changed:
+            try:
+                child, labels = self._children[key]
+            except KeyError:
+                continue
+            metric = key[0]
+            self._series_text.setdefault(metric, {})[key] = self._render_series(
+                child, labels
+            )
+            self._family_text.pop(metric, None)
+
+        output = []
+        for metric, series in self._series_text.items():
+            text = self._family_text.get(metric)
+            if text is None:
+                text = self._family_text[metric] = self._render_family(metric, series)
+            output.append(text)
+        return "".join(output).encode("utf-8")
+
+    @staticmethod
+    def _render_series(child, labels):
+        """Render the samples of a series as (sample lines, created lines)."""
+        labelstr = ",".join(
+            '{}="{}"'.format(
+                name,
+                str(value)
+                .replace("\\", r"\\")
+                .replace("\n", r"\n")
+                .replace('"', r"\""),
+            )
+            for name, value in sorted(labels.items())
+        )
+        lines = []
+        created = []
+        family = child.collect()[0]
+        for sample in family.samples:
+            line = f"{sample.name}{{{labelstr}}} {floatToGoString(sample.value)}\n"
+            if sample.name == f"{family.name}_created":
+                created.append(line)
+            else:
+                lines.append(line)
+        return "".join(lines), "".join(created)
+
+    @staticmethod
+    def _render_family(metric, series):
+        """Render a metric family in the Prometheus text format."""
+        family = metric.describe()[0]
+        name = family.name
+        if family.type == "counter":
+            name = f"{name}_total"
+        documentation = family.documentation.replace("\\", r"\\").replace("\n", r"\n")
+        output = [
+            f"# HELP {name} {documentation}\n",
+            f"# TYPE {name} {family.type}\n",
+        ]
+        output.extend(lines for lines, _ in series.values())
+        created = [created for _, created in series.values() if created]
+        if created:
+            output.append(f"# TYPE {family.name}_created gauge\n")
+            output.extend(created)
+        return "".join(output)
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -231,13 +376,16 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state):
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        labels = self._entity_labels.get(state.entity_id)
+        if labels is None or labels["friendly_name"] != friendly_name:
+            labels = self._entity_labels[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        return labels
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -248,7 +396,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes[ATTR_BATTERY_LEVEL])
-                metric.labels(**self._labels(state)).set(value)
+                self._set(metric, self._labels(state), value)
             except ValueError:
                 pass
 
@@ -259,7 +407,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._set(metric, self._labels(state), value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -268,7 +416,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._set(metric, self._labels(state), value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -277,14 +425,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._set(metric, self._labels(state), value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._set(metric, self._labels(state), value)
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -297,7 +445,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            self._set(metric, self._labels(state), value)
         except ValueError:
             pass
 
@@ -306,7 +454,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._set(metric, self._labels(state), value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
@@ -318,7 +466,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(temp)
+            self._set(metric, self._labels(state), temp)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
@@ -329,7 +477,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Current Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(current_temp)
+            self._set(metric, self._labels(state), current_temp)
 
         current_action = state.attributes.get(ATTR_HVAC_ACTION)
         if current_action:
@@ -340,8 +488,10 @@ class PrometheusMetrics:
                 ["action"],
             )
             for action in CURRENT_HVAC_ACTIONS:
-                metric.labels(**dict(self._labels(state), action=action)).set(
-                    float(action == current_action)
+                self._set(
+                    metric,
+                    dict(self._labels(state), action=action),
+                    float(action == current_action),
                 )
 
     def _handle_humidifier(self, state):
@@ -352,7 +502,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            self._set(metric, self._labels(state), humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
@@ -361,7 +511,7 @@ class PrometheusMetrics:
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._set(metric, self._labels(state), value)
         except ValueError:
             pass
 
@@ -375,8 +525,10 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
-                    float(mode == current_mode)
+                self._set(
+                    metric,
+                    dict(self._labels(state), mode=mode),
+                    float(mode == current_mode),
                 )
 
     def _handle_sensor(self, state):
@@ -396,7 +548,7 @@ class PrometheusMetrics:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                self._set(_metric, self._labels(state), value)
             except ValueError:
                 pass
 
@@ -454,7 +606,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._set(metric, self._labels(state), value)
         except ValueError:
             pass
 
@@ -470,7 +622,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        self._inc(metric, self._labels(state))
 
 
 class PrometheusView(HomeAssistantView):
@@ -479,15 +631,16 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+            body=self.prometheus_cli.generate_latest() + self.metrics.render(),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
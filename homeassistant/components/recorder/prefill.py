@@ -0,0 +1,136 @@
+"""Prefill sensors with the recent numeric history of their source entities."""
+from array import array
+import asyncio
+from bisect import bisect_left
+from datetime import datetime
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .models import States, process_timestamp
+from .util import execute, session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PREFILL = "recorder_prefill"
+
+
+class NumericHistory(NamedTuple):
+    """Numeric states of an entity, oldest first.
+
+    The timestamps are the POSIX timestamps of last_updated.
+    """
+
+    timestamps: array
+    values: array
+
+
+_RequestType = Tuple[int, Optional[datetime], "asyncio.Future[NumericHistory]"]
+
+
+class NumericHistoryPrefill:
+    """Answer the history requests of sensors with as few queries as possible.
+
+    Requests made in the same event loop iteration, like those of all sensors
+    starting up when Home Assistant starts, are fetched together.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the prefill."""
+        self.hass = hass
+        self._pending: Dict[str, List[_RequestType]] = {}
+
+    @callback
+    def async_request(
+        self, entity_id: str, limit: int, start: Optional[datetime] = None
+    ) -> "asyncio.Future[NumericHistory]":
+        """Request the last limit numeric states of an entity since start."""
+        future: "asyncio.Future[NumericHistory]" = self.hass.loop.create_future()
+        if not self._pending:
+            self.hass.loop.call_soon(self._async_fetch)
+        self._pending.setdefault(entity_id.lower(), []).append((limit, start, future))
+        return future
+
+    @callback
+    def _async_fetch(self) -> None:
+        """Fetch the pending requests in the executor."""
+        pending, self._pending = self._pending, {}
+        self.hass.async_create_task(self._async_fetch_requests(pending))
+
+    async def _async_fetch_requests(self, pending: Dict[str, List[_RequestType]]):
+        """Fetch the history of the requests and resolve them."""
+        try:
+            history = await self.hass.async_add_executor_job(
+                self._fetch,
+                {
+                    entity_id: (
+                        max(limit for limit, _, _ in requests),
+                        None
+                        if any(start is None for _, start, _ in requests)
+                        else min(start for _, start, _ in requests),
+                    )
+                    for entity_id, requests in pending.items()
+                },
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for requests in pending.values():
+                for _, _, future in requests:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+
+        for entity_id, requests in pending.items():
+            timestamps, values = history[entity_id]
+            for limit, start, future in requests:
+                if future.done():
+                    continue
+                first = len(timestamps) - limit
+                if start is not None:
+                    first = max(first, bisect_left(timestamps, start.timestamp()))
+                first = max(first, 0)
+                future.set_result(NumericHistory(timestamps[first:], values[first:]))
+
+    def _fetch(
+        self, windows: Dict[str, Tuple[int, Optional[datetime]]]
+    ) -> Dict[str, NumericHistory]:
+        """Fetch the numeric states of the entities, oldest first."""
+        rows: Dict[str, List[Tuple[str, datetime]]] = {}
+        with session_scope(hass=self.hass) as session:
+            # One bounded query per entity, so a busy entity with a long
+            # time window doesn't load all of its states
+            for entity_id, (limit, start) in windows.items():
+                query = session.query(States.state, States.last_updated).filter(
+                    States.entity_id == entity_id
+                )
+                if start is not None:
+                    query = query.filter(States.last_updated >= start)
+                query = query.order_by(States.last_updated.desc()).limit(limit)
+                rows[entity_id] = list(reversed(execute(query)))
+
+        history = {}
+        for entity_id, entity_rows in rows.items():
+            timestamps = array("d")
+            values = array("d")
+            for state, last_updated in entity_rows:
+                try:
+                    value = float(state)
+                except (TypeError, ValueError):
+                    continue
+                timestamps.append(process_timestamp(last_updated).timestamp())
+                values.append(value)
+            history[entity_id] = NumericHistory(timestamps, values)
+
+        _LOGGER.debug("Prefilled the numeric history of %d entities", len(history))
+        return history
+
+
+@callback
+def async_get_numeric_history(
+    hass: HomeAssistant, entity_id: str, limit: int, start: Optional[datetime] = None
+) -> "asyncio.Future[NumericHistory]":
+    """Return the last limit numeric states of an entity since start."""
+    prefill: Optional[NumericHistoryPrefill] = hass.data.get(DATA_PREFILL)
+    if prefill is None:
+        prefill = hass.data[DATA_PREFILL] = NumericHistoryPrefill(hass)
+    return prefill.async_request(entity_id, limit, start)
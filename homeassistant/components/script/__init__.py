@@ -5,6 +5,7 @@ from typing import List
 
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -24,6 +25,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import async_get_reference_index
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
@@ -94,13 +96,7 @@ def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return async_get_reference_index(hass, DOMAIN).with_entity(entity_id)
 
 
 @callback
@@ -125,13 +121,7 @@ def scripts_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return async_get_reference_index(hass, DOMAIN).with_device(device_id)
 
 
 @callback
@@ -201,6 +191,7 @@ async def async_setup(hass, config):
     hass.services.async_register(
         DOMAIN, SERVICE_TOGGLE, toggle_service, schema=SCRIPT_TURN_ONOFF_SCHEMA
     )
+    websocket_api.async_register_command(hass, websocket_trace)
 
     return True
 
@@ -331,9 +322,38 @@ class ScriptEntity(ToggleEntity):
         """Turn script off."""
         await self.script.async_stop()
 
+    async def async_added_to_hass(self):
+        """Index the entities and devices referenced by the script."""
+        async_get_reference_index(self.hass, DOMAIN).async_add(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+        )
+
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.object_id)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "script/trace", vol.Required("entity_id"): cv.entity_id}
+)
+@callback
+def websocket_trace(hass, connection, msg):
+    """Return the traces of the recent runs of a script."""
+    script_entity = hass.data[DOMAIN].get_entity(msg["entity_id"])
+
+    if script_entity is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Script not found"
+        )
+        return
+
+    connection.send_result(
+        msg["id"], [trace.as_dict() for trace in script_entity.script.traces]
+    )
@@ -1,11 +1,13 @@
 """Support for statistics for sensor values."""
+from bisect import bisect_left, insort
 from collections import deque
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
 from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.prefill import async_get_numeric_history
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
@@ -85,6 +87,110 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     return True
 
 
+class RollingStatistics:
+    """Aggregates of a window of values, updated as values enter and leave.
+
+    Values leave in the order they were added. Mean and variance use Welford's
+    algorithm, min and max monotonic deques, and the median a sorted list kept
+    with bisect. Undoing Welford updates accumulates rounding errors, so the
+    sum, mean and variance are recomputed from the window once as many values
+    have left as it holds, which keeps removals amortized constant time.
+    """
+
+    def __init__(self):
+        """Initialize the aggregates of an empty window."""
+        self.count = 0
+        self.total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sorted = []
+        # (position, value) pairs, values increasing for min, decreasing for max
+        self._min = deque()
+        self._max = deque()
+        self._added = 0
+        self._removed = 0
+        self._removed_since_resync = 0
+
+    def add(self, value):
+        """Add a value to the window."""
+        position = self._added
+        self._added += 1
+        self.count += 1
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        insort(self._sorted, value)
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((position, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((position, value))
+
+    def remove_oldest(self, value):
+        """Remove the oldest value of the window."""
+        position = self._removed
+        self._removed += 1
+        self.count -= 1
+        self._removed_since_resync += 1
+        del self._sorted[bisect_left(self._sorted, value)]
+        if self._removed_since_resync >= self.count:
+            self._resync()
+        else:
+            self.total -= value
+            delta = value - self._mean
+            self._mean -= delta / self.count
+            self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+        if self._min[0][0] == position:
+            self._min.popleft()
+        if self._max[0][0] == position:
+            self._max.popleft()
+
+    def _resync(self):
+        """Recompute the sum, mean and variance from the window."""
+        self._removed_since_resync = 0
+        if not self.count:
+            self.total = self._mean = self._m2 = 0.0
+            return
+        self.total = math.fsum(self._sorted)
+        self._mean = self.total / self.count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._sorted)
+
+    @property
+    def mean(self):
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def median(self):
+        """Return the median of the values."""
+        middle = self.count // 2
+        if self.count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self):
+        """Return the sample variance of the values."""
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self):
+        """Return the sample standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self):
+        """Return the smallest value."""
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        """Return the largest value."""
+        return self._max[0][1]
+
+
 class StatisticsSensor(Entity):
     """Representation of a Statistics sensor."""
 
@@ -99,6 +205,7 @@ class StatisticsSensor(Entity):
         self._unit_of_measurement = None
         self.states = deque(maxlen=self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
+        self._aggregates = RollingStatistics()
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -153,7 +260,8 @@ class StatisticsSensor(Entity):
             if self.is_binary:
                 self.states.append(new_state.state)
             else:
-                self.states.append(float(new_state.state))
+                self._add_value_to_queue(float(new_state.state), new_state.last_updated)
+                return
 
             self.ages.append(new_state.last_updated)
         except ValueError:
@@ -163,6 +271,14 @@ class StatisticsSensor(Entity):
                 new_state.state,
             )
 
+    def _add_value_to_queue(self, value, last_updated):
+        """Add a numeric value to the queue."""
+        if len(self.states) == self._sampling_size:
+            self._aggregates.remove_oldest(self.states[0])
+        self._aggregates.add(value)
+        self.states.append(value)
+        self.ages.append(last_updated)
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -228,7 +344,9 @@ class StatisticsSensor(Entity):
                 (now - self.ages[0]),
             )
             self.ages.popleft()
-            self.states.popleft()
+            value = self.states.popleft()
+            if not self.is_binary:
+                self._aggregates.remove_oldest(value)
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -248,24 +366,25 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            aggregates = self._aggregates
+            if self.count:  # require only one data point
+                self.mean = round(aggregates.mean, self._precision)
+                self.median = round(aggregates.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count > 1:  # require at least two data points
+                self.stdev = round(aggregates.stdev, self._precision)
+                self.variance = round(aggregates.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: not enough data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(aggregates.total, self._precision)
+                self.min = round(aggregates.min, self._precision)
+                self.max = round(aggregates.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -315,9 +434,12 @@ class StatisticsSensor(Entity):
     async def _async_initialize_from_database(self):
         """Initialize the list of states from the database.
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
+        Numeric states come from the recorder prefill, which fetches the
+        history of the sensors starting together at once.
+
+        For binary sensors the query will get the list of states in DESCENDING
+        order so that we can limit the result to self._sample_size. Afterwards
+        reverse the list so that we get it in the right order again.
 
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
@@ -325,6 +447,21 @@ class StatisticsSensor(Entity):
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
+        if not self.is_binary:
+            start = None
+            if self._max_age is not None:
+                start = dt_util.utcnow() - self._max_age
+            history = await async_get_numeric_history(
+                self.hass, self._entity_id, self._sampling_size, start
+            )
+            for timestamp, value in zip(history.timestamps, history.values):
+                self._add_value_to_queue(value, dt_util.utc_from_timestamp(timestamp))
+
+            self.async_schedule_update_ha_state(True)
+
+            _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+            return
+
         with session_scope(hass=self.hass) as session:
             query = session.query(States).filter(
                 States.entity_id == self._entity_id.lower()
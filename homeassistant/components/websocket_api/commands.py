@@ -1,5 +1,6 @@
 """Commands part of Websocket API."""
 import asyncio
+import json
 
 import voluptuous as vol
 
@@ -18,8 +19,10 @@ from homeassistant.helpers.event import TrackTemplate, async_track_template_resu
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.template import Template
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline
 
 from . import const, decorators, messages
+from .connection import ActiveConnection
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
@@ -37,9 +40,11 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_setup_timeline)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
+    async_reg(hass, handle_batch)
 
 
 def pong_message(iden):
@@ -230,6 +235,14 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_timeline"})
+@decorators.require_admin
+def handle_setup_timeline(hass, connection, msg):
+    """Handle setup timeline command."""
+    connection.send_result(msg["id"], async_get_setup_timeline(hass).as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
@@ -410,3 +423,118 @@ async def handle_test_condition(hass, connection, msg):
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
+
+
+def _batch_reply(message):
+    """Convert a sub-command reply into a batch result entry."""
+    if message["type"] != const.TYPE_RESULT:
+        return {"success": True, "result": None}
+    if message["success"]:
+        return {"success": True, "result": message["result"]}
+    return {"success": False, "error": message["error"]}
+
+
+@callback
+def _async_handle_batch_command(hass, connection, iden, command):
+    """Dispatch a single command of a batch on a private connection.
+
+    Returns a future that resolves with the first reply of the command. If
+    the batch gave up on the reply, whatever the command subscribed to when it
+    finally replies is closed right away.
+    """
+    reply = hass.loop.create_future()
+
+    @callback
+    def collect_reply(message):
+        """Keep the first non-event message a command sends."""
+        if reply.cancelled():
+            sub_connection.async_close()
+            return
+        if isinstance(message, str):
+            # send_big_result serializes up front
+            message = json.loads(message)
+        if message["type"] == "event" or reply.done():
+            return
+        reply.set_result(message)
+
+    sub_connection = ActiveConnection(
+        connection.logger, hass, collect_reply, connection.user, None
+    )
+    sub_connection.refresh_token_id = connection.refresh_token_id
+
+    msg = {**command, "id": iden}
+    handlers = hass.data[const.DOMAIN]
+
+    if msg["type"] == "batch" or msg["type"] not in handlers:
+        collect_reply(
+            messages.error_message(iden, const.ERR_UNKNOWN_COMMAND, "Unknown command.")
+        )
+        return reply, sub_connection
+
+    handler, schema = handlers[msg["type"]]
+
+    try:
+        handler(hass, sub_connection, schema(msg))
+    except Exception as err:  # pylint: disable=broad-except
+        sub_connection.async_handle_exception(msg, err)
+
+    return reply, sub_connection
+
+
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "batch",
+        vol.Required("commands"): vol.All(
+            [vol.Schema({vol.Required("type"): str}, extra=vol.ALLOW_EXTRA)],
+            vol.Length(min=1),
+        ),
+    }
+)
+@decorators.async_response
+async def handle_batch(hass, connection, msg):
+    """Handle batch command.
+
+    All commands are started at once and their replies are returned in a
+    single result, in the order the commands were given. Commands that have not
+    replied within BATCH_TIMEOUT seconds are reported as timed out.
+    """
+    pending = [
+        _async_handle_batch_command(hass, connection, iden, command)
+        for iden, command in enumerate(msg["commands"], 1)
+    ]
+    _, late = await asyncio.wait(
+        [reply for reply, _ in pending], timeout=const.BATCH_TIMEOUT
+    )
+    for reply in late:
+        reply.cancel()
+
+    results = []
+    for reply, sub_connection in pending:
+        if reply.cancelled():
+            sub_connection.async_close()
+            results.append(
+                {
+                    "success": False,
+                    "error": {
+                        "code": const.ERR_TIMEOUT,
+                        "message": "Command did not reply in time.",
+                    },
+                }
+            )
+            continue
+        message = reply.result()
+        if sub_connection.subscriptions:
+            sub_connection.async_close()
+            results.append(
+                {
+                    "success": False,
+                    "error": {
+                        "code": const.ERR_NOT_SUPPORTED,
+                        "message": "Subscriptions are not supported in a batch.",
+                    },
+                }
+            )
+            continue
+        results.append(_batch_reply(message))
+
+    connection.send_result(msg["id"], results)
@@ -19,6 +19,8 @@ URL = "/api/websocket"
 PENDING_MSG_PEAK = 512
 PENDING_MSG_PEAK_TIME = 5
 MAX_PENDING_MSG = 2048
+# Seconds a batch waits for the replies of its commands
+BATCH_TIMEOUT = 10
 
 ERR_ID_REUSE = "id_reuse"
 ERR_INVALID_FORMAT = "invalid_format"
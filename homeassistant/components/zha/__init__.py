@@ -7,9 +7,13 @@ import voluptuous as vol
 from zigpy.config import CONF_DEVICE, CONF_DEVICE_PATH
 
 from homeassistant import config_entries, const as ha_const
+from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import CONNECTION_ZIGBEE
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.typing import HomeAssistantType
 
 from . import api
@@ -102,7 +106,10 @@ async def async_setup_entry(hass, config_entry):
     zha_data[DATA_ZHA_DISPATCHERS] = []
     zha_data[DATA_ZHA_PLATFORM_LOADED] = []
     for component in COMPONENTS:
-        coro = hass.config_entries.async_forward_entry_setup(config_entry, component)
+        # Platforms without entities are imported once a device needs them
+        coro = hass.config_entries.async_forward_entry_setup(
+            config_entry, component, lazy=True
+        )
         zha_data[DATA_ZHA_PLATFORM_LOADED].append(hass.async_create_task(coro))
 
     device_registry = await hass.helpers.device_registry.async_get_registry()
@@ -123,7 +130,7 @@ async def async_setup_entry(hass, config_entry):
         await zha_data[DATA_ZHA_GATEWAY].async_update_device_storage()
 
     hass.bus.async_listen_once(ha_const.EVENT_HOMEASSISTANT_STOP, async_zha_shutdown)
-    asyncio.create_task(async_load_entities(hass))
+    asyncio.create_task(async_load_entities(hass, config_entry))
     return True
 
 
@@ -144,7 +151,9 @@ async def async_unload_entry(hass, config_entry):
     return True
 
 
-async def async_load_entities(hass: HomeAssistantType) -> None:
+async def async_load_entities(
+    hass: HomeAssistantType, config_entry: config_entries.ConfigEntry
+) -> None:
     """Load entities after integration was setup."""
     await hass.data[DATA_ZHA][DATA_ZHA_GATEWAY].async_initialize_devices_and_entities()
     to_setup = hass.data[DATA_ZHA][DATA_ZHA_PLATFORM_LOADED]
@@ -152,6 +161,45 @@ async def async_load_entities(hass: HomeAssistantType) -> None:
     for res in results:
         if isinstance(res, Exception):
             _LOGGER.warning("Couldn't setup zha platform: %s", res)
+    await async_setup_lazy_platforms(hass, config_entry)
+    async_dispatcher_send(hass, SIGNAL_ADD_ENTITIES)
+
+    @callback
+    def async_setup_new_platforms():
+        """Set up the lazy platforms of entities discovered later."""
+        if any(
+            hass.data[DATA_ZHA][component]
+            for component in hass.config_entries.async_lazy_platforms(config_entry)
+        ):
+            hass.async_create_task(async_add_lazy_platform_entities(hass, config_entry))
+
+    hass.data[DATA_ZHA][DATA_ZHA_DISPATCHERS].append(
+        async_dispatcher_connect(hass, SIGNAL_ADD_ENTITIES, async_setup_new_platforms)
+    )
+
+
+async def async_setup_lazy_platforms(
+    hass: HomeAssistantType, config_entry: config_entries.ConfigEntry
+) -> None:
+    """Set up the lazy platforms that have entities waiting to be added."""
+    results = await asyncio.gather(
+        *(
+            hass.config_entries.async_forward_lazy_entry_setup(config_entry, component)
+            for component in hass.config_entries.async_lazy_platforms(config_entry)
+            if hass.data[DATA_ZHA][component]
+        ),
+        return_exceptions=True,
+    )
+    for res in results:
+        if isinstance(res, Exception):
+            _LOGGER.warning("Couldn't setup zha platform: %s", res)
+
+
+async def async_add_lazy_platform_entities(
+    hass: HomeAssistantType, config_entry: config_entries.ConfigEntry
+) -> None:
+    """Set up the lazy platforms of new entities and add the entities."""
+    await async_setup_lazy_platforms(hass, config_entry)
     async_dispatcher_send(hass, SIGNAL_ADD_ENTITIES)
 
 
@@ -51,6 +51,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import Integration, IntegrationNotFound
 from homeassistant.requirements import (
     RequirementsNotFound,
@@ -58,7 +59,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, load_yaml, loader as yaml_loader
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +68,8 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_PARSE_CACHE_KEY = "core.yaml_parse_cache"
+YAML_PARSE_CACHE_VERSION = 1
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -319,6 +322,35 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     return config
 
 
+def _yaml_parse_cache_store(hass: HomeAssistant) -> Store:
+    """Return the store of the parsed YAML files."""
+    return Store(
+        hass,
+        YAML_PARSE_CACHE_VERSION,
+        YAML_PARSE_CACHE_KEY,
+        private=True,
+        compact=True,
+    )
+
+
+async def async_load_yaml_parse_cache(hass: HomeAssistant) -> None:
+    """Load the YAML files parsed by the previous run."""
+    try:
+        data = await _yaml_parse_cache_store(hass).async_load()
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to load the YAML parse cache: %s", err)
+        return
+    if data is not None:
+        yaml_loader.restore_parse_cache(data)
+
+
+async def async_save_yaml_parse_cache(hass: HomeAssistant) -> None:
+    """Save the parsed YAML files for the next run if they changed."""
+    data = yaml_loader.dump_parse_cache()
+    if data is not None:
+        await _yaml_parse_cache_store(hass).async_save(data)
+
+
 def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
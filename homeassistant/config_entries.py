@@ -594,6 +594,8 @@ class ConfigEntries:
         self.options = OptionsFlowManager(hass)
         self._hass_config = hass_config
         self._entries: List[ConfigEntry] = []
+        # Entry ID -> platforms forwarded lazily that have not been set up
+        self._lazy_platforms: Dict[str, Set[str]] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         EntityRegistryDisabledHandler(hass).async_setup()
 
@@ -646,6 +648,7 @@ class ConfigEntries:
         await entry.async_remove(self.hass)
 
         self._entries.remove(entry)
+        self._lazy_platforms.pop(entry_id, None)
         self._async_schedule_save()
 
         dev_reg, ent_reg = await asyncio.gather(
@@ -741,7 +744,11 @@ class ConfigEntries:
         if entry.state in UNRECOVERABLE_STATES:
             raise OperationNotAllowed
 
-        return await entry.async_unload(self.hass)
+        result = await entry.async_unload(self.hass)
+        if result:
+            # Platforms are forwarded lazily again on the next setup
+            self._lazy_platforms.pop(entry_id, None)
+        return result
 
     async def async_reload(self, entry_id: str) -> bool:
         """Reload an entry.
@@ -811,16 +818,34 @@ class ConfigEntries:
 
         return True
 
-    async def async_forward_entry_setup(self, entry: ConfigEntry, domain: str) -> bool:
+    async def async_forward_entry_setup(
+        self, entry: ConfigEntry, domain: str, *, lazy: bool = False
+    ) -> bool:
         """Forward the setup of an entry to a different component.
 
         By default an entry is setup with the component it belongs to. If that
         component also has related platforms, the component will have to
         forward the entry to be setup by that component.
 
+        A lazy platform is only set up right away if the entity registry holds
+        entities of the entry for it. Otherwise its module is not imported until
+        the integration calls async_forward_lazy_entry_setup once it has an
+        entity for the platform.
+
         You don't want to await this coroutine if it is called as part of the
         setup of a component, because it can cause a deadlock.
         """
+        if lazy:
+            registry = await entity_registry.async_get_registry(self.hass)
+            if not any(
+                registry_entry.domain == domain
+                for registry_entry in entity_registry.async_entries_for_config_entry(
+                    registry, entry.entry_id
+                )
+            ):
+                self._lazy_platforms.setdefault(entry.entry_id, set()).add(domain)
+                return True
+
         # Setup Component if not set up yet
         if domain not in self.hass.config.components:
             result = await async_setup_component(self.hass, domain, self._hass_config)
@@ -833,8 +858,28 @@ class ConfigEntries:
         await entry.async_setup(self.hass, integration=integration)
         return True
 
+    @callback
+    def async_lazy_platforms(self, entry: ConfigEntry) -> Set[str]:
+        """Return the lazy platforms of an entry that have not been set up."""
+        return set(self._lazy_platforms.get(entry.entry_id, ()))
+
+    async def async_forward_lazy_entry_setup(
+        self, entry: ConfigEntry, domain: str
+    ) -> bool:
+        """Set up a platform that was forwarded lazily.
+
+        Does nothing if the platform is already set up or being set up.
+        """
+        if not self._async_discard_lazy_platform(entry, domain):
+            return True
+        return await self.async_forward_entry_setup(entry, domain)
+
     async def async_forward_entry_unload(self, entry: ConfigEntry, domain: str) -> bool:
         """Forward the unloading of an entry to a different component."""
+        if self._async_discard_lazy_platform(entry, domain):
+            # It was never set up
+            return True
+
         # It was never loaded.
         if domain not in self.hass.config.components:
             return True
@@ -843,6 +888,17 @@ class ConfigEntries:
 
         return await entry.async_unload(self.hass, integration=integration)
 
+    @callback
+    def _async_discard_lazy_platform(self, entry: ConfigEntry, domain: str) -> bool:
+        """Forget a lazy platform of an entry, return if it was waiting."""
+        lazy_platforms = self._lazy_platforms.get(entry.entry_id)
+        if lazy_platforms is None or domain not in lazy_platforms:
+            return False
+        lazy_platforms.discard(domain)
+        if not lazy_platforms:
+            del self._lazy_platforms[entry.entry_id]
+        return True
+
     @callback
     def _async_schedule_save(self) -> None:
         """Save the entity registry to a file."""
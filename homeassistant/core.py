@@ -29,6 +29,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -965,6 +966,8 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        self._domain_index: Dict[str, Dict[str, State]] = {}
+        self._sorted_entity_ids: Dict[Optional[str], Tuple[str, ...]] = {}
         self._reservations: Set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -988,7 +991,7 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
         return [
             state.entity_id
@@ -1010,8 +1013,8 @@ class StateMachine:
         if isinstance(domain_filter, str):
             domain_filter = (domain_filter.lower(),)
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ())) for domain in set(domain_filter)
         )
 
     def all(self, domain_filter: Optional[Union[str, Iterable]] = None) -> List[State]:
@@ -1032,12 +1035,39 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
         return [
             state for state in self._states.values() if state.domain in domain_filter
         ]
 
+    @callback
+    def async_all_sorted(self, domain: Optional[str] = None) -> List[State]:
+        """Create a list of all states of a domain, sorted by entity id.
+
+        The sort order is cached and only recalculated when an entity of
+        the domain is added or removed.
+
+        This method must be run in the event loop.
+        """
+        if domain is None:
+            states = self._states
+        else:
+            domain = domain.lower()
+            states = self._domain_index.get(domain, {})
+
+        entity_ids = self._sorted_entity_ids.get(domain)
+        if entity_ids is None:
+            entity_ids = self._sorted_entity_ids[domain] = tuple(sorted(states))
+
+        return [states[entity_id] for entity_id in entity_ids]
+
+    @callback
+    def _async_index_changed(self, domain: str) -> None:
+        """Invalidate the sort order after an entity was added or removed."""
+        self._sorted_entity_ids.pop(domain, None)
+        self._sorted_entity_ids.pop(None, None)
+
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
 
@@ -1079,6 +1109,12 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+        self._async_index_changed(old_state.domain)
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1184,6 +1220,9 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
+        if old_state is None:
+            self._async_index_changed(state.domain)
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -6,7 +6,20 @@ import functools as ft
 import logging
 import re
 import sys
-from typing import Any, Callable, Container, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from homeassistant.components import zone as zone_cmp
 from homeassistant.components.device_automation import (
@@ -55,6 +68,96 @@ INPUT_ENTITY_ID = re.compile(
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+# Conditions are evaluated cheapest first. Conditions not listed only look
+# at the state machine or the clock.
+CONDITION_COSTS = {"device": 1, "sun": 1, "template": 2}
+
+
+class ConditionStats:
+    """Count how often a condition is evaluated and passes."""
+
+    __slots__ = ("condition", "index", "evaluations", "passes")
+
+    def __init__(self, condition: str, index: int = 0) -> None:
+        """Initialize the statistics of the condition at index of its config."""
+        self.condition = condition
+        self.index = index
+        self.evaluations = 0
+        self.passes = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Return the fraction of evaluations that passed."""
+        if not self.evaluations:
+            return None
+        return self.passes / self.evaluations
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "index": self.index,
+            "condition": self.condition,
+            "evaluations": self.evaluations,
+            "passes": self.passes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def condition_cost(config: Union[ConfigType, Template]) -> int:
+    """Return the relative cost of evaluating a condition."""
+    if isinstance(config, Template):
+        return CONDITION_COSTS["template"]
+
+    condition = config[CONF_CONDITION]
+    if condition in ("and", "or", "not"):
+        return max((condition_cost(entry) for entry in config["conditions"]), default=0)
+    if condition == "numeric_state" and CONF_VALUE_TEMPLATE in config:
+        return CONDITION_COSTS["template"]
+    return CONDITION_COSTS.get(condition, 0)
+
+
+def _flatten(
+    configs: Iterable[Union[ConfigType, Template]], condition: str
+) -> Iterator[Union[ConfigType, Template]]:
+    """Inline nested conditions of the same kind."""
+    for config in configs:
+        if not isinstance(config, Template) and config[CONF_CONDITION] == condition:
+            yield from _flatten(config["conditions"], condition)
+        else:
+            yield config
+
+
+async def _async_checks_from_config(
+    hass: HomeAssistant, config: ConfigType, flatten: bool = True
+) -> List[ConditionCheckerType]:
+    """Create the checks of an and, or or not condition, cheapest first."""
+    configs = config["conditions"]
+    if flatten:
+        configs = _flatten(configs, config[CONF_CONDITION])
+    return [
+        await async_from_config(hass, entry, False)
+        for entry in sorted(configs, key=condition_cost)
+    ]
+
+
+@callback
+def async_track_stats(
+    checker: ConditionCheckerType, stats: ConditionStats
+) -> ConditionCheckerType:
+    """Wrap a condition checker to count its evaluations and passes."""
+
+    def tracked_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test condition and count the result."""
+        stats.evaluations += 1
+        result = checker(hass, variables)
+        if result:
+            stats.passes += 1
+        return result
+
+    return tracked_condition
+
 
 async def async_from_config(
     hass: HomeAssistant,
@@ -100,9 +203,7 @@ async def async_and_from_config(
     """Create multi condition matcher using 'AND'."""
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_checks_from_config(hass, config)
 
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -127,9 +228,7 @@ async def async_or_from_config(
     """Create multi condition matcher using 'OR'."""
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_checks_from_config(hass, config)
 
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -153,9 +252,7 @@ async def async_not_from_config(
     """Create multi condition matcher using 'NOT'."""
     if config_validation:
         config = cv.NOT_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_checks_from_config(hass, config, flatten=False)
 
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -207,9 +304,26 @@ def async_numeric_state(
     if isinstance(entity, str):
         entity = hass.states.get(entity)
 
-    if entity is None or (attribute is not None and attribute not in entity.attributes):
+    if entity is None:
+        return False
+
+    fvalue = _async_numeric_value(entity, value_template, variables, attribute)
+    if fvalue is None:
         return False
 
+    return _async_in_range(hass, fvalue, below, above)
+
+
+def _async_numeric_value(
+    entity: State,
+    value_template: Optional[Template],
+    variables: TemplateVarsType,
+    attribute: Optional[str],
+) -> Optional[float]:
+    """Return the numeric value of a state, None if it has none."""
+    if attribute is not None and attribute not in entity.attributes:
+        return None
+
     value: Any = None
     if value_template is None:
         if attribute is None:
@@ -223,21 +337,29 @@ def async_numeric_state(
             value = value_template.async_render(variables)
         except TemplateError as ex:
             _LOGGER.error("Template error: %s", ex)
-            return False
+            return None
 
     if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-        return False
+        return None
 
     try:
-        fvalue = float(value)
+        return float(value)
     except ValueError:
         _LOGGER.warning(
             "Value cannot be processed as a number: %s (Offending entity: %s)",
             entity,
             value,
         )
-        return False
+        return None
+
 
+def _async_in_range(
+    hass: HomeAssistant,
+    fvalue: float,
+    below: Optional[Union[float, str]],
+    above: Optional[Union[float, str]],
+) -> bool:
+    """Test if a value is between the thresholds."""
     if below is not None:
         if isinstance(below, str):
             below_entity = hass.states.get(below)
@@ -276,6 +398,9 @@ def async_numeric_state_from_config(
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    # States are immutable, the value parsed from the last seen state of an
+    # entity is valid until the entity changes.
+    parsed: Dict[str, Tuple[State, Optional[float]]] = {}
 
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -283,13 +408,26 @@ def async_numeric_state_from_config(
         """Test numeric state condition."""
         if value_template is not None:
             value_template.hass = hass
-
-        return all(
-            async_numeric_state(
-                hass, entity_id, below, above, value_template, variables, attribute
+            return all(
+                async_numeric_state(
+                    hass, entity_id, below, above, value_template, variables, attribute
+                )
+                for entity_id in entity_ids
             )
-            for entity_id in entity_ids
-        )
+
+        for entity_id in entity_ids:
+            entity = hass.states.get(entity_id)
+            if entity is None:
+                return False
+            cached = parsed.get(entity_id)
+            if cached is not None and cached[0] is entity:
+                fvalue = cached[1]
+            else:
+                fvalue = _async_numeric_value(entity, None, None, attribute)
+                parsed[entity_id] = (entity, fvalue)
+            if fvalue is None or not _async_in_range(hass, fvalue, below, above):
+                return False
+        return True
 
     return if_numeric_state
 
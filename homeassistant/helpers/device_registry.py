@@ -125,11 +125,19 @@ class DeviceRegistry:
     devices: Dict[str, DeviceEntry]
     deleted_devices: Dict[str, DeletedDeviceEntry]
     _devices_index: Dict[str, Dict[str, Dict[str, str]]]
+    _devices_by_area_id: Dict[str, Dict[str, DeviceEntry]]
+    _devices_by_config_entry_id: Dict[str, Dict[str, DeviceEntry]]
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            compact=True,
+            journal={"devices": "id", "deleted_devices": "id"},
+            track_changes=True,
+        )
         self._clear_index()
 
     @callback
@@ -180,9 +188,12 @@ class DeviceRegistry:
         if isinstance(device, DeletedDeviceEntry):
             devices_index = self._devices_index[DELETED_DEVICE]
             self.deleted_devices[device.id] = device
+            self._store.async_mark_changed("deleted_devices", device.id)
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices[device.id] = device
+            self._add_device_to_lookups(device)
+            self._store.async_mark_changed("devices", device.id)
 
         _add_device_to_index(devices_index, device)
 
@@ -191,32 +202,73 @@ class DeviceRegistry:
         if isinstance(device, DeletedDeviceEntry):
             devices_index = self._devices_index[DELETED_DEVICE]
             self.deleted_devices.pop(device.id)
+            self._store.async_mark_changed("deleted_devices", device.id)
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices.pop(device.id)
+            self._remove_device_from_lookups(device)
+            self._store.async_mark_changed("devices", device.id)
 
         _remove_device_from_index(devices_index, device)
 
     def _update_device(self, old_device: DeviceEntry, new_device: DeviceEntry) -> None:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
+        self._store.async_mark_changed("devices", new_device.id)
 
         devices_index = self._devices_index[REGISTERED_DEVICE]
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+        if (
+            old_device.area_id == new_device.area_id
+            and old_device.config_entries == new_device.config_entries
+        ):
+            # Keep the position of the device in the lookups
+            if new_device.area_id is not None:
+                self._devices_by_area_id[new_device.area_id][new_device.id] = new_device
+            for config_entry_id in new_device.config_entries:
+                self._devices_by_config_entry_id[config_entry_id][
+                    new_device.id
+                ] = new_device
+            return
+
+        self._remove_device_from_lookups(old_device)
+        self._add_device_to_lookups(new_device)
+
+    def _add_device_to_lookups(self, device: DeviceEntry) -> None:
+        """Add a registered device to the area and config entry lookups."""
+        if device.area_id is not None:
+            self._devices_by_area_id.setdefault(device.area_id, {})[device.id] = device
+        for config_entry_id in device.config_entries:
+            self._devices_by_config_entry_id.setdefault(config_entry_id, {})[
+                device.id
+            ] = device
+
+    def _remove_device_from_lookups(self, device: DeviceEntry) -> None:
+        """Remove a registered device from the area and config entry lookups."""
+        if device.area_id is not None:
+            _remove_from_lookup(self._devices_by_area_id, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _remove_from_lookup(
+                self._devices_by_config_entry_id, config_entry_id, device.id
+            )
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._devices_index = {
             REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
             DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
         }
+        self._devices_by_area_id = {}
+        self._devices_by_config_entry_id = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._devices_index[REGISTERED_DEVICE], device)
+            self._add_device_to_lookups(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._devices_index[DELETED_DEVICE], deleted_device)
 
@@ -529,8 +581,10 @@ class DeviceRegistry:
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in list(
+            self._devices_by_config_entry_id.get(config_entry_id, {})
+        ):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
@@ -545,14 +599,14 @@ class DeviceRegistry:
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
+                self._store.async_mark_changed("deleted_devices", deleted_device.id)
             self.async_schedule_save()
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._devices_by_area_id.get(area_id, {})):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @singleton(DATA_REGISTRY)
@@ -566,7 +620,8 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    return list(registry._devices_by_area_id.get(area_id, {}).values())
 
 
 @callback
@@ -574,11 +629,8 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable=protected-access
+    return list(registry._devices_by_config_entry_id.get(config_entry_id, {}).values())
 
 
 @callback
@@ -673,6 +725,16 @@ def _add_device_to_index(
         devices_index[IDX_CONNECTIONS][connection] = device.id
 
 
+def _remove_from_lookup(
+    lookup: Dict[str, Dict[str, DeviceEntry]], key: str, device_id: str
+) -> None:
+    """Remove a device from a lookup, dropping the key once it is empty."""
+    devices = lookup[key]
+    del devices[device_id]
+    if not devices:
+        del lookup[key]
+
+
 def _remove_device_from_index(
     devices_index: dict, device: Union[DeviceEntry, DeletedDeviceEntry]
 ) -> None:
@@ -124,7 +124,16 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._entries_by_device_id: Dict[str, Dict[str, RegistryEntry]] = {}
+        self._entries_by_area_id: Dict[str, Dict[str, RegistryEntry]] = {}
+        self._entries_by_config_entry_id: Dict[str, Dict[str, RegistryEntry]] = {}
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            compact=True,
+            journal={"entities": "entity_id"},
+            track_changes=True,
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -413,9 +422,11 @@ class EntityRegistry:
         if not changes:
             return old
 
-        self._remove_index(old)
         new = attr.evolve(old, **changes)
-        self._register_entry(new)
+        self.entities[new.entity_id] = new
+        self._update_index(old, new)
+        self._store.async_mark_changed("entities", old.entity_id)
+        self._store.async_mark_changed("entities", new.entity_id)
 
         self.async_schedule_save()
 
@@ -505,36 +516,86 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._entries_by_config_entry_id.get(config_entry, {})):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._entries_by_area_id.get(area_id, {})):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
         self._add_index(entry)
+        self._store.async_mark_changed("entities", entry.entity_id)
+
+    def _secondary_indexes(
+        self, entry: RegistryEntry
+    ) -> Iterable[Tuple[Dict[str, Dict[str, RegistryEntry]], Optional[str]]]:
+        """Return the secondary indexes and the key of entry in each of them."""
+        return (
+            (self._entries_by_device_id, entry.device_id),
+            (self._entries_by_area_id, entry.area_id),
+            (self._entries_by_config_entry_id, entry.config_entry_id),
+        )
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, key in self._secondary_indexes(entry):
+            if key is not None:
+                index.setdefault(key, {})[entry.entity_id] = entry
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
         del self.entities[entry.entity_id]
+        self._store.async_mark_changed("entities", entry.entity_id)
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, key in self._secondary_indexes(entry):
+            if key is None:
+                continue
+            entries = index[key]
+            del entries[entry.entity_id]
+            if not entries:
+                del index[key]
+
+    def _update_index(self, old: RegistryEntry, new: RegistryEntry) -> None:
+        """Update the indexes for an updated entry, keeping its position."""
+        if (
+            old.entity_id != new.entity_id
+            or (
+                old.domain,
+                old.platform,
+                old.unique_id,
+            )
+            != (new.domain, new.platform, new.unique_id)
+        ):
+            self._remove_index(old)
+            self._add_index(new)
+            return
+
+        for (index, old_key), (_, new_key) in zip(
+            self._secondary_indexes(old), self._secondary_indexes(new)
+        ):
+            if old_key == new_key:
+                if new_key is not None:
+                    index[new_key][new.entity_id] = new
+                continue
+            if old_key is not None:
+                entries = index[old_key]
+                del entries[old.entity_id]
+                if not entries:
+                    del index[old_key]
+            if new_key is not None:
+                index.setdefault(new_key, {})[new.entity_id] = new
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._entries_by_device_id = {}
+        self._entries_by_area_id = {}
+        self._entries_by_config_entry_id = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -552,11 +613,11 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
+    # pylint: disable=protected-access
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry._entries_by_device_id.get(device_id, {}).values()
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -565,7 +626,8 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    # pylint: disable=protected-access
+    return list(registry._entries_by_area_id.get(area_id, {}).values())
 
 
 @callback
@@ -573,11 +635,8 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    # pylint: disable=protected-access
+    return list(registry._entries_by_config_entry_id.get(config_entry_id, {}).values())
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
@@ -97,6 +97,24 @@ class TrackTemplate:
     rate_limit: Optional[timedelta] = None
 
 
+@dataclass
+class TrackTemplateRenderStats:
+    """Class for render statistics of a tracked template.
+
+    renders
+        Number of times the template was rendered.
+    skipped
+        Number of state changes of referenced entities that did not
+        touch anything the template read, so no render was needed.
+    render_time
+        Total time spent rendering the template in seconds.
+    """
+
+    renders: int = 0
+    skipped: int = 0
+    render_time: float = 0.0
+
+
 @dataclass
 class TrackTemplateResult:
     """Class for result of template tracking.
@@ -753,13 +771,13 @@ class _TrackTemplateResultInfo:
         self._info: Dict[Template, RenderInfo] = {}
         self._track_state_changes: Optional[_TrackStateChangeFiltered] = None
         self._time_listeners: Dict[Template, Callable] = {}
+        self._render_stats: Dict[Template, TrackTemplateRenderStats] = {}
 
     def async_setup(self, raise_on_template_error: bool) -> None:
         """Activation of template tracking."""
         for track_template_ in self._track_templates:
             template = track_template_.template
-            variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(variables)
+            self._info[template] = info = self._render_to_info(track_template_)
 
             if info.exception:
                 if raise_on_template_error:
@@ -789,6 +807,25 @@ class _TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_stats(self) -> Dict[Template, TrackTemplateRenderStats]:
+        """Render statistics per tracked template."""
+        return self._render_stats
+
+    @callback
+    def _render_to_info(self, track_template_: TrackTemplate) -> RenderInfo:
+        """Render a tracked template and record the render statistics."""
+        template = track_template_.template
+        stats = self._render_stats.get(template)
+        if stats is None:
+            stats = self._render_stats[template] = TrackTemplateRenderStats()
+
+        start = time.perf_counter()
+        info = template.async_render_to_info(track_template_.variables)
+        stats.render_time += time.perf_counter() - start
+        stats.renders += 1
+        return info
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -857,6 +894,14 @@ class _TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if not info.state_change_is_read(
+                event.data[ATTR_ENTITY_ID],
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            ):
+                self._render_stats[template].skipped += 1
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -877,9 +922,7 @@ class _TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        self._info[template] = info = self._render_to_info(track_template_)
 
         try:
             result: Union[str, TemplateError] = info.result()
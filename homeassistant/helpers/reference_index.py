@@ -0,0 +1,71 @@
+"""Reverse index of the entities and devices referenced by entities."""
+from typing import Dict, Iterable, List, Set, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.loader import bind_hass
+
+DATA_REFERENCE_INDEX = "reference_index"
+
+
+class ReferenceIndex:
+    """Map entities and devices to the entities that reference them.
+
+    Integrations like automation, script and scene keep their references in
+    the index while their entities are added to hass, so looking up what
+    references an entity or device does not require scanning all of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._entities: Dict[str, Set[str]] = {}
+        self._devices: Dict[str, Set[str]] = {}
+        self._references: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_id: str,
+        entities: Iterable[str],
+        devices: Iterable[str] = (),
+    ) -> None:
+        """Index the entities and devices referenced by an entity."""
+        self.async_remove(entity_id)
+        references = (set(entities), set(devices))
+        self._references[entity_id] = references
+        for index, referenced in zip((self._entities, self._devices), references):
+            for item in referenced:
+                index.setdefault(item, set()).add(entity_id)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the references of an entity from the index."""
+        references = self._references.pop(entity_id, None)
+        if references is None:
+            return
+        for index, referenced in zip((self._entities, self._devices), references):
+            for item in referenced:
+                referencing = index[item]
+                referencing.discard(entity_id)
+                if not referencing:
+                    del index[item]
+
+    @callback
+    def with_entity(self, entity_id: str) -> List[str]:
+        """Return the entities that reference the entity."""
+        return list(self._entities.get(entity_id, ()))
+
+    @callback
+    def with_device(self, device_id: str) -> List[str]:
+        """Return the entities that reference the device."""
+        return list(self._devices.get(device_id, ()))
+
+
+@callback
+@bind_hass
+def async_get_reference_index(hass: HomeAssistant, domain: str) -> ReferenceIndex:
+    """Return the reference index of a domain."""
+    indexes: Dict[str, ReferenceIndex] = hass.data.setdefault(DATA_REFERENCE_INDEX, {})
+    index = indexes.get(domain)
+    if index is None:
+        index = indexes[domain] = ReferenceIndex()
+    return index
@@ -1,13 +1,17 @@
 """Helpers to execute scripts."""
 import asyncio
+from collections import deque
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
+import json
 import logging
+from time import monotonic
 from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
@@ -67,6 +71,7 @@ from homeassistant.helpers.event import (
     async_call_later,
     async_track_template_result,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.script_variables import ScriptVariables
 from homeassistant.helpers.trigger import (
     async_initialize_triggers,
@@ -103,6 +108,8 @@ ATTR_MODE = "mode"
 
 DATA_SCRIPTS = "helpers.script"
 
+DEFAULT_TRACE_SIZE = 5
+
 _LOGGER = logging.getLogger(__name__)
 
 _LOG_EXCEPTION = logging.ERROR + 1
@@ -202,6 +209,58 @@ class _StopScript(Exception):
     """Throw if script needs to stop."""
 
 
+class _TraceJSONEncoder(JSONEncoder):
+    """JSONEncoder that falls back to the string of unsupported objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert objects, using their string if not supported."""
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class ScriptTrace:
+    """Trace of a script run.
+
+    Tracing stays on for every run, so recording only keeps references and
+    timings; variables and errors are serialized when the trace is read.
+    """
+
+    __slots__ = ("context", "variables", "start", "finish", "condition", "steps")
+
+    def __init__(self, context: Optional[Context], variables: Dict[str, Any]):
+        """Initialize the trace."""
+        self.context = context
+        self.variables = dict(variables)
+        self.start = utcnow()
+        self.finish: Optional[datetime] = None
+        self.condition: Optional[bool] = None
+        self.steps: List[
+            Tuple[int, str, float, Optional[BaseException], Optional[bool]]
+        ] = []
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the trace as a JSON serializable dictionary."""
+        return {
+            "context_id": None if self.context is None else self.context.id,
+            "start": self.start.isoformat(),
+            "finish": None if self.finish is None else self.finish.isoformat(),
+            "condition": self.condition,
+            "variables": json.loads(json.dumps(self.variables, cls=_TraceJSONEncoder)),
+            "steps": [
+                {
+                    "position": position,
+                    "action": action_type,
+                    "duration": duration,
+                    "error": None if error is None else str(error) or repr(error),
+                    "result": result,
+                }
+                for position, action_type, duration, error, result in self.steps
+            ],
+        }
+
+
 class _ScriptRun:
     """Manage Script sequence run."""
 
@@ -212,12 +271,16 @@ class _ScriptRun:
         variables: Dict[str, Any],
         context: Optional[Context],
         log_exceptions: bool,
+        condition: Optional[bool] = None,
     ) -> None:
         self._hass = hass
         self._script = script
         self._variables = variables
         self._context = context
         self._log_exceptions = log_exceptions
+        self._trace = script.async_add_trace(variables, context)
+        self._trace.condition = condition
+        self._step_result: Optional[bool] = None
         self._step = -1
         self._action: Optional[Dict[str, Any]] = None
         self._stop = asyncio.Event()
@@ -250,18 +313,28 @@ class _ScriptRun:
             self._finish()
 
     async def _async_step(self, log_exceptions):
+        action_type = cv.determine_script_action(self._action)
+        error = None
+        self._step_result = None
+        start = monotonic()
         try:
-            await getattr(
-                self, f"_async_{cv.determine_script_action(self._action)}_step"
-            )()
-        except Exception as ex:
-            if not isinstance(ex, (_StopScript, asyncio.CancelledError)) and (
+            await getattr(self, f"_async_{action_type}_step")()
+        except _StopScript:
+            raise
+        except (Exception, asyncio.CancelledError) as ex:
+            error = ex
+            if not isinstance(ex, asyncio.CancelledError) and (
                 self._log_exceptions or log_exceptions
             ):
                 self._log_exception(ex)
             raise
+        finally:
+            self._trace.steps.append(
+                (self._step, action_type, monotonic() - start, error, self._step_result)
+            )
 
     def _finish(self):
+        self._trace.finish = utcnow()
         self._script._runs.remove(self)  # pylint: disable=protected-access
         if not self._script.is_running:
             self._script.last_action = None
@@ -519,7 +592,7 @@ class _ScriptRun:
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
         cond = await self._async_get_condition(self._action)
-        check = cond(self._hass, self._variables)
+        check = self._step_result = cond(self._hass, self._variables)
         self._log("Test condition %s: %s", self._script.last_action, check)
         if not check:
             raise _StopScript
@@ -796,6 +869,7 @@ class Script:
         log_exceptions: bool = True,
         top_level: bool = True,
         variables: Optional[ScriptVariables] = None,
+        trace_size: int = DEFAULT_TRACE_SIZE,
     ) -> None:
         """Initialize the script."""
         all_scripts = hass.data.get(DATA_SCRIPTS)
@@ -829,6 +903,8 @@ class Script:
         self.last_triggered: Optional[datetime] = None
 
         self._runs: List[_ScriptRun] = []
+        # Nested scripts are traced as a step of their top level script.
+        self.traces: Deque[ScriptTrace] = deque(maxlen=trace_size if top_level else 0)
         self.max_runs = max_runs
         self._max_exceeded = max_exceeded
         if script_mode == SCRIPT_MODE_QUEUED:
@@ -970,8 +1046,13 @@ class Script:
         run_variables: Optional[_VarsType] = None,
         context: Optional[Context] = None,
         started_action: Optional[Callable[..., Any]] = None,
+        condition: Optional[bool] = None,
     ) -> None:
-        """Run script."""
+        """Run script.
+
+        condition is recorded in the trace of the run: True when the caller
+        evaluated its conditions and they passed, None when there were none.
+        """
         if context is None:
             self._log(
                 "Running script requires passing in a context", level=logging.WARNING
@@ -1021,7 +1102,12 @@ class Script:
         else:
             cls = _QueuedScriptRun
         run = cls(
-            self._hass, self, cast(dict, variables), context, self._log_exceptions
+            self._hass,
+            self,
+            cast(dict, variables),
+            context,
+            self._log_exceptions,
+            condition,
         )
         self._runs.append(run)
         if started_action:
@@ -1036,6 +1122,15 @@ class Script:
             self._changed()
             raise
 
+    @callback
+    def async_add_trace(
+        self, variables: Dict[str, Any], context: Optional[Context]
+    ) -> ScriptTrace:
+        """Add the trace of a run, dropping the oldest one if full."""
+        trace = ScriptTrace(context, variables)
+        self.traces.append(trace)
+        return trace
+
     async def _async_stop(self, update_state):
         aws = [run.async_stop() for run in self._runs]
         if not aws:
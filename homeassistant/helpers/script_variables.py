@@ -14,6 +14,17 @@ class ScriptVariables:
         self.variables = variables
         self._has_template: Optional[bool] = None
 
+    def __eq__(self, other: Any) -> bool:
+        """Compare script variables with another."""
+        return isinstance(other, ScriptVariables) and self.variables == other.variables
+
+    def __hash__(self) -> int:
+        """Hash script variables consistently with comparing them.
+
+        Values may be unhashable containers, so only the names are hashed.
+        """
+        return hash(frozenset(self.variables))
+
     @callback
     def async_render(
         self,
@@ -1,5 +1,6 @@
 """Service calling related helpers."""
 import asyncio
+from collections import OrderedDict
 import dataclasses
 from functools import partial, wraps
 import logging
@@ -45,6 +46,7 @@ from homeassistant.helpers import (
     entity_registry,
     template,
 )
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType, HomeAssistantType, TemplateVarsType
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
@@ -68,6 +70,10 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+SERVICE_TARGET_CACHE = "service_target_cache"
+SERVICE_TARGET_CACHE_SIZE = 256
+
+GROUP_DOMAIN = "group"
 
 
 @dataclasses.dataclass
@@ -101,6 +107,15 @@ class SelectedEntities:
 
         _LOGGER.warning("Unable to find referenced %s", ", ".join(parts))
 
+    def copy(self) -> "SelectedEntities":
+        """Return a copy that can be modified without affecting this one."""
+        return SelectedEntities(
+            referenced=set(self.referenced),
+            indirectly_referenced=set(self.indirectly_referenced),
+            missing_devices=set(self.missing_devices),
+            missing_areas=set(self.missing_areas),
+        )
+
 
 @bind_hass
 def call_from_config(
@@ -267,7 +282,155 @@ async def async_extract_entity_ids(
 async def async_extract_referenced_entity_ids(
     hass: HomeAssistantType, service_call: ha.ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
-    """Extract referenced entity IDs from a service call."""
+    """Extract referenced entity IDs from a service call.
+
+    Resolved targets are cached until the registries or a group change.
+    """
+    try:
+        key = (
+            _target_key(service_call.data.get(ATTR_ENTITY_ID)),
+            _target_key(service_call.data.get(ATTR_DEVICE_ID)),
+            _target_key(service_call.data.get(ATTR_AREA_ID)),
+            expand_group,
+        )
+        hash(key)
+    except TypeError:
+        # Not a target produced by the service schemas, don't cache it
+        return await _async_resolve_referenced_entity_ids(
+            hass, service_call, expand_group
+        )
+
+    cache = _async_get_target_cache(hass)
+    selected = cache.get(key)
+
+    if selected is None:
+        if expand_group:
+            cache.async_watch_groups(service_call.data.get(ATTR_ENTITY_ID))
+        generation = cache.generation
+        selected = await _async_resolve_referenced_entity_ids(
+            hass, service_call, expand_group
+        )
+        # Don't store a result resolved before the cache was cleared
+        if generation == cache.generation:
+            cache.set(key, selected)
+
+    return selected.copy()
+
+
+def _target_key(value: Any) -> Any:
+    """Return a hashable key for a target value."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class _TargetCache:
+    """Least recently used cache of resolved service call targets."""
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._entries: "OrderedDict[Tuple[Any, ...], SelectedEntities]" = OrderedDict()
+        # Groups expanded by a cached target, their state changes are tracked
+        self._groups: Set[str] = set()
+        # Incremented every time the cache is cleared
+        self.generation = 0
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[SelectedEntities]:
+        """Return the cached target and mark it as recently used."""
+        selected = self._entries.get(key)
+        if selected is not None:
+            self._entries.move_to_end(key)
+        return selected
+
+    def set(self, key: Tuple[Any, ...], selected: SelectedEntities) -> None:
+        """Cache a target, evicting the least recently used one when full."""
+        self._entries[key] = selected
+        self._entries.move_to_end(key)
+        if len(self._entries) > SERVICE_TARGET_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached targets."""
+        self._entries.clear()
+        self.generation += 1
+
+    @ha.callback
+    def async_watch_groups(self, entity_ids: Any) -> None:
+        """Track the groups a target expands, including nested groups."""
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        elif not isinstance(entity_ids, list):
+            return
+
+        new_groups = set()
+        pending = [entity_id for entity_id in entity_ids if isinstance(entity_id, str)]
+        while pending:
+            entity_id = pending.pop().lower()
+            if (
+                not entity_id.startswith(f"{GROUP_DOMAIN}.")
+                or entity_id in self._groups
+                or entity_id in new_groups
+            ):
+                continue
+            new_groups.add(entity_id)
+            state = self._hass.states.get(entity_id)
+            if state is not None:
+                pending.extend(
+                    member
+                    for member in state.attributes.get(ATTR_ENTITY_ID, ())
+                    if isinstance(member, str)
+                )
+
+        if new_groups:
+            self._groups |= new_groups
+            async_track_state_change_event(
+                self._hass, new_groups, self._async_group_changed
+            )
+
+    @ha.callback
+    def _async_group_changed(self, event: ha.Event) -> None:
+        """Clear the cache when the members of a group change."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        if (
+            old_state is None
+            or new_state is None
+            or old_state.attributes.get(ATTR_ENTITY_ID)
+            != new_state.attributes.get(ATTR_ENTITY_ID)
+        ):
+            self.clear()
+
+
+@ha.callback
+def _async_get_target_cache(hass: HomeAssistantType) -> _TargetCache:
+    """Return the resolved target cache, creating it on first use."""
+    existing: Optional[_TargetCache] = hass.data.get(SERVICE_TARGET_CACHE)
+    if existing is not None:
+        return existing
+
+    cache = hass.data[SERVICE_TARGET_CACHE] = _TargetCache(hass)
+
+    @ha.callback
+    def _async_clear_cache(event: ha.Event) -> None:
+        """Clear the cache when a registry changes."""
+        cache.clear()
+
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, _async_clear_cache)
+
+    return cache
+
+
+async def _async_resolve_referenced_entity_ids(
+    hass: HomeAssistantType, service_call: ha.ServiceCall, expand_group: bool
+) -> SelectedEntities:
+    """Resolve the entity IDs referenced by a service call."""
     entity_ids = service_call.data.get(ATTR_ENTITY_ID)
     device_ids = service_call.data.get(ATTR_DEVICE_ID)
     area_ids = service_call.data.get(ATTR_AREA_ID)
@@ -333,24 +496,28 @@ async def async_extract_referenced_entity_ids(
         for area_id in area_lookup:
             if area_id not in area_reg.areas:
                 selected.missing_areas.add(area_id)
-                continue
 
-        # Find entities tied to an area
-        for entity_entry in ent_reg.entities.values():
-            if entity_entry.area_id in area_lookup:
+            # Find entities tied to an area
+            for entity_entry in entity_registry.async_entries_for_area(
+                ent_reg, area_id
+            ):
                 selected.indirectly_referenced.add(entity_entry.entity_id)
 
-        # Find devices for this area
-        for device_entry in dev_reg.devices.values():
-            if device_entry.area_id in area_lookup:
+            # Find devices for this area
+            for device_entry in device_registry.async_entries_for_area(
+                dev_reg, area_id
+            ):
                 picked_devices.add(device_entry.id)
 
     if not picked_devices:
         return selected
 
-    for entity_entry in ent_reg.entities.values():
-        if not entity_entry.area_id and entity_entry.device_id in picked_devices:
-            selected.indirectly_referenced.add(entity_entry.entity_id)
+    for device_id in picked_devices:
+        for entity_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
+        ):
+            if not entity_entry.area_id:
+                selected.indirectly_referenced.add(entity_entry.entity_id)
 
     return selected
 
@@ -510,11 +677,7 @@ async def entity_service_call(
             else:
                 assert all_referenced is not None
                 entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
+                    _referenced_platform_entities(platform, all_referenced)
                 )
 
     elif target_all_entities:
@@ -534,10 +697,7 @@ async def entity_service_call(
 
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+            for entity in _referenced_platform_entities(platform, all_referenced):
 
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
@@ -612,6 +772,29 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+def _referenced_platform_entities(
+    platform: "EntityPlatform", all_referenced: Set[str]
+) -> List["Entity"]:
+    """Return the entities of a platform that are targeted by a service call.
+
+    The entities are ordered by entity ID, whichever way they are found.
+    """
+    entities = platform.entities
+
+    if len(all_referenced) < len(entities):
+        # Look up the targets instead of walking all entities of the platform
+        return [
+            entities[entity_id]
+            for entity_id in sorted(all_referenced)
+            if entity_id in entities
+        ]
+
+    return sorted(
+        (entity for entity in entities.values() if entity.entity_id in all_referenced),
+        key=lambda entity: entity.entity_id,
+    )
+
+
 async def _handle_entity_call(
     hass: HomeAssistantType,
     entity: "Entity",
@@ -1,9 +1,10 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -15,6 +16,10 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+# Journals are compacted once they hold more changes than this or than
+# the number of items in the store, whichever is larger.
+JOURNAL_MIN_COMPACT_CHANGES = 100
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -72,8 +77,27 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        compact: bool = False,
+        journal: Optional[Dict[str, str]] = None,
+        track_changes: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Compact stores are written without indentation. They are loaded the
+        same way as indented stores, so a store can switch between the two.
+
+        Journaled stores hold a dict of lists of items. The journal maps the
+        name of each list to the key that identifies its items. Saves append
+        the changed items to a journal file, which is compacted into the main
+        file once it grows as large as the data. Every compaction increases the
+        generation stored in the main file, journal records of an older
+        generation are left over from an interrupted compaction and ignored.
+
+        With track_changes, the owner of a journaled store marks the items it
+        adds, changes or removes with async_mark_changed. Saves then only
+        serialize the marked items and the ones added since the previous write
+        instead of every item.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,12 +108,29 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._compact = compact
+        self._journal = journal
+        # Serialized items and remaining data as found on disk
+        self._journal_items: Optional[Dict[str, Dict[str, str]]] = None
+        self._journal_rest: Optional[str] = None
+        self._journal_changes = 0
+        self._journal_generation: Optional[int] = None
+        self._track_changes = track_changes
+        # Items marked as changed since the last write, and those of the write
+        # in progress
+        self._marked: Dict[str, Set[Any]] = {}
+        self._writing_marked: Dict[str, Set[Any]] = {}
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> Union[Dict, List, None]:
         """Load data.
 
@@ -121,9 +162,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -165,6 +204,11 @@ class Store:
             self.hass, delay, self._async_callback_delayed_write
         )
 
+    @callback
+    def async_mark_changed(self, name: str, item_id: Any) -> None:
+        """Mark an item of a journaled list as changed since the last save."""
+        self._marked.setdefault(name, set()).add(item_id)
+
     @callback
     def _async_ensure_final_write_listener(self):
         """Ensure that we write if we quit before delay has passed."""
@@ -217,6 +261,7 @@ class Store:
                 data["data"] = data.pop("data_func")()
 
             self._data = None
+            self._writing_marked, self._marked = self._marked, {}
 
             try:
                 await self.hass.async_add_executor_job(
@@ -225,13 +270,234 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> Dict:
+        """Load the data and replay the journal."""
+        data = cast(Dict[str, Any], json_util.load_json(self.path))
+
+        if self._journal is None or data == {}:
+            return data
+
+        try:
+            with open(self.journal_path, encoding="utf-8") as fdesc:
+                lines = fdesc.readlines()
+        except FileNotFoundError:
+            lines = []
+        except OSError as err:
+            _LOGGER.error("Error reading journal for %s: %s", self.key, err)
+            lines = []
+
+        stored = data["data"]
+        generation = data.get("generation", 0)
+        changes = 0
+        complete = True
+
+        if lines:
+            try:
+                items = {
+                    name: {item[key]: item for item in stored.get(name, [])}
+                    for name, key in self._journal.items()
+                }
+            except (AttributeError, KeyError, TypeError):
+                _LOGGER.error("Unable to apply the journal of %s", self.key)
+                return data
+
+            offset = 0
+            for line in lines:
+                try:
+                    if not line.endswith("\n"):
+                        raise ValueError
+                    record = json.loads(line)
+                except ValueError:
+                    # The last write was interrupted
+                    _LOGGER.warning(
+                        "Ignoring incomplete journal entry for %s", self.key
+                    )
+                    complete = self._truncate_journal(offset)
+                    break
+                offset += len(line.encode("utf-8"))
+
+                if (
+                    record["version"] != data["version"]
+                    or record.get("generation", 0) != generation
+                ):
+                    continue
+
+                for name, item_id, item in record["changes"]:
+                    if name not in items:
+                        continue
+                    if item is None:
+                        items[name].pop(item_id, None)
+                    else:
+                        items[name][item_id] = item
+                    changes += 1
+
+            for name, name_items in items.items():
+                stored[name] = list(name_items.values())
+
+        self._journal_generation = generation
+        if data["version"] == self.version and complete:
+            self._set_journal_snapshot(stored)
+            self._journal_changes = changes
+
+        return data
+
+    def _truncate_journal(self, offset: int) -> bool:
+        """Cut an incomplete record off the journal.
+
+        Returns False if that failed and the next write needs to compact the
+        journal instead of appending to it.
+        """
+        try:
+            os.truncate(self.journal_path, offset)
+        except OSError as err:
+            _LOGGER.error("Error truncating journal for %s: %s", self.key, err)
+            self._journal_items = None
+            return False
+        return True
+
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
+        if self._journal is not None and self._write_journal(data):
+            return
+
+        if self._journal is not None:
+            if self._journal_generation is None:
+                on_disk = cast(Dict[str, Any], json_util.load_json(path))
+                self._journal_generation = int(on_disk.get("generation", 0))
+            self._journal_generation += 1
+            data = {**data, "generation": self._journal_generation}
+            # Until the full write succeeds the marked changes are not on disk
+            self._journal_items = None
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
+
+        if self._journal is None:
+            return
+
+        self._set_journal_snapshot(data["data"])
+        self._journal_changes = 0
+        try:
+            os.unlink(self.journal_path)
+        except FileNotFoundError:
+            pass
+
+    def _dump_item(self, item: Any) -> str:
+        """Serialize an item of a journaled store."""
+        return json.dumps(item, separators=(",", ":"), cls=self._encoder)
+
+    def _set_journal_snapshot(self, stored: Dict) -> None:
+        """Remember the items that are on disk."""
+        assert self._journal is not None
+        try:
+            self._journal_items = {
+                name: {
+                    item[key]: self._dump_item(item) for item in stored.get(name, [])
+                }
+                for name, key in self._journal.items()
+            }
+            self._journal_rest = self._dump_item(
+                {
+                    key: value
+                    for key, value in stored.items()
+                    if key not in self._journal
+                }
+            )
+        except (AttributeError, KeyError, TypeError):
+            # Not a layout that can be journaled, always write in full
+            self._journal_items = None
+
+    def _write_journal(self, data: Dict) -> bool:
+        """Append the changed items to the journal.
+
+        Returns False if the data needs to be written in full instead.
+        """
+        assert self._journal is not None
+        stored = data["data"]
+
+        if self._journal_items is None:
+            return False
+
+        try:
+            rest = self._dump_item(
+                {
+                    key: value
+                    for key, value in stored.items()
+                    if key not in self._journal
+                }
+            )
+            if rest != self._journal_rest:
+                return False
+
+            new_items: Dict[str, Dict[str, str]] = {}
+            changes: List[List[Any]] = []
+            total = 0
+
+            for name, key in self._journal.items():
+                old = self._journal_items[name]
+                new = new_items[name] = {}
+                marked = self._writing_marked.get(name, set())
+                for item in stored.get(name, []):
+                    item_id = item[key]
+                    if self._track_changes and item_id not in marked and item_id in old:
+                        new[item_id] = old[item_id]
+                        continue
+                    dumped = new[item_id] = self._dump_item(item)
+                    if old.get(item_id) != dumped:
+                        changes.append([name, item_id, item])
+                for item_id in old.keys() - new.keys():
+                    changes.append([name, item_id, None])
+                total += len(new)
+
+            if not changes:
+                return True
+
+            if self._journal_changes + len(changes) > max(
+                JOURNAL_MIN_COMPACT_CHANGES, total
+            ):
+                return False
+
+            record = self._dump_item(
+                {
+                    "version": data["version"],
+                    "generation": self._journal_generation,
+                    "changes": changes,
+                }
+            )
+        except TypeError:
+            # Let the full write report the serialization error
+            return False
+
+        _LOGGER.debug(
+            "Appending %s changes for %s to %s",
+            len(changes),
+            self.key,
+            self.journal_path,
+        )
+
+        try:
+            fdesc = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fdesc, f"{record}\n".encode())
+            finally:
+                os.close(fdesc)
+        except OSError as err:
+            # The record may be partly written, compact on the next write
+            self._journal_items = None
+            raise json_util.WriteError(err) from err
+
+        self._journal_items = new_items
+        self._journal_changes += len(changes)
+        return True
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -246,3 +512,12 @@ class Store:
             await self.hass.async_add_executor_job(os.unlink, self.path)
         except FileNotFoundError:
             pass
+
+        if self._journal is None:
+            return
+
+        self._journal_items = None
+        try:
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+        except FileNotFoundError:
+            pass
@@ -1,23 +1,25 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 from ast import literal_eval
-import asyncio
 import base64
 import collections.abc
 from datetime import datetime, timedelta
 from functools import partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
-from operator import attrgetter
 import random
 import re
-from typing import Any, Dict, Generator, Iterable, Optional, Type, Union
+import time
+from typing import Any, Dict, Generator, Iterable, Optional, Set, Type, Union
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
-from jinja2.sandbox import ImmutableSandboxedEnvironment
+from jinja2.sandbox import ImmutableSandboxedEnvironment, safe_range
 from jinja2.utils import Namespace  # type: ignore
 import voluptuous as vol
 
@@ -28,25 +30,39 @@ from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     LENGTH_METERS,
     STATE_UNKNOWN,
+    __version__,
+)
+from homeassistant.core import (
+    CoreState,
+    State,
+    callback,
+    split_entity_id,
+    valid_entity_id,
 )
-from homeassistant.core import State, callback, split_entity_id, valid_entity_id
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import location as loc_helper
 from homeassistant.helpers.typing import HomeAssistantType, TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util import convert, dt as dt_util, location as loc_util
 from homeassistant.util.async_ import run_callback_threadsafe
-from homeassistant.util.thread import ThreadWithException
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs, no-warn-return-any
 
 _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
+_JINJA_VERSION: str = getattr(jinja2, "__version__")
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
+_ENVIRONMENT_BOUNDED = "template.environment_bounded"
+_BYTECODE_CACHE = "template.bytecode_cache"
+_TEMPLATE_STATES = "template.states"
+
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+BYTECODE_SAVE_DELAY = 10
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -56,20 +72,25 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Maps the collectable state attributes to the State fields they read
 _COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+    "state": ("state",),
+    "attributes": ("attributes",),
+    "last_changed": ("last_changed",),
+    "last_updated": ("last_updated",),
+    "context": ("context",),
+    "domain": (),
+    "object_id": (),
+    "name": ("attributes",),
 }
+_STATE_FIELDS_ALL = ("state", "attributes", "last_changed", "last_updated", "context")
 
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 
+# Number of render steps between two deadline checks of a bounded render
+RENDER_STEPS_PER_CHECK = 1000
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -203,6 +224,7 @@ class RenderInfo:
         self.domains = set()
         self.domains_lifecycle = set()
         self.entities = set()
+        self.entity_fields: Dict[str, Set[str]] = {}
         self.rate_limit = None
         self.has_time = False
 
@@ -224,6 +246,39 @@ class RenderInfo:
         """Template should re-render if the entity is added or removed with domains watched."""
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def collect_entity(self, entity_id: str, fields: Iterable[str]) -> None:
+        """Collect an entity and the fields of its state that were read."""
+        self.entities.add(entity_id)
+        read_fields = self.entity_fields.get(entity_id)
+        if read_fields is None:
+            self.entity_fields[entity_id] = set(fields)
+        else:
+            read_fields.update(fields)
+
+    def state_change_is_read(
+        self, entity_id: str, old_state: Optional[State], new_state: Optional[State]
+    ) -> bool:
+        """Return if a state change touches anything the render depended on.
+
+        Entities that were only seen while iterating over a domain or all
+        states, or that were added or removed, always count as read.
+        """
+        read_fields = self.entity_fields.get(entity_id)
+        if (
+            read_fields is None
+            or self.exception is not None
+            or old_state is None
+            or new_state is None
+            or self.all_states
+            or split_entity_id(entity_id)[0] in self.domains
+        ):
+            return True
+
+        return any(
+            getattr(old_state, field) != getattr(new_state, field)
+            for field in read_fields
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -401,8 +456,11 @@ class Template:
 
         This is intended to check for expensive templates
         that will make the system unstable.  The template
-        is rendered in the executor to ensure it does not
-        tie up the event loop.
+        is rendered with a step budget that checks the
+        deadline cooperatively, so a render that takes too
+        long is aborted without the need for a thread.
+        The template is rendered in the event loop, so it
+        can use the same state caches as any other render.
 
         This function is not a security control and is only
         intended to be used as a safety check when testing
@@ -415,32 +473,31 @@ class Template:
         if self.is_static:
             return False
 
-        compiled = self._compiled or self._ensure_compiled()
+        self.ensure_valid()
 
-        if variables is not None:
-            kwargs.update(variables)
+        env = self.hass.data.get(_ENVIRONMENT_BOUNDED)
+        if env is None:
+            env = self.hass.data[_ENVIRONMENT_BOUNDED] = BoundedTemplateEnvironment(
+                self.hass
+            )
 
-        finish_event = asyncio.Event()
+        compiled = env.template_from_code(self._compiled_code)
 
-        def _render_template():
-            try:
-                compiled.render(kwargs)
-            except TimeoutError:
-                pass
-            finally:
-                run_callback_threadsafe(self.hass.loop, finish_event.set)
+        if variables is not None:
+            kwargs.update(variables)
 
+        start = time.monotonic()
         try:
-            template_render_thread = ThreadWithException(target=_render_template)
-            template_render_thread.start()
-            await asyncio.wait_for(finish_event.wait(), timeout=timeout)
-        except asyncio.TimeoutError:
-            template_render_thread.raise_exc(TimeoutError)
+            env.async_render_with_deadline(compiled, kwargs, timeout)
+        except RenderTimeout:
             return True
-        finally:
-            template_render_thread.join()
+        except Exception:  # pylint: disable=broad-except
+            # Errors are reported when the template is actually rendered
+            pass
 
-        return False
+        # A single operation that is not counted as a step can't be aborted,
+        # but a render that ran past the timeout is still reported
+        return time.monotonic() - start > timeout
 
     @callback
     def async_render_to_info(
@@ -658,18 +715,21 @@ class TemplateState(State):
         self._state = state
         self._collect = collect
 
-    def _collect_state(self):
+    def _collect_state(self, fields=_STATE_FIELDS_ALL):
         if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            self._hass.data[_RENDER_INFO].collect_entity(self._state.entity_id, fields)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item):
         """Return a property as an attribute for jinja."""
-        if item in _COLLECTABLE_STATE_ATTRIBUTES:
+        fields = _COLLECTABLE_STATE_ATTRIBUTES.get(item)
+        if fields is not None:
             # _collect_state inlined here for performance
             if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+                self._hass.data[_RENDER_INFO].collect_entity(
+                    self._state.entity_id, fields
+                )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._state.entity_id
@@ -688,55 +748,55 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["state"])
         return self._state.state
 
     @property
     def attributes(self):
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["attributes"])
         return self._state.attributes
 
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["last_changed"])
         return self._state.last_changed
 
     @property
     def last_updated(self):
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["last_updated"])
         return self._state.last_updated
 
     @property
     def context(self):
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["context"])
         return self._state.context
 
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["domain"])
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["object_id"])
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["name"])
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_state(("state", "attributes"))
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -753,13 +813,32 @@ class TemplateState(State):
 def _collect_state(hass: HomeAssistantType, entity_id: str) -> None:
     entity_collect = hass.data.get(_RENDER_INFO)
     if entity_collect is not None:
-        entity_collect.entities.add(entity_id)
+        entity_collect.collect_entity(entity_id, _STATE_FIELDS_ALL)
 
 
 def _state_generator(hass: HomeAssistantType, domain: Optional[str]) -> Generator:
-    """State generator for a domain or all states."""
-    for state in sorted(hass.states.async_all(domain), key=attrgetter("entity_id")):
-        yield TemplateState(hass, state, collect=False)
+    """State generator for a domain or all states.
+
+    The TemplateState wrappers are kept between renders and are only
+    replaced once the state they wrap has changed.
+    """
+    # pylint: disable=protected-access
+    wrappers = hass.data.get(_TEMPLATE_STATES)
+    if wrappers is None or len(wrappers) > 2 * hass.states.async_entity_ids_count():
+        # Drop the wrappers of removed entities
+        wrappers = hass.data[_TEMPLATE_STATES] = {
+            entity_id: wrapper
+            for entity_id, wrapper in (wrappers or {}).items()
+            if hass.states.get(entity_id) is wrapper._state
+        }
+
+    for state in hass.states.async_all_sorted(domain):
+        wrapper = wrappers.get(state.entity_id)
+        if wrapper is None or wrapper._state is not state:
+            wrapper = wrappers[state.entity_id] = TemplateState(
+                hass, state, collect=False
+            )
+        yield wrapper
 
 
 def _get_state_if_valid(
@@ -1289,6 +1368,90 @@ def urlencode(value):
     return urllib_urlencode(value).encode("utf-8")
 
 
+@bind_hass
+async def async_load_bytecode_cache(hass: HomeAssistantType) -> None:
+    """Load the compiled templates that were stored by a previous run."""
+    cache = TemplateBytecodeCache(hass)
+    await cache.async_load()
+    hass.data[_BYTECODE_CACHE] = cache
+
+
+class TemplateBytecodeCache:
+    """Persist the code of compiled templates across restarts.
+
+    Entries are keyed by a hash of the template source and are only
+    valid for the Jinja, Home Assistant and Python bytecode version that
+    produced them. Stored code is decoded when a template asks for it.
+    Once startup has finished only entries used during the current run
+    are written back.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self._store = hass.helpers.storage.Store(
+            BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY, compact=True
+        )
+        self._fingerprint = f"{_JINJA_VERSION}-{__version__}-{MAGIC_NUMBER.hex()}"
+        self._stored: Dict[str, str] = {}
+        self._used: Dict[str, str] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load the stored entries."""
+        data = await self._store.async_load()
+
+        if data is not None and data["fingerprint"] == self._fingerprint:
+            self._stored = data["templates"]
+
+    def get(self, source: str) -> Any:
+        """Return the stored code for a template source, if any."""
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        encoded = self._used.get(key) or self._stored.pop(key, None)
+
+        if encoded is None:
+            return None
+
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (ValueError, EOFError, TypeError):
+            return None
+
+        if key not in self._used:
+            self._used[key] = encoded
+            self._schedule_save()
+
+        return code
+
+    def set(self, source: str, code: Any) -> None:
+        """Store the code of a newly compiled template."""
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self._used[key] = base64.b64encode(marshal.dumps(code)).decode("ascii")
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Schedule a save from any thread."""
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the entries used in this run."""
+        self._save_scheduled = False
+        self._store.async_delay_save(self._data_to_save, BYTECODE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return data of the bytecode cache to store in a file."""
+        templates = dict(self._used)
+        # Templates that were not rendered yet may still be used during startup
+        if self.hass.state != CoreState.running:
+            templates = {**self._stored, **templates}
+        return {"fingerprint": self._fingerprint, "templates": templates}
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -1406,9 +1569,130 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         cached = self.template_cache.get(source)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            bytecode_cache = (
+                self.hass.data.get(_BYTECODE_CACHE) if self.hass is not None else None
+            )
+            if bytecode_cache is not None:
+                cached = bytecode_cache.get(source)
+            if cached is None:
+                cached = super().compile(source)
+                if bytecode_cache is not None:
+                    bytecode_cache.set(source, cached)
+            self.template_cache[source] = cached
 
         return cached
 
 
+class RenderTimeout(Exception):
+    """Raised when a bounded render exceeds its deadline."""
+
+
+class _BoundedRange:
+    """A range that counts every produced item as a render step."""
+
+    __slots__ = ("_env", "_range")
+
+    def __init__(self, env, rng):
+        """Initialize the bounded range."""
+        self._env = env
+        self._range = rng
+
+    def __iter__(self):
+        """Iterate over the range, counting each item."""
+        step = self._env.step
+        for item in self._range:
+            step()
+            yield item
+
+    def __reversed__(self):
+        """Iterate over the range in reverse, counting each item."""
+        step = self._env.step
+        for item in reversed(self._range):
+            step()
+            yield item
+
+    def __len__(self):
+        """Return the length of the range."""
+        return len(self._range)
+
+    def __contains__(self, item):
+        """Return if item is part of the range."""
+        return item in self._range
+
+    def __getitem__(self, index):
+        """Return an item or a bounded slice of the range."""
+        value = self._range[index]
+        if isinstance(value, range):
+            return _BoundedRange(self._env, value)
+        return value
+
+    def __repr__(self):
+        """Representation of the bounded range."""
+        return repr(self._range)
+
+
+class BoundedTemplateEnvironment(TemplateEnvironment):
+    """Template environment that aborts renders exceeding a deadline.
+
+    Every sandboxed call, attribute lookup, item lookup and every item
+    produced by range() counts as a step. The deadline is checked once
+    every RENDER_STEPS_PER_CHECK steps, which bounds long renders without
+    running them in a separate thread.
+    """
+
+    def __init__(self, hass):
+        """Initialise bounded template environment."""
+        super().__init__(hass)
+        self.globals["range"] = self._bounded_range
+        self._deadline: Optional[float] = None
+        self._steps_to_check = RENDER_STEPS_PER_CHECK
+
+    def _bounded_range(self, *args):
+        """Return a range that counts its iterations as steps."""
+        return _BoundedRange(self, safe_range(*args))
+
+    def template_from_code(self, code):
+        """Bind compiled template code to this environment."""
+        return jinja2.Template.from_code(self, code, self.globals, None)
+
+    def step(self):
+        """Count a render step and abort the render if it is overdue."""
+        self._steps_to_check -= 1
+        if self._steps_to_check:
+            return
+        self._steps_to_check = RENDER_STEPS_PER_CHECK
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise RenderTimeout
+
+    @callback
+    def async_render_with_deadline(self, compiled, variables, timeout):
+        """Render a template compiled for this environment within timeout.
+
+        This method must be run in the event loop.
+        """
+        self._deadline = time.monotonic() + timeout
+        self._steps_to_check = RENDER_STEPS_PER_CHECK
+        try:
+            return compiled.render(variables)
+        finally:
+            self._deadline = None
+
+    def getitem(self, obj, argument):
+        """Subscribe an object from sandboxed code."""
+        self.step()
+        return super().getitem(obj, argument)
+
+    def getattr(self, obj, attribute):
+        """Subscribe an object from sandboxed code and prefer the attribute."""
+        self.step()
+        return super().getattr(obj, attribute)
+
+    def call(  # pylint: disable=no-self-argument
+        __self, __context, __obj, *args, **kwargs
+    ):
+        """Call an object from sandboxed code."""
+        __self.step()
+        return super().call(__context, __obj, *args, **kwargs)
+
+
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -11,6 +11,7 @@ import json
 import logging
 import pathlib
 import sys
+from timeit import default_timer as timer
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
@@ -25,6 +26,7 @@ from typing import (
     cast,
 )
 
+from homeassistant.generated.manifests import MANIFESTS, MANIFESTS_VERSION
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
@@ -40,6 +42,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -52,6 +55,12 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+# Version of the generated manifest index this loader understands
+MANIFESTS_INDEX_VERSION = 1
+
+CUSTOM_COMPONENTS_STORAGE_KEY = "core.custom_components"
+CUSTOM_COMPONENTS_STORAGE_VERSION = 1
+
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Dict:
     """Generate a manifest from a legacy module."""
@@ -77,33 +86,84 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    store = Store(
+        hass,
+        CUSTOM_COMPONENTS_STORAGE_VERSION,
+        CUSTOM_COMPONENTS_STORAGE_KEY,
     )
+    cached = await store.async_load() or {}
 
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        )
+    manifests = await hass.async_add_executor_job(
+        _get_custom_manifests, custom_components.__path__, cached
     )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+    if manifests != cached:
+        await store.async_save(manifests)
+
+    integrations: Dict[str, Integration] = {}
+    for manifest_path, entry in manifests.items():
+        # The first path providing a domain wins, like it does on import
+        if entry["manifest"]["domain"] in integrations:
+            continue
+        comp_path = pathlib.Path(manifest_path).parent
+        integration = Integration(
+            hass,
+            f"{custom_components.__name__}.{comp_path.name}",
+            comp_path,
+            dict(entry["manifest"]),
+        )
+        integrations[integration.domain] = integration
+
+    return integrations
+
+
+def _get_custom_manifests(
+    paths: List[str], cached: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Return the manifests of the custom integrations by manifest path.
+
+    Manifests are only read when their modification time or size differs
+    from the cached index.
+    """
+    manifests = {}
+
+    for path in paths:
+        for entry in pathlib.Path(path).iterdir():
+            manifest_path = entry / "manifest.json"
+            try:
+                stat = manifest_path.stat()
+            except OSError:
+                continue
+
+            key = str(manifest_path)
+            info = cached.get(key)
+
+            if (
+                info is None
+                or info["mtime"] != stat.st_mtime
+                or (info["size"] != stat.st_size)
+            ):
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s",
+                        manifest_path,
+                        err,
+                    )
+                    continue
+                info = {
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    "manifest": manifest,
+                }
+
+            manifests[key] = info
+
+    return manifests
 
 
 async def async_get_custom_components(
@@ -413,7 +473,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -426,7 +486,19 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(f"{self.pkg_path}.{platform_name}")
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module and record how long the import took.
+
+        The time includes the modules imported while importing it.
+        """
+        imported = name in sys.modules
+        start = timer()
+        module = importlib.import_module(name)
+        if not imported:
+            self.hass.data.setdefault(DATA_IMPORT_TIMES, {})[name] = timer() - start
+        return module
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -469,9 +541,20 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    if MANIFESTS_VERSION == MANIFESTS_INDEX_VERSION and domain in MANIFESTS:
+        # Built-in integrations are resolved from the index generated by
+        # hassfest so no manifest has to be read from disk. An index of
+        # another version is ignored and the manifests are read instead.
+        integration = Integration(
+            hass,
+            f"{components.__name__}.{domain}",
+            pathlib.Path(components.__path__[0]) / domain,  # type: ignore
+            dict(MANIFESTS[domain]),
+        )
+    else:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -6,12 +6,23 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+from types import SimpleNamespace
 from typing import Callable, Dict, TypeVar
 
-from homeassistant import core
+from homeassistant import core, loader
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers import (
+    area_registry,
+    device_registry,
+    entity,
+    entity_registry,
+    service,
+    storage,
+    template,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -323,6 +334,212 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+TEMPLATE_STATES_PATTERNS = [
+    "{{ states('sensor.temperature') }}",
+    "{{ states('sensor.temperature') | float > 20 }}",
+    "{{ is_state('light.kitchen', 'on') }}",
+    "{{ state_attr('light.kitchen', 'brightness') }}",
+    "{{ states.sensor.temperature.state }}",
+]
+
+
+def _setup_template_states(hass):
+    """Create the states used by the template benchmarks."""
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+
+
+@benchmark
+async def template_render_states(hass):
+    """Render 100k templates using the common states patterns."""
+    _setup_template_states(hass)
+    templates = [template.Template(tpl, hass) for tpl in TEMPLATE_STATES_PATTERNS]
+    size = len(templates)
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        templates[i % size].async_render()
+
+    return timer() - start
+
+
+@benchmark
+async def template_render_states_bounded(hass):
+    """Render 100k templates using the common states patterns with a deadline."""
+    _setup_template_states(hass)
+    env = template.BoundedTemplateEnvironment(hass)
+    compiled = [
+        env.template_from_code(env.compile(tpl)) for tpl in TEMPLATE_STATES_PATTERNS
+    ]
+    size = len(compiled)
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        env.async_render_with_deadline(compiled[i % size], {}, 10)
+
+    return timer() - start
+
+
+@benchmark
+async def template_render_domain_states(hass):
+    """Render a template iterating 3000 sensors 100 times."""
+    for idx in range(3000):
+        hass.states.async_set(f"sensor.power_{idx}", str(idx % 2))
+    tpl = template.Template(
+        "{{ states.sensor | selectattr('state', 'eq', '1') | list | count }}", hass
+    )
+
+    start = timer()
+
+    for idx in range(100):
+        # Change one state per render so the iteration cannot be cached
+        hass.states.async_set(f"sensor.power_{idx}", "2")
+        tpl.async_render()
+
+    return timer() - start
+
+
+@benchmark
+async def area_targeted_service_calls(hass):
+    """Resolve 10k area targeted service calls with 8000 registered entities."""
+    # pylint: disable=protected-access
+    area_reg = area_registry.AreaRegistry(hass)
+    dev_reg = device_registry.DeviceRegistry(hass)
+    ent_reg = entity_registry.EntityRegistry(hass)
+    dev_reg.devices = {}
+    dev_reg.deleted_devices = {}
+    ent_reg.entities = {}
+
+    for area_idx in range(50):
+        area = area_registry.AreaEntry(name=f"Area {area_idx}", id=f"area_{area_idx}")
+        area_reg.areas[area.id] = area
+
+    for dev_idx in range(2000):
+        device = device_registry.DeviceEntry(
+            id=f"device_{dev_idx}",
+            config_entries={f"config_entry_{dev_idx % 10}"},
+            area_id=f"area_{dev_idx % 50}",
+        )
+        dev_reg.devices[device.id] = device
+
+    for ent_idx in range(8000):
+        entry = entity_registry.RegistryEntry(
+            entity_id=f"light.light_{ent_idx}",
+            unique_id=str(ent_idx),
+            platform="benchmark",
+            device_id=f"device_{ent_idx % 2000}",
+            # Every fourth entity overrides the area of its device
+            area_id=f"area_{ent_idx % 50}" if ent_idx % 4 == 0 else None,
+        )
+        ent_reg.entities[entry.entity_id] = entry
+
+    dev_reg._rebuild_index()
+    ent_reg._rebuild_index()
+    hass.data[area_registry.DATA_REGISTRY] = area_reg
+    hass.data[device_registry.DATA_REGISTRY] = dev_reg
+    hass.data[entity_registry.DATA_REGISTRY] = ent_reg
+
+    calls = [
+        core.ServiceCall("light", "turn_on", {"area_id": f"area_{area_idx}"})
+        for area_idx in range(50)
+    ]
+
+    start = timer()
+
+    for idx in range(10 ** 4):
+        await service.async_extract_referenced_entity_ids(hass, calls[idx % 50])
+
+    return timer() - start
+
+
+@benchmark
+async def entity_service_call_single_target(hass):
+    """Call a service targeting 1 of 1200 entities on 15 platforms 10k times."""
+
+    class BenchmarkEntity(entity.Entity):
+        """Entity that accepts the benchmarked service call."""
+
+        should_poll = False
+
+        async def async_turn_on(self):
+            """Turn the entity on."""
+
+    platforms = []
+    for platform_idx in range(15):
+        entities = {}
+        for idx in range(80):
+            ent = BenchmarkEntity()
+            ent.hass = hass
+            ent.entity_id = f"light.light_{platform_idx}_{idx}"
+            entities[ent.entity_id] = ent
+        platforms.append(SimpleNamespace(entities=entities))
+
+    call = core.ServiceCall("light", "turn_on", {"entity_id": "light.light_14_79"})
+
+    with TemporaryDirectory() as config_dir:
+        # Group expansion needs to be able to load the group integration
+        hass.config.config_dir = config_dir
+
+        start = timer()
+
+        for _ in range(10 ** 4):
+            await service.entity_service_call(hass, platforms, "async_turn_on", call)
+
+        return timer() - start
+
+
+@benchmark
+async def storage_indented(hass):
+    """Save and load an indented entity registry with 8000 entities 20 times."""
+    return await _storage_save_load(hass, False)
+
+
+@benchmark
+async def storage_compact(hass):
+    """Save and load a compact entity registry with 8000 entities 20 times."""
+    return await _storage_save_load(hass, True)
+
+
+async def _storage_save_load(hass, compact):
+    """Save and load an entity registry sized store."""
+    data = {
+        "entities": [
+            {
+                "config_entry_id": f"config_entry_{idx % 20}",
+                "device_id": f"device_{idx % 2000}",
+                "area_id": None,
+                "disabled_by": None,
+                "entity_id": f"sensor.sensor_{idx}",
+                "name": None,
+                "icon": None,
+                "platform": "benchmark",
+                "unique_id": f"unique_{idx}",
+                "capabilities": {"state_class": "measurement"},
+                "supported_features": 0,
+                "device_class": "temperature",
+                "unit_of_measurement": "°C",
+                "original_name": f"Sensor {idx}",
+                "original_icon": None,
+            }
+            for idx in range(8000)
+        ]
+    }
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        store = storage.Store(hass, 1, "core.entity_registry", compact=compact)
+
+        start = timer()
+
+        for _ in range(20):
+            await store.async_save(data)
+            await store.async_load()
+
+        return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -366,3 +583,63 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row)
+
+
+@benchmark
+async def resolve_integrations(hass):
+    """Resolve all built-in integrations 10 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.generated.manifests import MANIFESTS
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+
+        start = timer()
+
+        for _ in range(10):
+            hass.data.pop(loader.DATA_INTEGRATIONS, None)
+            await asyncio.gather(
+                *(loader.async_get_integration(hass, domain) for domain in MANIFESTS)
+            )
+
+        return timer() - start
+
+
+@benchmark
+async def filter_sensor_chains(hass):
+    """Run 100k samples through 100 filter chains with large windows."""
+    # pylint: disable=import-outside-toplevel
+    from copy import copy
+    from datetime import timedelta
+
+    from homeassistant.components.filter import sensor as filter_sensor
+
+    chains = [
+        [
+            filter_sensor.OutlierFilter(200, 2, f"sensor.source_{idx}", 4.0),
+            filter_sensor.LowPassFilter(1, 2, f"sensor.source_{idx}", 10),
+            filter_sensor.TimeSMAFilter(
+                timedelta(minutes=10), 2, f"sensor.source_{idx}", "last"
+            ),
+        ]
+        for idx in range(100)
+    ]
+    now = dt_util.utcnow()
+    samples = [
+        core.State(
+            "sensor.source",
+            str(20 + (sample % 17) / 3),
+            last_updated=now + timedelta(seconds=sample),
+        )
+        for sample in range(1000)
+    ]
+
+    start = timer()
+
+    for chain in chains:
+        for sample in samples:
+            state = sample
+            for filt in chain:
+                state = filt.filter_state(copy(state))
+
+    return timer() - start
@@ -1,9 +1,10 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+from contextlib import contextmanager
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,11 +21,142 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
+DATA_SETUP_IGNORE_AFTER_DEPENDENCIES = "setup_ignore_after_dependencies"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+class SetupTimeline:
+    """Timeline of the steps taken to set up integrations."""
+
+    def __init__(self, imports: Optional[Dict[str, float]] = None) -> None:
+        """Initialize the timeline.
+
+        Imports maps the integration modules that have been imported to the
+        time their import took.
+        """
+        self.start = timer()
+        self.steps: Dict[str, List[Tuple[str, float, float]]] = {}
+        self.waited_on: Dict[str, Set[str]] = {}
+        self.imports = imports if imports is not None else {}
+        self.parallelism: Dict[str, Any] = {}
+
+    @contextmanager
+    def track(self, domain: str, step: str) -> Iterator[None]:
+        """Record how long a setup step of an integration takes."""
+        start = timer()
+        try:
+            yield
+        finally:
+            self.steps.setdefault(domain, []).append((step, start, timer()))
+
+    def add_waited_on(self, domain: str, domains: Set[str]) -> None:
+        """Record the integrations an integration waited on."""
+        self.waited_on.setdefault(domain, set()).update(domains)
+
+    def _finished(self) -> Dict[str, float]:
+        """Return when each integration finished its last step."""
+        return {
+            domain: max(end for _, _, end in steps)
+            for domain, steps in self.steps.items()
+        }
+
+    def _chain(self, domain: str, finished: Dict[str, float]) -> List[str]:
+        """Return the chain of last finishing integrations a domain waited on."""
+        chain: List[str] = []
+        current: Optional[str] = domain
+        while current is not None and current not in chain:
+            chain.append(current)
+            waited_on = [
+                dep for dep in self.waited_on.get(current, ()) if dep in finished
+            ]
+            current = max(waited_on, key=finished.__getitem__) if waited_on else None
+        chain.reverse()
+        return chain
+
+    def critical_path(self) -> List[str]:
+        """Return the chain of integrations that determined the setup time."""
+        finished = self._finished()
+        if not finished:
+            return []
+        return self._chain(max(finished, key=finished.__getitem__), finished)
+
+    def _platform_imports(self) -> Iterator[Tuple[str, str, float]]:
+        """Return domain, platform and import time of imported platforms."""
+        for name, duration in self.imports.items():
+            for package in (loader.PACKAGE_BUILTIN, loader.PACKAGE_CUSTOM_COMPONENTS):
+                if name.startswith(f"{package}."):
+                    parts = name[len(package) + 1 :].split(".")
+                    if len(parts) == 2:
+                        yield parts[0], parts[1], duration
+                    break
+
+    def flame(self) -> List[str]:
+        """Return the steps in the folded stack format used by flame graphs.
+
+        Each integration is nested under the integrations it waited on, the
+        value is the duration of the step in milliseconds. Platform imports
+        are listed as a step of the integration providing the platform.
+        """
+        finished = self._finished()
+        lines = [
+            f"{';'.join(self._chain(domain, finished))};{step} "
+            f"{round((end - start) * 1000)}"
+            for domain in sorted(self.steps)
+            for step, start, end in self.steps[domain]
+        ]
+        lines.extend(
+            f"{';'.join(self._chain(domain, finished))};import {platform} "
+            f"{round(duration * 1000)}"
+            for domain, platform, duration in sorted(self._platform_imports())
+        )
+        return lines
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the timeline as a dictionary.
+
+        Times are in seconds relative to the start of the timeline.
+        """
+        return {
+            "integrations": {
+                domain: {
+                    "steps": [
+                        {
+                            "step": step,
+                            "start": round(start - self.start, 4),
+                            "duration": round(end - start, 4),
+                        }
+                        for step, start, end in steps
+                    ],
+                    "waited_on": sorted(self.waited_on.get(domain, ())),
+                }
+                for domain, steps in self.steps.items()
+            },
+            "imports": {
+                name: round(duration, 4)
+                for name, duration in sorted(
+                    self.imports.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+            "critical_path": self.critical_path(),
+            "parallelism": self.parallelism,
+            "flame": self.flame(),
+        }
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> SetupTimeline:
+    """Return the timeline of setting up integrations."""
+    timeline: Optional[SetupTimeline] = hass.data.get(DATA_SETUP_TIMELINE)
+    if timeline is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline(
+            hass.data.setdefault(loader.DATA_IMPORT_TIMES, {})
+        )
+    return timeline
+
+
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str]) -> None:
     """Set domains that are going to be loaded from the config.
@@ -79,6 +211,8 @@ async def _async_process_dependencies(
 
     after_dependencies_tasks = {}
     to_be_loaded = hass.data.get(DATA_SETUP_DONE, {})
+    if integration.domain in hass.data.get(DATA_SETUP_IGNORE_AFTER_DEPENDENCIES, ()):
+        to_be_loaded = {}
     for dep in integration.after_dependencies:
         if (
             dep not in dependencies_tasks
@@ -105,10 +239,16 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    timeline = async_get_setup_timeline(hass)
+    timeline.add_waited_on(
+        integration.domain, {*dependencies_tasks, *after_dependencies_tasks}
+    )
+
+    with timeline.track(integration.domain, "dependencies"):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -160,10 +300,13 @@ async def _async_setup_component(
         log_error(str(err), integration.documentation)
         return False
 
+    timeline = async_get_setup_timeline(hass)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with timeline.track(domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -171,9 +314,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with timeline.track(domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -209,8 +353,9 @@ async def _async_setup_component(
             hass.data[DATA_SETUP_STARTED].pop(domain)
             return False
 
-        async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-            result = await task
+        with timeline.track(domain, "setup"):
+            async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                result = await task
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -247,12 +392,12 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    entries = hass.config_entries.async_entries(domain)
+    if entries:
+        with timeline.track(domain, "setup_entry"):
+            await asyncio.gather(
+                *[entry.async_setup(hass, integration=integration) for entry in entries]
+            )
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -339,10 +484,11 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_get_setup_timeline(hass).track(integration.domain, "requirements"):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
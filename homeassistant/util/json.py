@@ -48,13 +48,20 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
+    Compact files are written without indentation or whitespace, which makes
+    large files smaller and faster to write and to load.
+
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if compact:
+            json_data = json.dumps(data, separators=(",", ":"), cls=encoder)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
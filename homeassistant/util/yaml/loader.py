@@ -1,13 +1,28 @@
 """Custom loader."""
 from collections import OrderedDict
+from datetime import date, datetime
 import fnmatch
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TextIO, TypeVar, Union, overload
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
+from homeassistant.const import __version__
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import _SECRET_NAMESPACE, SECRET_YAML
@@ -32,6 +47,29 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+PARSE_CACHE_VERSION = 2
+# Dependencies of a parsed file. The first one is the file itself.
+_DependenciesType = Tuple[Tuple[Any, ...], ...]
+# Path -> dependencies and encoded result of parsing the file
+__PARSE_CACHE: Dict[str, Tuple[_DependenciesType, Any]] = {}
+__PARSE_CACHE_CHANGED = False
+# Results that can not be cached
+_UNCACHEABLE = ("uncacheable",)
+# Results that contain secrets, they are only cached in memory
+_SECRET = ("secret",)
+
+
+class _LoadingFiles(threading.local):
+    """Dependencies collected for each file that is being loaded."""
+
+    def __init__(self) -> None:
+        """Initialize the files being loaded by a thread."""
+        super().__init__()
+        self.dependencies: List[List[Tuple[Any, ...]]] = []
+
+
+__LOADING = _LoadingFiles()
+
 CREDSTASH_WARN = False
 KEYRING_WARN = False
 
@@ -55,22 +93,262 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+LOADER: Type[Union[SafeLineLoader, "FastSafeLoader"]]
+
+if hasattr(yaml, "CSafeLoader"):
+
+    class FastSafeLoader(yaml.CSafeLoader):
+        """Loader class backed by libyaml."""
+
+        def __init__(self, stream: Union[str, TextIO]) -> None:
+            """Initialize the loader and expose the stream like the Python one."""
+            super().__init__(stream)
+            self.stream = stream
+            if isinstance(stream, str):
+                self.name = "<unicode string>"
+            else:
+                self.name = getattr(stream, "name", "<file>")
+
+    LOADER = FastSafeLoader
+else:
+    LOADER = SafeLineLoader
+
+
+def clear_parse_cache() -> None:
+    """Clear the cache of parsed files.
+
+    Async friendly.
+    """
+    __PARSE_CACHE.clear()
+
+
+def restore_parse_cache(data: Any) -> None:
+    """Restore the files parsed by a previous run from dump_parse_cache."""
+    global __PARSE_CACHE_CHANGED  # pylint: disable=global-statement
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != [PARSE_CACHE_VERSION, __version__]
+        or not isinstance(data.get("files"), dict)
+    ):
+        return
+
+    for fname, entry in data["files"].items():
+        try:
+            dependencies = tuple(
+                _restore_dependency(dependency) for dependency in entry[0]
+            )
+            if not dependencies or dependencies[0][0] != "file":
+                raise ValueError
+        except (IndexError, KeyError, TypeError, ValueError):
+            _LOGGER.warning("Ignoring invalid YAML parse cache entry for %s", fname)
+            continue
+        __PARSE_CACHE.setdefault(fname, (dependencies, entry[1]))
+    __PARSE_CACHE_CHANGED = False
+
+
+def dump_parse_cache() -> Optional[Dict[str, Any]]:
+    """Return the parsed files to restore in the next run.
+
+    Files that contain secrets are left out. Returns None if nothing changed
+    since the cache was last dumped or restored.
+    """
+    global __PARSE_CACHE_CHANGED  # pylint: disable=global-statement
+
+    if not __PARSE_CACHE_CHANGED:
+        return None
+
+    __PARSE_CACHE_CHANGED = False
+    return {
+        "version": [PARSE_CACHE_VERSION, __version__],
+        "files": {
+            fname: [dependencies, encoded]
+            for fname, (dependencies, encoded) in __PARSE_CACHE.items()
+            if _SECRET not in dependencies
+        },
+    }
+
+
+def _restore_dependency(dependency: List[Any]) -> Tuple[Any, ...]:
+    """Restore a dependency from its JSON representation."""
+    kind, name, *rest = dependency
+    if not isinstance(name, str):
+        raise ValueError
+    if kind == "file" and len(rest) == 2:
+        if not all(value is None or isinstance(value, int) for value in rest):
+            raise ValueError
+        return (kind, name, *rest)
+    if kind == "dir" and len(rest) == 2:
+        pattern, files = rest
+        if not isinstance(pattern, str) or not all(
+            isinstance(fname, str) for fname in files
+        ):
+            raise ValueError
+        return (kind, name, pattern, tuple(files))
+    if kind == "env" and len(rest) == 1:
+        if rest[0] is not None and not isinstance(rest[0], str):
+            raise ValueError
+        return (kind, name, rest[0])
+    raise ValueError
+
+
+def _encode(obj: Any) -> Any:
+    """Encode a parsed YAML value, including its file references, as JSON.
+
+    Raises TypeError for values that can not be encoded.
+    """
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+    if isinstance(obj, NodeStrClass):
+        encoded: Dict[str, Any] = {"s": str(obj)}
+    elif isinstance(obj, dict):
+        encoded = {"d": [[_encode(key), _encode(value)] for key, value in obj.items()]}
+    elif isinstance(obj, list):
+        encoded = {"a": [_encode(value) for value in obj]}
+    elif isinstance(obj, Input):
+        return {"i": obj.name}
+    elif isinstance(obj, datetime):
+        return {"dt": obj.isoformat()}
+    elif isinstance(obj, date):
+        return {"da": obj.isoformat()}
+    else:
+        raise TypeError(f"Unable to encode {type(obj)}")
+
+    if hasattr(obj, "__config_file__"):
+        encoded["f"] = getattr(obj, "__config_file__")
+        encoded["l"] = getattr(obj, "__line__")
+    return encoded
+
+
+def _decode(encoded: Any) -> Any:
+    """Decode a value encoded by _encode.
+
+    Raises KeyError, TypeError or ValueError for invalid values.
+    """
+    if not isinstance(encoded, dict):
+        if isinstance(encoded, list):
+            raise TypeError("Unexpected list")
+        return encoded
+
+    obj: Any
+    if "s" in encoded:
+        obj = NodeStrClass(encoded["s"])
+    elif "d" in encoded:
+        obj = OrderedDict((_decode(key), _decode(value)) for key, value in encoded["d"])
+    elif "a" in encoded:
+        obj = [_decode(value) for value in encoded["a"]]
+        if "f" in encoded:
+            obj = NodeListClass(obj)
+    elif "i" in encoded:
+        return Input(str(encoded["i"]))
+    elif "dt" in encoded:
+        return datetime.fromisoformat(encoded["dt"])
+    elif "da" in encoded:
+        return date.fromisoformat(encoded["da"])
+    else:
+        raise ValueError("Unknown value")
+
+    if "f" in encoded:
+        setattr(obj, "__config_file__", encoded["f"])
+        setattr(obj, "__line__", encoded["l"])
+    return obj
+
+
+def _path_dependency(path: str) -> Tuple[Any, ...]:
+    """Return a dependency on the current content of a path."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ("file", path, None, None)
+    return ("file", path, stat.st_mtime_ns, stat.st_size)
+
+
+def _dependency_valid(dependency: Tuple[Any, ...]) -> bool:
+    """Return if a dependency of a cached file still holds."""
+    kind = dependency[0]
+    if dependency == _SECRET:
+        return True
+    if kind == "file":
+        return _path_dependency(dependency[1]) == dependency
+    if kind == "dir":
+        return tuple(_find_files(dependency[1], dependency[2])) == dependency[3]
+    if kind == "env":
+        return os.getenv(dependency[1]) == dependency[2]
+    return False
+
+
+def _add_dependencies(*dependencies: Tuple[Any, ...]) -> None:
+    """Record dependencies of the files that are being loaded."""
+    loading = __LOADING.dependencies
+    if loading:
+        loading[-1].extend(dependencies)
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed files are cached until they, the files they include, the secrets
+    or the environment variables they use change.
+    """
+    global __PARSE_CACHE_CHANGED  # pylint: disable=global-statement
+
+    loading = __LOADING.dependencies
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file)
+            try:
+                stat = os.fstat(conf_file.fileno())
+            except (OSError, ValueError):
+                # Not a real file
+                file_dependency: Tuple[Any, ...] = _UNCACHEABLE
+            else:
+                file_dependency = ("file", fname, stat.st_mtime_ns, stat.st_size)
+
+            cached = __PARSE_CACHE.get(fname)
+            if (
+                cached is not None
+                and cached[0][0] == file_dependency
+                and all(_dependency_valid(dep) for dep in cached[0][1:])
+            ):
+                try:
+                    result = _decode(cached[1])
+                except (KeyError, TypeError, ValueError):
+                    _LOGGER.debug("Unable to use cached parsed file %s", fname)
+                else:
+                    _add_dependencies(*cached[0])
+                    return result
+
+            loading.append([file_dependency])
+            if os.path.basename(fname) == SECRET_YAML:
+                loading[-1].append(_SECRET)
+            try:
+                result = parse_yaml(conf_file)
+            finally:
+                dependencies = tuple(loading.pop())
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    _add_dependencies(*dependencies)
+
+    if _UNCACHEABLE in dependencies:
+        return result
+
+    try:
+        __PARSE_CACHE[fname] = (dependencies, _encode(result))
+    except TypeError:
+        _LOGGER.debug("Unable to cache parsed file %s", fname)
+    else:
+        __PARSE_CACHE_CHANGED = True
+
+    return result
+
 
 def parse_yaml(content: Union[str, TextIO]) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
-        return yaml.load(content, Loader=SafeLineLoader) or OrderedDict()
+        return yaml.load(content, Loader=LOADER) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -139,13 +417,20 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> Tuple[str, ...]:
+    """Find the YAML files in a directory and depend on the listing."""
+    files = tuple(_find_files(directory, "*.yaml"))
+    _add_dependencies(("dir", directory, "*.yaml", files))
+    return files
+
+
 def _include_dir_named_yaml(
     loader: SafeLineLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -159,7 +444,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname)
@@ -175,7 +460,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
         load_yaml(f)
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
     ]
 
@@ -186,7 +471,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname)
@@ -236,6 +521,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _add_dependencies(("env", args[0], os.getenv(args[0])))
 
     # Check for a default value
     if len(args) > 1:
@@ -249,6 +535,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
 def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     """Load the secrets yaml from path."""
     secret_path = os.path.join(secret_path, SECRET_YAML)
+    _add_dependencies(_path_dependency(secret_path))
     if secret_path in __SECRET_CACHE:
         return __SECRET_CACHE[secret_path]
 
@@ -280,6 +567,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
+            _add_dependencies(_SECRET)
             _LOGGER.debug(
                 "Secret %s retrieved from secrets.yaml in folder %s",
                 node.value,
@@ -300,6 +588,9 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if pwd:
             global KEYRING_WARN  # pylint: disable=global-statement
 
+            # The keyring can change without us noticing
+            _add_dependencies(_UNCACHEABLE)
+
             if not KEYRING_WARN:
                 KEYRING_WARN = True
                 _LOGGER.warning(
@@ -323,6 +614,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                     _LOGGER.warning(
                         "Credstash is deprecated and will be removed in March 2021."
                     )
+                _add_dependencies(_UNCACHEABLE)
                 _LOGGER.debug("Secret %s retrieved from credstash", node.value)
                 return pwd
         except credstash.ItemNotFound:
@@ -350,3 +642,7 @@ yaml.SafeLoader.add_constructor(
     "!include_dir_merge_named", _include_dir_merge_named_yaml
 )
 yaml.SafeLoader.add_constructor("!input", Input.from_node)
+
+if LOADER is not SafeLineLoader:
+    # Share the constructors so constructors added later apply to both loaders
+    LOADER.yaml_constructors = yaml.SafeLoader.yaml_constructors
@@ -0,0 +1,77 @@
+"""Generate manifests file."""
+import json
+from typing import Any, Dict
+
+from .model import Config, Integration
+
+# Bump when the format of the generated index changes
+VERSION = 1
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS_VERSION = {}
+
+MANIFESTS = {{
+{}
+}}
+""".strip()
+
+
+def format_value(value: Any) -> str:
+    """Format a JSON value as a Python literal."""
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{json.dumps(key)}: {format_value(val)}" for key, val in value.items()
+        )
+        return f"{{{items}}}"
+    if isinstance(value, list):
+        return f"[{', '.join(format_value(val) for val in value)}]"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate manifests data."""
+    lines = []
+
+    for domain in sorted(integrations):
+        manifest = integrations[domain].manifest
+
+        if not manifest:
+            continue
+
+        lines.append(f"    {json.dumps(domain)}: {format_value(manifest)},")
+
+    return BASE.format(VERSION, "\n".join(lines))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifests file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifests"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(manifests_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifests",
+                "File manifests.py is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifests file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['manifests']}\n")
@@ -461,6 +461,152 @@ async def test_services(hass, calls):
     assert automation.is_on(hass, entity_id)
 
 
+async def test_condition_stats(hass, calls):
+    """Test the conditions of an automation count their evaluations."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "condition": [
+                    "{{ trigger.event.data.pass }}",
+                    {"condition": "state", "entity_id": "test.entity", "state": "on"},
+                ],
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    hass.states.async_set("test.entity", "on")
+
+    hass.bus.async_fire("test_event", {"pass": False})
+    hass.bus.async_fire("test_event", {"pass": True})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    # Listed in config order, even though the state condition is checked first
+    assert automation.condition_stats_in_automation(hass, "automation.hello") == [
+        {
+            "index": 0,
+            "condition": "template",
+            "evaluations": 2,
+            "passes": 1,
+            "hit_rate": 0.5,
+        },
+        {
+            "index": 1,
+            "condition": "state",
+            "evaluations": 2,
+            "passes": 2,
+            "hit_rate": 1.0,
+        },
+    ]
+    assert automation.condition_stats_in_automation(hass, "automation.unknown") == []
+
+
+async def test_websocket_trace(hass, calls, hass_ws_client):
+    """Test retrieving the traces of an automation."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "condition": "{{ trigger.event.data.pass }}",
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"pass": False})
+    hass.bus.async_fire("test_event", {"pass": True})
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "automation/trace", "entity_id": "automation.hello"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    failed, passed = response["result"]
+    assert failed["condition"] is False
+    assert failed["steps"] == []
+    assert failed["variables"]["trigger"]["event"]["data"] == {"pass": False}
+    assert passed["condition"] is True
+    assert [step["action"] for step in passed["steps"]] == ["call_service"]
+
+    await client.send_json(
+        {"id": 2, "type": "automation/trace", "entity_id": "automation.unknown"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_automation_stats(hass, hass_ws_client):
+    """Test the evaluation statistics of an automation can be fetched."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": "test.entity",
+                    "to": "on",
+                },
+                "condition": {
+                    "condition": "state",
+                    "entity_id": "test.other",
+                    "state": "on",
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    hass.states.async_set("test.entity", "on")
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "automation/stats", "entity_id": "automation.hello"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["triggers"] == [
+        {
+            "name": "hello",
+            "entity_id": "test.entity",
+            "platform": "state",
+            "attribute": None,
+            "from": "*",
+            "to": "on",
+            "evaluations": 2,
+            "matches": 1,
+        }
+    ]
+    assert response["result"]["conditions"] == [
+        {
+            "index": 0,
+            "condition": "state",
+            "evaluations": 1,
+            "passes": 0,
+            "hit_rate": 0.0,
+        }
+    ]
+
+    await client.send_json(
+        {"id": 2, "type": "automation/stats", "entity_id": "automation.unknown"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_only_user):
     """Test the reload config service."""
     assert await async_setup_component(
@@ -542,6 +688,30 @@ async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_onl
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_updates_reference_index(hass, calls):
+    """Test reloading updates the automations referencing an entity."""
+    config = {
+        automation.DOMAIN: {
+            "alias": "hello",
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": {"service": "test.automation", "entity_id": "light.old"},
+        }
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    assert automation.automations_with_entity(hass, "light.old") == ["automation.hello"]
+
+    config[automation.DOMAIN]["action"]["entity_id"] = "light.new"
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert automation.automations_with_entity(hass, "light.old") == []
+    assert automation.automations_with_entity(hass, "light.new") == ["automation.hello"]
+
+
 async def test_reload_config_when_invalid_config(hass, calls):
     """Test the reload config service handling invalid config."""
     with assert_setup_component(1, automation.DOMAIN):
@@ -618,7 +788,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -663,6 +835,16 @@ async def test_automation_stops(hass, calls, service):
             {ATTR_ENTITY_ID: entity_id, automation.CONF_STOP_ACTIONS: False},
             blocking=True,
         )
+    elif service == "reload":
+        config[automation.DOMAIN]["alias"] = "goodbye"
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
     else:
         with patch(
             "homeassistant.config.load_yaml_config_file",
@@ -676,7 +858,77 @@ async def test_automation_stops(hass, calls, service):
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (
+        1 if service in ("turn_off_no_stop", "reload_unchanged") else 0
+    )
+
+
+async def test_reload_only_changed_automations(hass, calls):
+    """Test reloading only replaces the automations that changed."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "kept",
+                "alias": "kept",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "variables": {"value": "{{ 1 + 1 }}"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "changed",
+                "alias": "changed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "alias": "removed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    component = hass.data[automation.DOMAIN]
+    kept = component.get_entity("automation.kept")
+    changed = component.get_entity("automation.changed")
+
+    new_config = {
+        automation.DOMAIN: [
+            {
+                "id": "kept",
+                "alias": "kept",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "variables": {"value": "{{ 1 + 1 }}"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "id": "changed",
+                "alias": "changed",
+                "trigger": {"platform": "event", "event_type": "other_event"},
+                "action": {"service": "test.automation"},
+            },
+            {
+                "alias": "added",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=new_config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert component.get_entity("automation.kept") is kept
+    assert component.get_entity("automation.changed") is not changed
+    assert hass.states.get("automation.removed") is None
+    assert hass.states.get("automation.added") is not None
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
 
 
 async def test_automation_restore_state(hass):
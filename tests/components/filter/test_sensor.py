@@ -1,9 +1,13 @@
 """The test for the data filter sensor platform."""
+from collections import deque
+from copy import copy
 from datetime import timedelta
 from os import path
+import random
+import statistics
 from unittest.mock import patch
 
-from pytest import fixture
+from pytest import approx, fixture
 
 from homeassistant import config as hass_config
 from homeassistant.components.filter.sensor import (
@@ -343,6 +347,19 @@ def test_initial_outlier(values):
     assert 21 == filtered.state
 
 
+def test_outlier_empty_window(values):
+    """Test an outlier filter without a window compares against zero."""
+    filt = OutlierFilter(window_size=0, precision=2, entity=None, radius=20.5)
+    assert [filt.filter_state(copy(state)).state for state in values] == [
+        20,
+        19,
+        18,
+        0,
+        0,
+        0,
+    ]
+
+
 def test_unknown_state_outlier(values):
     """Test issue #32395."""
     filt = OutlierFilter(window_size=3, precision=2, entity=None, radius=4.0)
@@ -441,6 +458,59 @@ def test_time_sma(values):
     assert 21.5 == filtered.state
 
 
+def test_incremental_windows():
+    """Test outlier and time_sma match recomputing over the window."""
+    rng = random.Random(42)
+    outlier = OutlierFilter(window_size=8, precision=6, entity=None, radius=2.0)
+    time_sma = TimeSMAFilter(
+        window_size=timedelta(minutes=5), precision=6, entity=None, type="last"
+    )
+    window = deque(maxlen=8)
+    history = []
+    now = dt_util.utcnow()
+
+    for _ in range(300):
+        now += timedelta(seconds=rng.randint(1, 90))
+        value = round(rng.uniform(15, 25), 1)
+        state = ha.State("sensor.test_monitored", value, last_updated=now)
+
+        median = statistics.median(window) if window else 0
+        expected = median if len(window) == 8 and abs(value - median) > 2.0 else value
+        assert outlier.filter_state(copy(state)).state == approx(expected, abs=1e-6)
+        window.append(value)
+
+        history.append((now, value))
+        start = now - timedelta(minutes=5)
+        in_window = [
+            (ts, val) for ts, val in history if ts + timedelta(minutes=5) > now
+        ]
+        left = [(ts, val) for ts, val in history if ts + timedelta(minutes=5) <= now]
+        prev = left[-1][1] if left else in_window[0][1]
+        moving_sum = 0
+        for timestamp, val in in_window:
+            moving_sum += (timestamp - start).total_seconds() * prev
+            start, prev = timestamp, val
+        assert time_sma.filter_state(copy(state)).state == approx(moving_sum / 300)
+
+
+def test_time_sma_no_drift():
+    """Test leaking states does not accumulate rounding errors."""
+    filt = TimeSMAFilter(
+        window_size=timedelta(seconds=10), precision=None, entity=None, type="last"
+    )
+    now = dt_util.utcnow()
+    for step in range(5000):
+        now += timedelta(seconds=1)
+        value = 1e9 if step % 2 else 0.1
+        filtered = filt.filter_state(
+            ha.State("sensor.test_monitored", value, last_updated=now)
+        )
+    filt._leak(now + timedelta(seconds=9))
+
+    assert filt._queue_sum == 0
+    assert filtered.state == approx(5e8 + 0.05)
+
+
 async def test_reload(hass):
     """Verify we can reload filter sensors."""
     await async_init_recorder_component(hass)
@@ -8,6 +8,7 @@ import voluptuous as vol
 import homeassistant.components.automation as automation
 from homeassistant.components.homeassistant.triggers import (
     numeric_state as numeric_state_trigger,
+    state as state_trigger,
 )
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
 from homeassistant.core import Context
@@ -1391,3 +1392,69 @@ async def test_attribute_if_not_fires_on_entities_change_with_for_after_stop(
     async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
     await hass.async_block_till_done()
     assert len(calls) == 1
+
+
+async def test_triggers_share_matcher(hass, calls):
+    """Test triggers with the same thresholds are evaluated once."""
+    hass.states.async_set("test.entity", 11)
+    trigger = {
+        "platform": "numeric_state",
+        "entity_id": "test.entity",
+        "below": 10,
+    }
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": "first",
+                    "trigger": trigger,
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "second",
+                    "trigger": trigger,
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    )
+
+    with patch(
+        "homeassistant.helpers.condition.async_numeric_state",
+        wraps=numeric_state_trigger.condition.async_numeric_state,
+    ) as mock_numeric_state:
+        hass.states.async_set("test.entity", 9)
+        await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert mock_numeric_state.call_count == 1
+
+    # Each trigger keeps track of when it fired itself
+    hass.states.async_set("test.entity", 8)
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    stats = state_trigger.async_get_dispatcher(hass).async_stats("first")
+    assert stats == [
+        {
+            "name": "first",
+            "entity_id": "test.entity",
+            "platform": "numeric_state",
+            "attribute": None,
+            "below": 10,
+            "above": None,
+            "value_template": None,
+            "evaluations": 2,
+            "matches": 2,
+        }
+    ]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert state_trigger.async_get_dispatcher(hass).async_stats() == []
@@ -1269,3 +1269,71 @@ async def test_attribute_if_fires_on_entity_change_with_both_filters_boolean(
     hass.states.async_set("test.entity", "bla", {"happening": True})
     await hass.async_block_till_done()
     assert len(calls) == 1
+
+
+async def test_triggers_share_matcher(hass, calls):
+    """Test triggers with the same criteria are evaluated once."""
+    trigger = {
+        "platform": "state",
+        "entity_id": "test.entity",
+        "from": "hello",
+        "to": "world",
+    }
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": "first",
+                    "trigger": trigger,
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "second",
+                    "trigger": trigger,
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "other",
+                    "trigger": {**trigger, "to": "other"},
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    )
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    stats = sorted(
+        state_trigger.async_get_dispatcher(hass).async_stats(),
+        key=lambda stat: stat["name"],
+    )
+    assert stats == [
+        {
+            "name": name,
+            "entity_id": "test.entity",
+            "platform": "state",
+            "attribute": None,
+            "from": "hello",
+            "to": to_state,
+            "evaluations": 1,
+            "matches": matches,
+        }
+        for name, to_state, matches in (
+            ("first", "world", 1),
+            ("other", "other", 0),
+            ("second", "world", 1),
+        )
+    ]
+    assert state_trigger.async_get_dispatcher(hass).async_stats("other") == [stats[1]]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert state_trigger.async_get_dispatcher(hass).async_stats() == []
@@ -1,6 +1,8 @@
 """The tests for the InfluxDB component."""
 from dataclasses import dataclass
 import datetime
+import json
+import os
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
@@ -45,6 +47,14 @@ def mock_batch_timeout(hass, monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_spool_file(tmp_path, monkeypatch):
+    """Keep the spool of the tests out of the config directory."""
+    spool_file = str(tmp_path / "influxdb.spool")
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_FILE", spool_file)
+    return spool_file
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture(request):
     """Patch the InfluxDBClient object with mock for version under test."""
@@ -1331,13 +1341,15 @@ async def test_event_listener_scheduled_write(
         assert mock_sleep.called
     assert write_api.call_count == 2
 
-    # Write works again
+    # Write works again, the spooled batch is written after the new one
     write_api.side_effect = None
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         handler_method(event)
         hass.data[influxdb.DOMAIN].block_till_done()
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert write_api.call_args_list[2] == write_api.call_args_list[3]
+    assert not hass.data[influxdb.DOMAIN].spool.pending
 
 
 @pytest.mark.parametrize(
@@ -1386,6 +1398,73 @@ async def test_event_listener_backlog_full(
         hass.data[influxdb.DOMAIN].block_till_done()
 
         assert get_write_api(mock_client).call_count == 0
+    assert hass.data[influxdb.DOMAIN].spool.pending
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool_survives_restart(
+    hass, mock_client, config_ext, get_write_api, get_mock_call, mock_spool_file
+):
+    """Test spooled events are written once InfluxDB can be reached again."""
+    spooled = [{"measurement": "spooled", "tags": {}, "time": 1, "fields": {}}]
+    with open(mock_spool_file, "w") as spool:
+        spool.write(json.dumps(spooled) + "\n")
+        # A batch cut short by a crash is skipped
+        spool.write('[{"measurement": "trunc')
+
+    handler_method = await _setup(hass, mock_client, config_ext, get_write_api)
+    assert hass.data[influxdb.DOMAIN].spool.pending
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 2
+    assert write_api.call_args == get_mock_call(spooled)
+    assert not hass.data[influxdb.DOMAIN].spool.pending
+    assert not os.path.exists(mock_spool_file)
+
+
+def test_spool_rewrite_failure(mock_spool_file, caplog):
+    """Test a spool that can not be rewritten is logged, not raised."""
+    spool = influxdb.InfluxSpool(mock_spool_file)
+    assert spool.add([{"measurement": "spooled"}])
+
+    def write(batch):
+        """Lose the connection and the spool file with it."""
+        os.remove(mock_spool_file)
+        os.mkdir(mock_spool_file)
+        raise ConnectionError
+
+    spool.replay(write)
+
+    assert spool.pending
+    assert "Unable to rewrite spooled events" in caplog.text
 
 
 @pytest.mark.parametrize(
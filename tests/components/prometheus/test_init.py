@@ -17,6 +17,7 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
 )
 from homeassistant.core import split_entity_id
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -201,6 +202,49 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_renders_changed_series(hass, hass_client):
+    """Test a scrape only renders the series changed since the previous one."""
+    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    hass.states.async_set("sensor.one", "1", {"friendly_name": "One"})
+    hass.states.async_set("sensor.two", "2", {"friendly_name": "Two"})
+    await hass.async_block_till_done()
+    client = await hass_client()
+
+    with mock.patch.object(
+        prometheus.PrometheusMetrics,
+        "_render_series",
+        wraps=prometheus.PrometheusMetrics._render_series,
+    ) as mock_render_series:
+        resp = await client.get(prometheus.API_ENDPOINT)
+        body = await resp.text()
+        assert mock_render_series.call_count == 6
+        assert 'entity_available{domain="sensor",entity="sensor.one",' in body
+
+        mock_render_series.reset_mock()
+        hass.states.async_set("sensor.two", "3", {"friendly_name": "Second"})
+        await hass.async_block_till_done()
+        resp = await client.get(prometheus.API_ENDPOINT)
+        body = await resp.text()
+        assert mock_render_series.call_count == 3
+        assert (
+            'state_change_total{domain="sensor",entity="sensor.two",'
+            'friendly_name="Second"} 1.0' in body.split("\n")
+        )
+        assert (
+            'state_change_total{domain="sensor",entity="sensor.one",'
+            'friendly_name="One"} 1.0' in body.split("\n")
+        )
+
+    hass.bus.async_fire(
+        EVENT_ENTITY_REGISTRY_UPDATED, {"action": "remove", "entity_id": "sensor.one"}
+    )
+    await hass.async_block_till_done()
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = await resp.text()
+    assert 'entity="sensor.one"' not in body
+    assert 'entity="sensor.two"' in body
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -0,0 +1,57 @@
+"""Test the recorder numeric history prefill."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder.prefill import async_get_numeric_history
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.util import dt as dt_util
+
+from .common import wait_recording_done
+
+
+def test_numeric_history(hass_recorder):
+    """Test requests made together are fetched at once."""
+    hass = hass_recorder()
+    start = dt_util.utcnow()
+    for minutes, value in enumerate(["1", "unknown", "2.5", "3", "4"]):
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=start + timedelta(minutes=minutes),
+        ):
+            hass.states.set("sensor.first", value)
+            hass.states.set("sensor.second", minutes * 10)
+        wait_recording_done(hass)
+
+    async def _async_get_history():
+        return await asyncio.gather(
+            async_get_numeric_history(hass, "sensor.first", 3),
+            async_get_numeric_history(
+                hass, "sensor.second", 10, start + timedelta(minutes=2)
+            ),
+            async_get_numeric_history(hass, "sensor.second", 1),
+            async_get_numeric_history(hass, "sensor.unknown", 5),
+            async_get_numeric_history(
+                hass, "sensor.first", 2, start + timedelta(minutes=1)
+            ),
+        )
+
+    with patch(
+        "homeassistant.components.recorder.prefill.session_scope",
+        wraps=session_scope,
+    ) as mock_session_scope:
+        first, second, last, unknown, bounded = asyncio.run_coroutine_threadsafe(
+            _async_get_history(), hass.loop
+        ).result()
+
+    assert mock_session_scope.call_count == 1
+    assert list(first.values) == [2.5, 3, 4]
+    assert list(second.values) == [20, 30, 40]
+    assert list(second.timestamps) == pytest.approx(
+        [(start + timedelta(minutes=minutes)).timestamp() for minutes in (2, 3, 4)]
+    )
+    assert list(last.values) == [40]
+    assert list(unknown.values) == []
+    assert list(bounded.values) == [3, 4]
@@ -706,3 +706,45 @@ async def test_script_variables(hass, caplog):
 
     assert len(mock_calls) == 4
     assert mock_calls[3].data["value"] == 1
+
+
+async def test_websocket_trace(hass, hass_ws_client):
+    """Test retrieving the traces of a script."""
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "test": {
+                    "sequence": [
+                        {"condition": "template", "value_template": "{{ pass }}"},
+                        {"event": "test_event"},
+                    ]
+                }
+            }
+        },
+    )
+
+    await hass.services.async_call("script", "test", {"pass": False}, blocking=True)
+    await hass.services.async_call("script", "test", {"pass": True}, blocking=True)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "script/trace", "entity_id": "script.test"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    failed, passed = response["result"]
+    assert [
+        (step["action"], step["error"], step["result"]) for step in failed["steps"]
+    ] == [("condition", None, False)]
+    assert [
+        (step["action"], step["error"], step["result"]) for step in passed["steps"]
+    ] == [("condition", None, True), ("event", None, None)]
+
+    await client.send_json(
+        {"id": 2, "type": "script/trace", "entity_id": "script.unknown"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
@@ -1,6 +1,8 @@
 """The test for the statistics sensor platform."""
+from collections import deque
 from datetime import datetime, timedelta
 from os import path
+import random
 import statistics
 import unittest
 from unittest.mock import patch
@@ -9,7 +11,11 @@ import pytest
 
 from homeassistant import config as hass_config
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import DOMAIN, StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    DOMAIN,
+    RollingStatistics,
+    StatisticsSensor,
+)
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -500,3 +506,47 @@ async def test_reload(hass):
 
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
+
+
+def test_rolling_statistics():
+    """Test the rolling aggregates match recomputing them over the window."""
+    rng = random.Random(42)
+    window = deque()
+    aggregates = RollingStatistics()
+
+    for _ in range(500):
+        value = round(rng.uniform(-50, 50), 1)
+        window.append(value)
+        aggregates.add(value)
+        if len(window) > 20 or rng.random() < 0.2:
+            aggregates.remove_oldest(window.popleft())
+        if not window:
+            assert aggregates.count == 0
+            continue
+
+        assert aggregates.count == len(window)
+        assert aggregates.min == min(window)
+        assert aggregates.max == max(window)
+        assert aggregates.median == statistics.median(window)
+        assert aggregates.mean == pytest.approx(statistics.mean(window))
+        assert aggregates.total == pytest.approx(sum(window))
+        if len(window) > 1:
+            assert aggregates.variance == pytest.approx(statistics.variance(window))
+            assert aggregates.stdev == pytest.approx(statistics.stdev(window))
+
+
+def test_rolling_statistics_no_drift():
+    """Test removing values does not accumulate rounding errors."""
+    rng = random.Random(42)
+    window = deque()
+    aggregates = RollingStatistics()
+
+    for _ in range(20000):
+        value = 1e8 + rng.uniform(0, 1)
+        window.append(value)
+        aggregates.add(value)
+        if len(window) > 10:
+            aggregates.remove_oldest(window.popleft())
+
+    assert aggregates.mean == pytest.approx(statistics.mean(window), rel=1e-12)
+    assert aggregates.variance == pytest.approx(statistics.variance(window), rel=1e-6)
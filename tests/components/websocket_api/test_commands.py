@@ -1,6 +1,11 @@
 """Tests for WebSocket API commands."""
+import asyncio
+from unittest.mock import patch
+
 from async_timeout import timeout
+import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
@@ -863,3 +868,147 @@ async def test_test_condition(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"]["result"] is True
+
+
+async def test_batch(hass, websocket_client):
+    """Test running several commands in a single batch."""
+    hass.states.async_set("greeting.hello", "world")
+    calls = async_mock_service(hass, "domain_test", "test_service")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "batch",
+            "commands": [
+                {"type": "get_states"},
+                {"type": "ping"},
+                {
+                    "type": "call_service",
+                    "domain": "domain_test",
+                    "service": "test_service",
+                },
+                {"type": "manifest/get", "integration": "non_existing"},
+                {"type": "non_existing"},
+                {"type": "get_config", "invalid": True},
+            ],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    states, pong, service, manifest, unknown, invalid = msg["result"]
+    assert states == {
+        "success": True,
+        "result": [state.as_dict() for state in hass.states.async_all()],
+    }
+    assert pong == {"success": True, "result": None}
+    assert service["success"]
+    assert len(calls) == 1
+    assert not manifest["success"]
+    assert manifest["error"]["code"] == const.ERR_NOT_FOUND
+    assert not unknown["success"]
+    assert unknown["error"]["code"] == const.ERR_UNKNOWN_COMMAND
+    assert not invalid["success"]
+    assert invalid["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
+async def test_batch_rejects_subscriptions(hass, websocket_client):
+    """Test subscriptions inside a batch are cleaned up and reported."""
+    init_count = sum(hass.bus.async_listeners().values())
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "batch",
+            "commands": [{"type": "subscribe_events", "event_type": "test_event"}],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "success": False,
+            "error": {
+                "code": const.ERR_NOT_SUPPORTED,
+                "message": "Subscriptions are not supported in a batch.",
+            },
+        }
+    ]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_batch_timeout(hass, websocket_client):
+    """Test commands that do not reply in time are reported and cleaned up."""
+    init_count = sum(hass.bus.async_listeners().values())
+    release = asyncio.Event()
+
+    @websocket_api.websocket_command({vol.Required("type"): "test/slow"})
+    @websocket_api.async_response
+    async def handle_slow(hass, connection, msg):
+        """Subscribe to events after being released."""
+        await release.wait()
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            "test_event", lambda event: None
+        )
+        connection.send_result(msg["id"])
+
+    websocket_api.async_register_command(hass, handle_slow)
+
+    with patch.object(const, "BATCH_TIMEOUT", 0.01):
+        await websocket_client.send_json(
+            {
+                "id": 5,
+                "type": "batch",
+                "commands": [{"type": "ping"}, {"type": "test/slow"}],
+            }
+        )
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["success"]
+    pong, slow = msg["result"]
+    assert pong == {"success": True, "result": None}
+    assert not slow["success"]
+    assert slow["error"]["code"] == const.ERR_TIMEOUT
+
+    release.set()
+    await hass.async_block_till_done()
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_batch_requires_commands(hass, websocket_client):
+    """Test a batch needs at least one command."""
+    await websocket_client.send_json({"id": 5, "type": "batch", "commands": []})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
+async def test_setup_timeline(hass, websocket_client):
+    """Test getting the setup timeline."""
+    await websocket_client.send_json({"id": 5, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert "websocket_api" in msg["result"]["integrations"]
+    assert msg["result"]["critical_path"]
+
+
+async def test_setup_timeline_requires_admin(hass, websocket_client, hass_admin_user):
+    """Test the setup timeline requires an admin."""
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 5, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
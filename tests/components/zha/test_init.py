@@ -4,12 +4,16 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from zigpy.config import CONF_DEVICE, CONF_DEVICE_PATH
+import zigpy.profiles.zha as zha
+import zigpy.zcl.clusters.general as general
 
 from homeassistant.components.zha.core.const import (
     CONF_BAUDRATE,
     CONF_RADIO_TYPE,
     CONF_USB_PATH,
     DOMAIN,
+    LIGHT,
+    SWITCH,
 )
 from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
 from homeassistant.setup import async_setup_component
@@ -96,3 +100,36 @@ async def test_config_depreciation(hass, zha_config):
     ) as setup_mock:
         assert await async_setup_component(hass, DOMAIN, {DOMAIN: zha_config})
         assert setup_mock.call_count == 1
+
+
+async def test_platforms_set_up_lazily(
+    hass, config_entry, zigpy_device_mock, zha_device_joined_restored
+):
+    """Test platforms are only set up once a device has entities for them."""
+    zigpy_device = zigpy_device_mock(
+        {
+            1: {
+                "in_clusters": [general.Basic.cluster_id, general.OnOff.cluster_id],
+                "out_clusters": [],
+                "device_type": zha.DeviceType.ON_OFF_SWITCH,
+            }
+        }
+    )
+    await zha_device_joined_restored(zigpy_device)
+    await hass.async_block_till_done()
+
+    lazy_platforms = hass.config_entries.async_lazy_platforms(config_entry)
+    assert SWITCH not in lazy_platforms
+    assert LIGHT in lazy_platforms
+    assert hass.states.async_entity_ids(SWITCH)
+    assert LIGHT not in hass.config.components
+
+
+async def test_lazy_platforms_forgotten_on_unload(hass, config_entry, setup_zha):
+    """Test platforms that were never set up are forgotten on unload."""
+    await setup_zha()
+    assert LIGHT in hass.config_entries.async_lazy_platforms(config_entry)
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.config_entries.async_lazy_platforms(config_entry) == set()
@@ -90,6 +90,70 @@ async def test_and_condition_with_template(hass):
     assert test(hass)
 
 
+async def test_and_condition_cheapest_first(hass):
+    """Test nested 'and' conditions are flattened and templates checked last."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "template",
+                "value_template": '{{ states.sensor.temperature.state == "100" }}',
+            },
+            {
+                "condition": "and",
+                "conditions": [
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.temperature",
+                        "state": "100",
+                    },
+                ],
+            },
+        ],
+    }
+    assert condition.condition_cost(config) == 2
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 120)
+    with patch(
+        "homeassistant.helpers.condition.async_template", return_value=True
+    ) as mock_template:
+        assert not test(hass)
+    assert not mock_template.called
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+
+
+async def test_track_stats(hass):
+    """Test counting the evaluations of a condition."""
+    stats = condition.ConditionStats("state", 2)
+    test = condition.async_track_stats(
+        await condition.async_from_config(
+            hass,
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+        ),
+        stats,
+    )
+    assert stats.hit_rate is None
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+    hass.states.async_set("sensor.temperature", 120)
+    assert not test(hass)
+    assert stats.as_dict() == {
+        "index": 2,
+        "condition": "state",
+        "evaluations": 2,
+        "passes": 1,
+        "hit_rate": 0.5,
+    }
+
+
 async def test_or_condition(hass):
     """Test the 'or' condition."""
     test = await condition.async_from_config(
@@ -612,6 +676,28 @@ async def test_numberic_state_attribute(hass):
     assert not test(hass)
 
 
+async def test_numeric_state_parses_state_once(hass, caplog):
+    """Test the value of a state is parsed once."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "below": 50,
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", "bad")
+    assert not test(hass)
+    assert not test(hass)
+    assert caplog.text.count("Value cannot be processed as a number") == 1
+
+    hass.states.async_set("sensor.temperature", 40)
+    assert test(hass)
+    hass.states.async_set("sensor.temperature", 60)
+    assert not test(hass)
+
+
 async def test_numeric_state_using_input_number(hass):
     """Test numeric_state conditions using input_number entities."""
     await async_setup_component(
@@ -1061,3 +1061,43 @@ async def test_get_or_create_sets_default_values(hass, registry):
     assert entry.name == "default name 1"
     assert entry.model == "default model 1"
     assert entry.manufacturer == "default manufacturer 1"
+
+
+async def test_entries_lookups_follow_updates(registry):
+    """Test the area and config entry lookups follow device changes."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="123", identifiers={("bridgeid", "0123")}
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123", identifiers={("bridgeid", "4567")}
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    entry1 = registry.async_update_device(entry1.id, area_id="12345A")
+    entry2 = registry.async_get_or_create(
+        config_entry_id="456", identifiers={("bridgeid", "4567")}
+    )
+
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry1]
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+
+    registry.async_clear_area_id("12345A")
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    registry.async_clear_config_entry("123")
+    assert device_registry.async_entries_for_config_entry(registry, "123") == []
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [
+        registry.async_get(entry2.id)
+    ]
+
+    registry.async_remove_device(entry2.id)
+    assert device_registry.async_entries_for_config_entry(registry, "456") == []
@@ -1,5 +1,6 @@
 """Tests for the Entity Registry."""
 import asyncio
+import os
 import unittest.mock
 from unittest.mock import patch
 
@@ -7,7 +8,7 @@ import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, STATE_UNAVAILABLE
 from homeassistant.core import CoreState, callback, valid_entity_id
-from homeassistant.helpers import entity_registry
+from homeassistant.helpers import entity_registry, storage
 
 from tests.common import (
     MockConfigEntry,
@@ -15,6 +16,7 @@ from tests.common import (
     mock_device_registry,
     mock_registry,
 )
+from tests.helpers.test_storage import ORIG_ASYNC_LOAD, ORIG_WRITE_DATA
 
 YAML__OPEN_PATH = "homeassistant.util.yaml.loader.open"
 
@@ -794,3 +796,82 @@ async def test_disabled_entities_excluded_from_entity_list(hass, registry):
         registry, device_entry.id, include_disabled_entities=True
     )
     assert entries == [entry1, entry2]
+
+
+async def test_entries_lookups_follow_updates(registry):
+    """Test the device, area and config entry lookups follow entry changes."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="device-1"
+    )
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [
+        entry1,
+        entry2,
+    ]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry1,
+        entry2,
+    ]
+    assert entity_registry.async_entries_for_area(registry, "area-1") == []
+
+    entry1 = registry.async_update_entity(entry1.entity_id, area_id="area-1")
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="device-2"
+    )
+
+    assert entity_registry.async_entries_for_area(registry, "area-1") == [entry1]
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry1]
+    assert entity_registry.async_entries_for_device(registry, "device-2") == [entry2]
+    # Updates keep the order of the entries
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry1,
+        entry2,
+    ]
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, new_entity_id="light.renamed"
+    )
+    assert entity_registry.async_entries_for_area(registry, "area-1") == [entry1]
+
+    registry.async_clear_area_id("area-1")
+    assert entity_registry.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove(entry2.entity_id)
+    assert entity_registry.async_entries_for_device(registry, "device-2") == []
+
+    registry.async_clear_config_entry("mock-id-1")
+    assert not registry.entities
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == []
+
+
+async def test_journaled_changes(hass, tmp_path):
+    """Test created, updated and removed entities are journaled."""
+    hass.config.config_dir = str(tmp_path)
+
+    with patch.object(storage.Store, "_async_load", ORIG_ASYNC_LOAD), patch.object(
+        storage.Store, "_write_data", ORIG_WRITE_DATA
+    ):
+        registry = entity_registry.EntityRegistry(hass)
+        await registry.async_load()
+        entry1 = registry.async_get_or_create("light", "hue", "1234")
+        entry2 = registry.async_get_or_create("light", "hue", "5678")
+        await flush_store(registry._store)
+
+        registry.async_update_entity(entry1.entity_id, name="User Name")
+        registry.async_update_entity(entry2.entity_id, new_entity_id="light.renamed")
+        entry3 = registry.async_get_or_create("light", "hue", "9012")
+        await flush_store(registry._store)
+        assert os.path.exists(registry._store.journal_path)
+
+        registry.async_remove(entry3.entity_id)
+        await flush_store(registry._store)
+
+        registry2 = entity_registry.EntityRegistry(hass)
+        await registry2.async_load()
+
+    assert list(registry2.entities) == [entry1.entity_id, "light.renamed"]
+    assert registry2.entities[entry1.entity_id].name == "User Name"
@@ -1177,6 +1177,83 @@ async def test_track_template_result_complex(hass):
     }
 
 
+async def test_track_template_result_skips_unread_changes(hass):
+    """Test changes to state fields a template did not read skip the render."""
+    state_runs = []
+    attribute_runs = []
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+
+    template_state = Template("{{ states('sensor.test') }}", hass)
+    template_attribute = Template(
+        "{{ state_attr('sensor.test', 'unit_of_measurement') }}", hass
+    )
+
+    def run_callback(event, updates):
+        for update in updates:
+            if update.template is template_state:
+                state_runs.append(update.result)
+            else:
+                attribute_runs.append(update.result)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_state, None),
+            TrackTemplate(template_attribute, None),
+        ],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    assert state_runs == []
+    assert attribute_runs == ["kW"]
+
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    assert state_runs == [2]
+    assert attribute_runs == ["kW"]
+
+    state_stats = info.render_stats[template_state]
+    assert state_stats.renders == 2
+    assert state_stats.skipped == 1
+    assert state_stats.render_time > 0
+    attribute_stats = info.render_stats[template_attribute]
+    assert attribute_stats.renders == 2
+    assert attribute_stats.skipped == 1
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert state_runs == [2, "unknown"]
+    assert attribute_runs == ["kW", None]
+
+
+async def test_track_template_result_domain_iteration_not_skipped(hass):
+    """Test entities seen by iterating a domain always re-render."""
+    runs = []
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+
+    template = Template(
+        "{{ states('sensor.test') }}"
+        "{{ states.sensor | map(attribute='attributes.unit_of_measurement') | list }}",
+        hass,
+    )
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(template, None, timedelta(seconds=0))],
+        lambda event, updates: runs.append(updates.pop().result),
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "kW"})
+    await hass.async_block_till_done()
+    assert runs == ["1['kW']"]
+
+
 async def test_track_template_result_with_wildcard(hass):
     """Test tracking template with a wildcard."""
     specific_runs = []
@@ -0,0 +1,37 @@
+"""Test the reference index helper."""
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
+
+
+async def test_reference_index():
+    """Test adding and removing references."""
+    index = ReferenceIndex()
+    index.async_add("automation.a", ["light.kitchen", "light.hall"], ["device-1"])
+    index.async_add("automation.b", ["light.kitchen"])
+
+    assert sorted(index.with_entity("light.kitchen")) == [
+        "automation.a",
+        "automation.b",
+    ]
+    assert index.with_entity("light.hall") == ["automation.a"]
+    assert index.with_device("device-1") == ["automation.a"]
+    assert index.with_entity("light.unknown") == []
+
+    # Adding an entity again replaces its references
+    index.async_add("automation.a", ["light.hall"])
+    assert index.with_entity("light.kitchen") == ["automation.b"]
+    assert index.with_device("device-1") == []
+
+    index.async_remove("automation.b")
+    index.async_remove("automation.unknown")
+    assert index.with_entity("light.kitchen") == []
+    assert index.with_entity("light.hall") == ["automation.a"]
+
+
+async def test_get_reference_index(hass):
+    """Test there is one index per domain."""
+    index = async_get_reference_index(hass, "automation")
+    assert async_get_reference_index(hass, "automation") is index
+    assert async_get_reference_index(hass, "script") is not index
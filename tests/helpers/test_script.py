@@ -64,6 +64,35 @@ async def test_firing_event_basic(hass, caplog):
     assert "Test Name: Running test script" in caplog.text
 
 
+async def test_trace(hass):
+    """Test the runs of a script are traced."""
+    context = Context()
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": "test_event"},
+            {"condition": "template", "value_template": "{{ value == 1 }}"},
+            {"event": "test_event"},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain", trace_size=2)
+
+    for value in (1, 2, 3):
+        await script_obj.async_run({"value": value}, context=context)
+    await hass.async_block_till_done()
+
+    traces = [trace.as_dict() for trace in script_obj.traces]
+    assert len(traces) == 2
+    assert traces[0]["context_id"] == context.id
+    assert traces[0]["variables"] == {"value": 2, "context": context.as_dict()}
+    assert traces[0]["condition"] is None
+    assert traces[1]["finish"] is not None
+    assert [
+        (step["position"], step["action"], step["error"], step["result"])
+        for step in traces[1]["steps"]
+    ] == [(0, "event", None, None), (1, "condition", None, False)]
+    assert all(step["duration"] >= 0 for step in traces[1]["steps"])
+
+
 async def test_firing_event_template(hass):
     """Test the firing of events."""
     event = "test_event"
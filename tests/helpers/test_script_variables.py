@@ -110,3 +110,15 @@ async def test_template_vars_error(hass):
     var = cv.SCRIPT_VARIABLES_SCHEMA({"hello": "{{ canont.work }}"})
     with pytest.raises(template.TemplateError):
         var.async_render(hass, None)
+
+
+async def test_compare_and_hash():
+    """Test equal script variables hash alike."""
+    var = cv.SCRIPT_VARIABLES_SCHEMA({"hello": "{{ 1 }}", "items": [1, 2]})
+    same = cv.SCRIPT_VARIABLES_SCHEMA({"items": [1, 2], "hello": "{{ 1 }}"})
+    other = cv.SCRIPT_VARIABLES_SCHEMA({"hello": "{{ 2 }}", "items": [1, 2]})
+
+    assert var == same
+    assert var != other
+    assert hash(var) == hash(same)
+    assert len({var, same, other}) == 2
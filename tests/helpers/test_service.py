@@ -357,6 +357,109 @@ async def test_extract_entity_ids_from_area(hass, area_mock):
     )
 
 
+async def test_extract_entity_ids_cache_invalidation(hass, area_mock):
+    """Test resolved targets are refreshed when registries or groups change."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "own-area"})
+
+    assert {"light.in_own_area"} == await service.async_extract_entity_ids(hass, call)
+
+    entity_registry = await ent_reg.async_get_registry(hass)
+    entity_registry.async_update_entity("light.no_area", area_id="own-area")
+    await hass.async_block_till_done()
+
+    assert {
+        "light.in_own_area",
+        "light.no_area",
+    } == await service.async_extract_entity_ids(hass, call)
+
+    # The cached result can't be modified by callers
+    referenced = await service.async_extract_referenced_entity_ids(hass, call)
+    referenced.indirectly_referenced.clear()
+    assert {
+        "light.in_own_area",
+        "light.no_area",
+    } == await service.async_extract_entity_ids(hass, call)
+
+    assert await async_setup_component(hass, "group", {})
+    await hass.async_block_till_done()
+    group = await hass.components.group.Group.async_create_group(
+        hass, "test", ["light.Ceiling"]
+    )
+    call = ha.ServiceCall("light", "turn_on", {ATTR_ENTITY_ID: "group.test"})
+
+    assert {"light.ceiling"} == await service.async_extract_entity_ids(hass, call)
+
+    await group.async_update_tracked_entity_ids(["light.Ceiling", "light.Kitchen"])
+    await hass.async_block_till_done()
+
+    assert {"light.ceiling", "light.kitchen"} == await service.async_extract_entity_ids(
+        hass, call
+    )
+
+
+async def test_extract_entity_ids_cache_tracks_groups(hass):
+    """Test only changes of the groups a cached target expands clear the cache."""
+    assert await async_setup_component(hass, "group", {})
+    await hass.async_block_till_done()
+    inner = await hass.components.group.Group.async_create_group(
+        hass, "inner", ["light.Ceiling"]
+    )
+    await hass.components.group.Group.async_create_group(hass, "outer", ["group.inner"])
+    outer_call = ha.ServiceCall("light", "turn_on", {ATTR_ENTITY_ID: "group.outer"})
+    later_call = ha.ServiceCall("light", "turn_on", {ATTR_ENTITY_ID: "group.later"})
+
+    assert {"light.ceiling"} == await service.async_extract_entity_ids(hass, outer_call)
+    assert set() == await service.async_extract_entity_ids(hass, later_call)
+
+    cache = hass.data[service.SERVICE_TARGET_CACHE]
+    generation = cache.generation
+    hass.states.async_set("light.ceiling", "on")
+    hass.states.async_set("group.unrelated", "on", {ATTR_ENTITY_ID: ["light.bowl"]})
+    await hass.async_block_till_done()
+    assert cache.generation == generation
+
+    await inner.async_update_tracked_entity_ids(["light.Ceiling", "light.Kitchen"])
+    await hass.async_block_till_done()
+    assert {"light.ceiling", "light.kitchen"} == await service.async_extract_entity_ids(
+        hass, outer_call
+    )
+
+    await hass.components.group.Group.async_create_group(hass, "later", ["light.Bowl"])
+    await hass.async_block_till_done()
+    assert {"light.bowl"} == await service.async_extract_entity_ids(hass, later_call)
+
+
+async def test_extract_entity_ids_cache_bounded(hass, area_mock):
+    """Test the target cache is bounded and not filled after an invalidation."""
+    with patch.object(service, "SERVICE_TARGET_CACHE_SIZE", 2):
+        for area_id in ("own-area", "other-area", "test-area"):
+            await service.async_extract_entity_ids(
+                hass, ha.ServiceCall("light", "turn_on", {"area_id": area_id})
+            )
+
+    cache = hass.data[service.SERVICE_TARGET_CACHE]
+    assert cache.get((None, None, "own-area", True)) is None
+    assert cache.get((None, None, "test-area", True)) is not None
+
+    resolve = service._async_resolve_referenced_entity_ids
+
+    async def _resolve_and_invalidate(*args):
+        selected = await resolve(*args)
+        cache.clear()
+        return selected
+
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "own-area"})
+    with patch(
+        "homeassistant.helpers.service._async_resolve_referenced_entity_ids",
+        side_effect=_resolve_and_invalidate,
+    ):
+        assert {"light.in_own_area"} == await service.async_extract_entity_ids(
+            hass, call
+        )
+
+    assert cache.get((None, None, "own-area", True)) is None
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
@@ -400,6 +503,30 @@ async def test_call_with_required_features(hass, mock_entities):
     assert all(entity in actual for entity in expected)
 
 
+def test_referenced_platform_entities_order(mock_entities):
+    """Test targeted entities come in the same order when looked up or scanned."""
+    platform = Mock(entities=mock_entities)
+
+    # Fewer targets than entities, the targets are looked up
+    assert service._referenced_platform_entities(
+        platform, {"light.living_room", "light.bathroom", "light.kitchen"}
+    ) == [
+        mock_entities["light.bathroom"],
+        mock_entities["light.kitchen"],
+        mock_entities["light.living_room"],
+    ]
+
+    # As many targets as entities, the entities are scanned
+    assert service._referenced_platform_entities(
+        platform,
+        {"light.living_room", "light.bathroom", "light.kitchen", "light.unknown"},
+    ) == [
+        mock_entities["light.bathroom"],
+        mock_entities["light.kitchen"],
+        mock_entities["light.living_room"],
+    ]
+
+
 async def test_call_with_both_required_features(hass, mock_entities):
     """Test service calls invoked only if entity has both features."""
     test_service_mock = AsyncMock(return_value=None)
@@ -600,6 +727,30 @@ async def test_call_no_context_target_specific(
     assert mock_handle_entity_call.mock_calls[0][1][1].entity_id == "light.kitchen"
 
 
+async def test_call_target_specific_multiple_platforms(
+    hass, mock_handle_entity_call, mock_entities
+):
+    """Check we find targeted entities on small and large platforms."""
+    other = MockEntity(entity_id="light.other", available=True, should_poll=False)
+
+    await service.entity_service_call(
+        hass,
+        [Mock(entities=mock_entities), Mock(entities={other.entity_id: other})],
+        Mock(),
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.bedroom", "light.other"]},
+        ),
+    )
+
+    assert len(mock_handle_entity_call.mock_calls) == 2
+    assert {call[1][1].entity_id for call in mock_handle_entity_call.mock_calls} == {
+        "light.bedroom",
+        "light.other",
+    }
+
+
 async def test_call_with_match_all(
     hass, mock_handle_entity_call, mock_entities, caplog
 ):
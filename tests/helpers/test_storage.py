@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -21,6 +22,10 @@ MOCK_KEY = "storage-test"
 MOCK_DATA = {"hello": "world"}
 MOCK_DATA2 = {"goodbye": "cruel world"}
 
+# The hass fixture mocks these to keep data in memory
+ORIG_ASYNC_LOAD = storage.Store._async_load
+ORIG_WRITE_DATA = storage.Store._write_data
+
 
 @pytest.fixture
 def store(hass):
@@ -279,3 +284,143 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+async def test_journal(hass, tmp_path):
+    """Test journaled stores append changes and compact them."""
+    hass.config.config_dir = str(tmp_path)
+    journal = {"items": "id"}
+
+    with patch.object(storage.Store, "_async_load", ORIG_ASYNC_LOAD), patch.object(
+        storage.Store, "_write_data", ORIG_WRITE_DATA
+    ), patch.object(storage, "JOURNAL_MIN_COMPACT_CHANGES", 3):
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        await store.async_save({"items": [{"id": "a", "v": 1}, {"id": "b", "v": 1}]})
+        assert not os.path.exists(store.journal_path)
+
+        await store.async_save({"items": [{"id": "a", "v": 2}, {"id": "b", "v": 1}]})
+        await store.async_save({"items": [{"id": "a", "v": 2}, {"id": "c", "v": 1}]})
+        with open(store.journal_path) as fdesc:
+            assert len(fdesc.readlines()) == 2
+        with open(store.path) as fdesc:
+            assert json.load(fdesc)["data"]["items"][0] == {"id": "a", "v": 1}
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "v": 2}, {"id": "c", "v": 1}]
+        }
+
+        # Unchanged data is not written at all
+        await store.async_save({"items": [{"id": "a", "v": 2}, {"id": "c", "v": 1}]})
+        with open(store.journal_path) as fdesc:
+            assert len(fdesc.readlines()) == 2
+
+        # Exceeding the changes kept in the journal compacts it
+        await store.async_save({"items": [{"id": "a", "v": 3}, {"id": "c", "v": 2}]})
+        assert not os.path.exists(store.journal_path)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "v": 3}, {"id": "c", "v": 2}]
+        }
+
+
+async def test_journal_track_changes(hass, tmp_path):
+    """Test stores tracking changes only serialize the marked and new items."""
+    hass.config.config_dir = str(tmp_path)
+    journal = {"items": "id"}
+
+    with patch.object(storage.Store, "_async_load", ORIG_ASYNC_LOAD), patch.object(
+        storage.Store, "_write_data", ORIG_WRITE_DATA
+    ):
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=journal, track_changes=True
+        )
+        await store.async_save({"items": [{"id": "a", "v": 1}, {"id": "b", "v": 1}]})
+
+        store.async_mark_changed("items", "a")
+        with patch.object(
+            store, "_dump_item", wraps=store._dump_item
+        ) as mock_dump_item:
+            await store.async_save(
+                {
+                    "items": [
+                        {"id": "a", "v": 2},
+                        {"id": "b", "v": 1},
+                        {"id": "c", "v": 1},
+                    ]
+                }
+            )
+        dumped = [call[1][0] for call in mock_dump_item.mock_calls]
+        assert {"id": "b", "v": 1} not in dumped
+        with open(store.journal_path) as fdesc:
+            assert [
+                change[1]
+                for line in fdesc.readlines()
+                for change in json.loads(line)["changes"]
+            ] == ["a", "c"]
+
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=journal, track_changes=True
+        )
+        assert await store.async_load() == {
+            "items": [{"id": "a", "v": 2}, {"id": "b", "v": 1}, {"id": "c", "v": 1}]
+        }
+
+
+async def test_journal_interrupted_write(hass, tmp_path, caplog):
+    """Test an incomplete journal entry is ignored."""
+    hass.config.config_dir = str(tmp_path)
+    journal = {"items": "id"}
+
+    with patch.object(storage.Store, "_async_load", ORIG_ASYNC_LOAD), patch.object(
+        storage.Store, "_write_data", ORIG_WRITE_DATA
+    ):
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        await store.async_save({"items": [{"id": "a", "v": 1}]})
+        await store.async_save({"items": [{"id": "a", "v": 2}]})
+
+        with open(store.journal_path, "a") as fdesc:
+            fdesc.write('{"version":1,"changes":[["items","a",{"id"')
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        assert await store.async_load() == {"items": [{"id": "a", "v": 2}]}
+        assert "Ignoring incomplete journal entry" in caplog.text
+
+        # The incomplete entry is cut off so later entries are not lost
+        await store.async_save({"items": [{"id": "a", "v": 3}]})
+        with open(store.journal_path) as fdesc:
+            assert len(fdesc.readlines()) == 2
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        assert await store.async_load() == {"items": [{"id": "a", "v": 3}]}
+
+
+async def test_journal_interrupted_compaction(hass, tmp_path):
+    """Test a journal left over from an interrupted compaction is ignored."""
+    hass.config.config_dir = str(tmp_path)
+    journal = {"items": "id"}
+
+    with patch.object(storage.Store, "_async_load", ORIG_ASYNC_LOAD), patch.object(
+        storage.Store, "_write_data", ORIG_WRITE_DATA
+    ), patch.object(storage, "JOURNAL_MIN_COMPACT_CHANGES", 1):
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        await store.async_save({"items": [{"id": "a", "v": 1}]})
+        await store.async_save({"items": [{"id": "a", "v": 2}]})
+        with open(store.journal_path) as fdesc:
+            stale_journal = fdesc.read()
+
+        # Compaction crashes after writing the main file
+        with patch.object(storage.os, "unlink", side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                await store.async_save(
+                    {"items": [{"id": "a", "v": 3}, {"id": "b", "v": 1}]}
+                )
+        assert os.path.exists(store.journal_path)
+        with open(store.journal_path) as fdesc:
+            assert fdesc.read() == stale_journal
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=journal)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "v": 3}, {"id": "b", "v": 1}]
+        }
@@ -2,6 +2,7 @@
 from datetime import datetime
 import math
 import random
+import time
 from unittest.mock import patch
 
 import pytest
@@ -18,12 +19,15 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     VOLUME_LITERS,
 )
+from homeassistant.core import CoreState
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import UnitSystem
 
+from tests.common import flush_store
+
 
 def _set_up_units(hass):
     """Set up the tests."""
@@ -2223,6 +2227,63 @@ async def test_template_timeout(hass):
     tmp5 = template.Template(slow_template_str, hass)
     assert await tmp5.async_render_will_timeout(0.000001) is True
 
+    reused_range_template_str = """
+{% set outer = range(1000) %}
+{% for var in outer -%}
+  {% for var in outer -%}
+  {%- endfor %}
+{%- endfor %}
+"""
+    tmp6 = template.Template(reused_range_template_str, hass)
+    assert await tmp6.async_render_will_timeout(0.000001) is True
+    assert await tmp6.async_render_will_timeout(30) is False
+
+    def slow_function():
+        time.sleep(0.2)
+
+    # A single slow operation is not interrupted but still reported
+    tmp7 = template.Template("{{ slow_function() }}", hass)
+    assert await tmp7.async_render_will_timeout(0.05, {"slow_function": slow_function})
+
+
+async def test_bounded_environment_renders_like_default(hass):
+    """Test templates render the same in the bounded environment."""
+    hass.states.async_set("sensor.temperature", "12")
+    env = template.BoundedTemplateEnvironment(hass)
+
+    for template_str, expected in (
+        ("{{ range(3) | list }}", "[0, 1, 2]"),
+        ("{{ range(10)[2:4] | list }}", "[2, 3]"),
+        ("{{ range(3) | reverse | list }}", "[2, 1, 0]"),
+        ("{{ 2 in range(3) }} {{ range(3) | length }}", "True 3"),
+        ("{{ states('sensor.temperature') | float * 2 }}", "24.0"),
+        ("{{ states.sensor.temperature.state }}", "12"),
+    ):
+        compiled = env.template_from_code(env.compile(template_str))
+        assert env.async_render_with_deadline(compiled, {}, 30) == expected
+        assert (
+            template.Template(template_str, hass).async_render(parse_result=False)
+            == expected
+        )
+
+
+async def test_state_iteration_reuses_wrappers(hass):
+    """Test TemplateState wrappers are reused until their state changes."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+
+    first = list(template.AllStates(hass))
+    second = list(template.DomainStates(hass, "sensor"))
+    assert [state.entity_id for state in first] == ["sensor.one", "sensor.two"]
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+
+    hass.states.async_set("sensor.two", "3")
+    third = list(template.DomainStates(hass, "sensor"))
+    assert third[0] is first[0]
+    assert third[1] is not first[1]
+    assert third[1].state == "3"
+
 
 async def test_lights(hass):
     """Test we can sort lights."""
@@ -2434,3 +2495,61 @@ async def test_parse_result(hass):
         ("0011101.00100001010001", "0011101.00100001010001"),
     ):
         assert template.Template(tpl, hass).async_render() == result
+
+
+async def test_bytecode_cache_stores_compiled_templates(hass, hass_storage):
+    """Test compiled templates are stored in the bytecode cache."""
+    await template.async_load_bytecode_cache(hass)
+
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    cache = hass.data[template._BYTECODE_CACHE]
+    await hass.async_block_till_done()
+    await flush_store(cache._store)
+
+    stored = hass_storage[template.BYTECODE_STORAGE_KEY]
+    assert stored["version"] == template.BYTECODE_STORAGE_VERSION
+    assert stored["data"]["fingerprint"] == cache._fingerprint
+    assert len(stored["data"]["templates"]) == 1
+
+
+async def test_bytecode_cache_loads_compiled_templates(hass, hass_storage):
+    """Test templates use the code stored by a previous run."""
+    await template.async_load_bytecode_cache(hass)
+    template.Template("{{ 2 * 21 }}", hass).ensure_valid()
+    template.Template("{{ 'unused' }}", hass).ensure_valid()
+    await hass.async_block_till_done()
+    await flush_store(hass.data[template._BYTECODE_CACHE]._store)
+
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+
+    with patch(
+        "jinja2.sandbox.ImmutableSandboxedEnvironment.compile",
+        side_effect=AssertionError("compiled"),
+    ):
+        hass.state = CoreState.starting
+        assert template.Template("{{ 2 * 21 }}", hass).async_render() == 42
+
+    # Entries not used yet are kept until startup has finished
+    await hass.async_block_till_done()
+    await flush_store(hass.data[template._BYTECODE_CACHE]._store)
+    assert len(hass_storage[template.BYTECODE_STORAGE_KEY]["data"]["templates"]) == 2
+
+    hass.state = CoreState.running
+    hass.data[template._BYTECODE_CACHE]._async_schedule_save()
+    await flush_store(hass.data[template._BYTECODE_CACHE]._store)
+    assert len(hass_storage[template.BYTECODE_STORAGE_KEY]["data"]["templates"]) == 1
+
+
+async def test_bytecode_cache_ignores_other_versions(hass, hass_storage):
+    """Test stored code of another version is not used."""
+    hass_storage[template.BYTECODE_STORAGE_KEY] = {
+        "version": template.BYTECODE_STORAGE_VERSION,
+        "key": template.BYTECODE_STORAGE_KEY,
+        "data": {"fingerprint": "old", "templates": {"abc": "invalid"}},
+    }
+    await template.async_load_bytecode_cache(hass)
+
+    assert template.Template("{{ 2 * 21 }}", hass).async_render() == 42
+    assert hass.data[template._BYTECODE_CACHE]._stored == {}
@@ -30,6 +30,11 @@ async def apply_stop_hass(stop_hass):
     """Make sure all hass are stopped."""
 
 
+@pytest.fixture(autouse=True)
+def apply_mock_storage(hass_storage):
+    """Keep the stores written while checking in memory."""
+
+
 def normalize_yaml_files(check_dict):
     """Remove configuration path from ['yaml_files']."""
     root = get_test_config_dir()
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, runner, setup
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -43,6 +43,15 @@ def mock_http_start_stop():
         yield
 
 
+@pytest.fixture(autouse=True)
+def mock_yaml_parse_cache():
+    """Mock loading and saving the YAML parse cache."""
+    with patch("homeassistant.config.async_load_yaml_parse_cache"), patch(
+        "homeassistant.config.async_save_yaml_parse_cache"
+    ):
+        yield
+
+
 @patch("homeassistant.bootstrap.async_enable_logging", Mock())
 async def test_home_assistant_core_config_validation(hass):
     """Test if we pass in wrong information for HA conf."""
@@ -144,6 +153,24 @@ async def test_setup_after_deps_all_present(hass):
     assert order == ["logger", "root", "first_dep", "second_dep"]
 
 
+async def test_setup_timeline_saved(hass, hass_storage):
+    """Test the setup timeline is saved after setting up integrations."""
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(
+        hass,
+        MockModule(
+            domain="first_dep", partial_manifest={"after_dependencies": ["root"]}
+        ),
+    )
+
+    await bootstrap._async_set_up_integrations(hass, {"root": {}, "first_dep": {}})
+
+    data = hass_storage[bootstrap.SETUP_TIMELINE_STORAGE_KEY]["data"]
+    assert data["integrations"]["root"]["steps"][0]["step"] == "resolve"
+    assert data["integrations"]["first_dep"]["waited_on"] == ["root"]
+    assert data["critical_path"] == ["root", "first_dep"]
+
+
 async def test_setup_after_deps_in_stage_1_ignored(hass):
     """Test after_dependencies are ignored in stage 1."""
     # This test relies on this
@@ -190,6 +217,51 @@ async def test_setup_after_deps_in_stage_1_ignored(hass):
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+async def test_setup_not_blocked_by_slow_stage_1(hass):
+    """Test a slow stage 1 integration does not block unrelated integrations."""
+    normal_done = asyncio.Event()
+
+    async def async_setup_cloud(hass, config):
+        await normal_done.wait()
+        return True
+
+    async def async_setup_normal(hass, config):
+        normal_done.set()
+        return True
+
+    mock_integration(hass, MockModule(domain="cloud", async_setup=async_setup_cloud))
+    mock_integration(
+        hass, MockModule(domain="normal_integration", async_setup=async_setup_normal)
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "normal_integration": {}}
+    )
+
+    assert "cloud" in hass.config.components
+    assert "normal_integration" in hass.config.components
+    parallelism = setup.async_get_setup_timeline(hass).parallelism
+    assert parallelism["integrations"] == 2
+    assert parallelism["max_concurrent"] == 2
+
+
+async def test_setup_circular_after_deps(hass):
+    """Test integrations with circular after dependencies are set up."""
+    mock_integration(
+        hass,
+        MockModule(domain="first", partial_manifest={"after_dependencies": ["second"]}),
+    )
+    mock_integration(
+        hass,
+        MockModule(domain="second", partial_manifest={"after_dependencies": ["first"]}),
+    )
+
+    await bootstrap._async_set_up_integrations(hass, {"first": {}, "second": {}})
+
+    assert "first" in hass.config.components
+    assert "second" in hass.config.components
+
+
 async def test_setup_after_deps_via_platform(hass):
     """Test after_dependencies set up via platform."""
     order = []
@@ -568,6 +568,78 @@ async def test_forward_entry_sets_up_component(hass):
     assert len(mock_forwarded_setup_entry.mock_calls) == 1
 
 
+async def test_forward_lazy_entry_setup(hass):
+    """Test lazy platforms are only set up once they have entities."""
+    entry = MockConfigEntry(domain="original")
+    entry.add_to_hass(hass)
+    registry = mock_registry(hass)
+    registry.async_get_or_create(
+        "with_entities", "original", "1234", config_entry=entry
+    )
+
+    mock_integration(hass, MockModule("original"))
+    mock_setup_entries = {}
+    for domain in ("with_entities", "without_entities"):
+        mock_setup_entries[domain] = AsyncMock(return_value=True)
+        mock_integration(
+            hass,
+            MockModule(
+                domain,
+                async_setup_entry=mock_setup_entries[domain],
+                async_unload_entry=AsyncMock(return_value=True),
+            ),
+        )
+
+    for domain in ("with_entities", "without_entities"):
+        assert await hass.config_entries.async_forward_entry_setup(
+            entry, domain, lazy=True
+        )
+    assert len(mock_setup_entries["with_entities"].mock_calls) == 1
+    assert len(mock_setup_entries["without_entities"].mock_calls) == 0
+    assert hass.config_entries.async_lazy_platforms(entry) == {"without_entities"}
+
+    # Unloading a platform that was never set up does nothing
+    assert await hass.config_entries.async_forward_entry_unload(
+        entry, "without_entities"
+    )
+    assert hass.config_entries.async_lazy_platforms(entry) == set()
+
+    assert await hass.config_entries.async_forward_entry_setup(
+        entry, "without_entities", lazy=True
+    )
+    await asyncio.gather(
+        hass.config_entries.async_forward_lazy_entry_setup(entry, "without_entities"),
+        hass.config_entries.async_forward_lazy_entry_setup(entry, "without_entities"),
+        hass.config_entries.async_forward_lazy_entry_setup(entry, "with_entities"),
+    )
+    assert len(mock_setup_entries["with_entities"].mock_calls) == 1
+    assert len(mock_setup_entries["without_entities"].mock_calls) == 1
+    assert hass.config_entries.async_lazy_platforms(entry) == set()
+
+
+async def test_lazy_platforms_forgotten_on_unload_and_remove(hass):
+    """Test lazy platforms are forgotten when their entry goes away."""
+    mock_integration(
+        hass,
+        MockModule("original", async_unload_entry=AsyncMock(return_value=True)),
+    )
+    mock_integration(hass, MockModule("lazy"))
+    mock_registry(hass)
+    entry = MockConfigEntry(domain="original", state=config_entries.ENTRY_STATE_LOADED)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_forward_entry_setup(entry, "lazy", lazy=True)
+    assert hass.config_entries.async_lazy_platforms(entry) == {"lazy"}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert hass.config_entries.async_lazy_platforms(entry) == set()
+    assert entry.entry_id not in hass.config_entries._lazy_platforms
+
+    assert await hass.config_entries.async_forward_entry_setup(entry, "lazy", lazy=True)
+    await hass.config_entries.async_remove(entry.entry_id)
+    assert entry.entry_id not in hass.config_entries._lazy_platforms
+
+
 async def test_forward_entry_does_not_setup_entry_if_setup_fails(hass):
     """Test we do not set up entry if component setup fails."""
     entry = MockConfigEntry(domain="original")
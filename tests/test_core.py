@@ -1462,6 +1462,46 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_async_all_sorted(hass):
+    """Test async_all_sorted keeps the domain index up to date."""
+
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("light.bowl", "on")
+
+    assert [state.entity_id for state in hass.states.async_all_sorted()] == [
+        "light.bowl",
+        "light.frog",
+        "switch.link",
+    ]
+    assert [state.entity_id for state in hass.states.async_all_sorted("light")] == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_all_sorted("vacuum") == []
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_remove("switch.link")
+
+    assert [state.entity_id for state in hass.states.async_all_sorted()] == [
+        "light.bowl",
+        "light.cow",
+        "light.frog",
+    ]
+    assert [
+        (state.entity_id, state.state)
+        for state in hass.states.async_all_sorted("LIGHT")
+    ] == [("light.bowl", "off"), ("light.cow", "on"), ("light.frog", "on")]
+    assert hass.states.async_all("switch") == []
+    assert hass.states.async_entity_ids("light") == [
+        "light.frog",
+        "light.bowl",
+        "light.cow",
+    ]
+    assert hass.states.async_entity_ids_count("switch") == 0
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import json
+import pathlib
 from unittest.mock import ANY, patch
 
 import pytest
@@ -144,6 +146,49 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+    assert integration.manifest == {
+        **json.loads((integration.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+    }
+
+
+async def test_get_integration_index_other_version(hass):
+    """Test a manifest index of another version is not used."""
+    with patch.object(loader, "MANIFESTS_INDEX_VERSION", 0), patch.object(
+        loader.Integration,
+        "resolve_from_root",
+        wraps=loader.Integration.resolve_from_root,
+    ) as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+
+
+async def test_import_times(hass):
+    """Test the time it takes to import integration modules is recorded."""
+    integration = _get_test_integration(hass, "not_imported", False)
+
+    with patch("importlib.import_module") as mock_import:
+        assert integration.get_component() is mock_import.return_value
+        assert integration.get_platform("light") is mock_import.return_value
+        integration.get_platform("light")
+
+    assert mock_import.call_count == 2
+    assert set(hass.data[loader.DATA_IMPORT_TIMES]) == {
+        "homeassistant.components.not_imported",
+        "homeassistant.components.not_imported.light",
+    }
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -256,6 +301,53 @@ async def test_get_custom_components_internal(hass):
     assert integrations == {"test": ANY, "test_package": ANY}
 
 
+async def test_get_custom_components_index(hass, hass_storage):
+    """Test the custom components index only reads changed manifests."""
+    # pylint: disable=protected-access
+    await loader._async_get_custom_components(hass)
+
+    index = hass_storage[loader.CUSTOM_COMPONENTS_STORAGE_KEY]["data"]
+    key = next(key for key in index if key.endswith("/test/manifest.json"))
+    assert index[key]["manifest"]["domain"] == "test"
+
+    index[key]["manifest"]["name"] = "Cached Name"
+    integrations = await loader._async_get_custom_components(hass)
+    assert integrations["test"].name == "Cached Name"
+
+    index[key]["mtime"] -= 1
+    integrations = await loader._async_get_custom_components(hass)
+    assert integrations["test"].name == "Test Components"
+    assert (
+        hass_storage[loader.CUSTOM_COMPONENTS_STORAGE_KEY]["data"][key]["manifest"][
+            "name"
+        ]
+        == "Test Components"
+    )
+
+
+async def test_get_custom_components_first_path_wins(hass, hass_storage, tmp_path):
+    """Test the first custom components path providing a domain is used."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    import custom_components
+
+    for name in ("first", "second"):
+        comp_path = tmp_path / name / "test"
+        comp_path.mkdir(parents=True)
+        (comp_path / "manifest.json").write_text(
+            json.dumps({"domain": "test", "name": name})
+        )
+
+    with patch.object(
+        custom_components,
+        "__path__",
+        [str(tmp_path / "first"), str(tmp_path / "second")],
+    ):
+        integrations = await loader._async_get_custom_components(hass)
+
+    assert integrations["test"].name == "first"
+    assert integrations["test"].file_path == tmp_path / "first" / "test"
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
@@ -3,12 +3,12 @@
 import asyncio
 import os
 import threading
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import voluptuous as vol
 
-from homeassistant import config_entries, setup
+from homeassistant import config_entries, loader, setup
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
 from homeassistant.core import callback
@@ -596,3 +596,64 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_timeline(hass):
+    """Test the steps of setting up integrations are recorded."""
+    MockConfigEntry(domain="comp_b").add_to_hass(hass)
+    mock_integration(hass, MockModule("comp_a"))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp_b",
+            dependencies=["comp_a"],
+            async_setup_entry=AsyncMock(return_value=True),
+        ),
+    )
+    mock_integration(hass, MockModule("comp_c"))
+    mock_entity_platform(hass, "config_flow.comp_b", None)
+
+    assert await setup.async_setup_component(hass, "comp_c", {})
+    assert await setup.async_setup_component(hass, "comp_b", {})
+
+    timeline = setup.async_get_setup_timeline(hass)
+    data = timeline.as_dict()
+
+    assert [step["step"] for step in data["integrations"]["comp_a"]["steps"]] == [
+        "import",
+        "config",
+        "setup",
+    ]
+    assert [step["step"] for step in data["integrations"]["comp_b"]["steps"]] == [
+        "dependencies",
+        "import",
+        "config",
+        "setup",
+        "setup_entry",
+    ]
+    assert data["integrations"]["comp_b"]["waited_on"] == ["comp_a"]
+    assert data["critical_path"] == ["comp_a", "comp_b"]
+    assert "comp_a;comp_b;setup_entry" in [
+        line.rsplit(" ", 1)[0] for line in data["flame"]
+    ]
+
+
+async def test_setup_timeline_imports(hass):
+    """Test the import times of integration modules are part of the timeline."""
+    hass.data[loader.DATA_IMPORT_TIMES] = {
+        "homeassistant.components.comp_a": 0.5,
+        "homeassistant.components.comp_a.light": 0.25,
+        "custom_components.comp_b.sensor": 0.125,
+    }
+    mock_integration(hass, MockModule("comp_a"))
+    assert await setup.async_setup_component(hass, "comp_a", {})
+
+    data = setup.async_get_setup_timeline(hass).as_dict()
+
+    assert list(data["imports"]) == [
+        "homeassistant.components.comp_a",
+        "homeassistant.components.comp_a.light",
+        "custom_components.comp_b.sensor",
+    ]
+    assert "comp_a;import light 250" in data["flame"]
+    assert "comp_b;import sensor 125" in data["flame"]
@@ -67,6 +67,15 @@ def test_save_and_load_private():
     assert stats.st_mode & 0o77 == 0
 
 
+def test_save_and_load_compact():
+    """Test saving compact JSON and loading it back."""
+    fname = _path_for("test_compact")
+    save_json(fname, {"a": [1, 2], "B": {"c": "three"}}, compact=True)
+    with open(fname, encoding="utf-8") as fdesc:
+        assert fdesc.read() == '{"a":[1,2],"B":{"c":"three"}}'
+    assert load_json(fname) == {"a": [1, 2], "B": {"c": "three"}}
+
+
 def test_overwrite_and_reload():
     """Test that we can overwrite an existing file and read back."""
     fname = _path_for("test3")
@@ -1,5 +1,7 @@
 """Test Home Assistant yaml loader."""
+import datetime
 import io
+import json
 import logging
 import os
 import unittest
@@ -478,3 +480,96 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    """Test parsed files are cached until they or their dependencies change."""
+    yaml_loader.clear_parse_cache()
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text(
+        "included: !include included.yaml\n"
+        "password: !secret password\n"
+        "env: !env_var PARSE_CACHE_TEST\n"
+        "dir: !include_dir_list dir\n"
+    )
+    (tmp_path / "included.yaml").write_text("value: 1")
+    (tmp_path / "secrets.yaml").write_text("password: secret")
+    (tmp_path / "dir").mkdir()
+    monkeypatch.setenv("PARSE_CACHE_TEST", "first")
+
+    def load():
+        return yaml_loader.load_yaml(str(config_path))
+
+    expected = {
+        "included": {"value": 1},
+        "password": "secret",
+        "env": "first",
+        "dir": [],
+    }
+    result = load()
+    assert result == expected
+
+    result["included"]["value"] = 2
+    with patch.object(yaml_loader, "parse_yaml") as mock_parse:
+        assert load() == expected
+    assert not mock_parse.called
+
+    (tmp_path / "included.yaml").write_text("value: 10")
+    assert load()["included"] == {"value": 10}
+
+    (tmp_path / "secrets.yaml").write_text("password: changed")
+    yaml_loader.clear_secret_cache()
+    assert load()["password"] == "changed"
+
+    monkeypatch.setenv("PARSE_CACHE_TEST", "second")
+    assert load()["env"] == "second"
+
+    (tmp_path / "dir" / "item.yaml").write_text("item")
+    assert load()["dir"] == ["item"]
+
+    yaml_loader.clear_parse_cache()
+
+
+def test_parse_cache_persisted(tmp_path):
+    """Test the parse cache can be dumped and restored as JSON."""
+    yaml_loader.clear_parse_cache()
+    yaml_loader.clear_secret_cache()
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text("key: value\nlist:\n  - 1\nsecret: !include secret.yaml\n")
+    (tmp_path / "secret.yaml").write_text("password: !secret password")
+    (tmp_path / "secrets.yaml").write_text("password: hunter2")
+    included_path = tmp_path / "included.yaml"
+    included_path.write_text("nested:\n  day: 2020-01-01\n")
+
+    yaml_loader.load_yaml(str(config_path))
+    yaml_loader.load_yaml(str(included_path))
+    dumped = json.loads(json.dumps(yaml_loader.dump_parse_cache()))
+    assert yaml_loader.dump_parse_cache() is None
+
+    # Files using secrets are kept in memory only
+    assert "hunter2" not in json.dumps(dumped)
+    assert set(dumped["files"]) == {str(included_path)}
+
+    yaml_loader.clear_parse_cache()
+    yaml_loader.restore_parse_cache(dumped)
+    with patch.object(yaml_loader, "parse_yaml") as mock_parse:
+        result = yaml_loader.load_yaml(str(included_path))
+    assert not mock_parse.called
+    assert result == {"nested": {"day": datetime.date(2020, 1, 1)}}
+    assert result["nested"].__config_file__ == str(included_path)
+    assert result["nested"].__line__ == 1
+
+    # Invalid entries are ignored
+    yaml_loader.clear_parse_cache()
+    dumped["files"][str(included_path)][0] = [["unknown"]]
+    yaml_loader.restore_parse_cache(dumped)
+    yaml_loader.restore_parse_cache({"version": "invalid"})
+    yaml_loader.restore_parse_cache(None)
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as mock_parse:
+        assert yaml_loader.load_yaml(str(included_path)) == result
+    assert mock_parse.called
+
+    yaml_loader.clear_parse_cache()
+    yaml_loader.clear_secret_cache()